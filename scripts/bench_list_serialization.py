@@ -0,0 +1,110 @@
+"""
+Микробенчмарк сериализации списков: прежний путь (model_validate на каждый
+ORM-объект, затем повторная валидация по response_model и JSONResponse)
+против orm_list_response (один проход TypeAdapter и orjson).
+
+Объекты — несохранённые ORM-экземпляры Device с вложенными типом, типом
+детали и локацией, как их отдаёт DeviceDAO.find_all. База не нужна.
+
+Запуск из корня репозитория:
+    python -m scripts.bench_list_serialization [--rows 1000] [--repeat 50]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+import src.main  # noqa: F401  регистрирует все модели для relationship()
+from src.device_types.models import DeviceType
+from src.devices.models import Device
+from src.devices.schemas import SDeviceRead
+from src.locations.models import Location
+from src.part_types.models import PartType
+from src.schemas.responses import orm_list_response
+
+
+def make_devices(rows: int) -> List[Device]:
+    part_types = [PartType(id=i, name=f"Деталь {i}", created_by=1) for i in range(1, 6)]
+    device_types = [
+        DeviceType(
+            id=i,
+            manufacturer="Dell",
+            model=f"PowerEdge R{600 + i}",
+            expected_lifetime_months=60,
+            part_type_id=part_types[i % 5].id,
+            part_types=part_types[i % 5],
+            created_by=1,
+        )
+        for i in range(1, 21)
+    ]
+    locations = [Location(id=i, name=f"Стойка {i}", created_by=1) for i in range(1, 51)]
+    start = date(2020, 1, 1)
+    return [
+        Device(
+            id=i,
+            serial_number=f"SN-{i:08d}",
+            type_id=device_types[i % 20].id,
+            type=device_types[i % 20],
+            purchase_date=start + timedelta(days=i % 1500),
+            warranty_end=start + timedelta(days=i % 1500 + 1095),
+            current_location_id=locations[i % 50].id,
+            current_location=locations[i % 50],
+            status="active",
+            created_by=1,
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+def measure(render: Callable[[], bytes], repeat: int) -> List[float]:
+    render()  # прогрев: кеш TypeAdapter, ленивые схемы pydantic
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, timings: List[float]) -> None:
+    print(
+        f"{name:<22} median {statistics.median(timings):7.2f} ms   "
+        f"min {min(timings):7.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    devices = make_devices(args.rows)
+    field = create_model_field(name="Response_list_devices", type_=List[SDeviceRead])
+    loop = asyncio.new_event_loop()
+
+    def legacy() -> bytes:
+        items = [SDeviceRead.model_validate(d) for d in devices]
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=items)
+        )
+        return JSONResponse(content).body
+
+    def adapter() -> bytes:
+        return orm_list_response(SDeviceRead, devices).body
+
+    assert legacy() == adapter(), "пути дают разный JSON"
+    print(f"{args.rows} x SDeviceRead, {args.repeat} повторов, ответ {len(adapter())} байт")
+    report("model_validate + JSON", measure(legacy, args.repeat))
+    report("TypeAdapter + orjson", measure(adapter, args.repeat))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
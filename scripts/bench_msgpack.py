@@ -0,0 +1,84 @@
+"""
+Сравнение JSON и MessagePack для списочных ответов: размер тела, время
+кодирования на сервере (orm_list_response с выбранным форматом) и время
+разбора на клиенте.
+
+Данные — те же несохранённые Device, что в bench_list_serialization.
+
+Запуск из корня репозитория:
+    python -m scripts.bench_msgpack [--rows 1000] [--repeat 50]
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, List
+
+import msgpack
+import orjson
+
+from scripts.bench_list_serialization import make_devices
+from src.devices.schemas import SDeviceRead
+from src.schemas.responses import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    orm_list_response,
+    response_media_type,
+)
+
+
+def median_ms(func: Callable[[], Any], repeat: int) -> float:
+    func()  # прогрев
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    devices = make_devices(args.rows)
+
+    def render(media_type: str) -> Callable[[], bytes]:
+        def run() -> bytes:
+            token = response_media_type.set(media_type)
+            try:
+                return orm_list_response(SDeviceRead, devices).body
+            finally:
+                response_media_type.reset(token)
+        return run
+
+    json_body = render(JSON_MEDIA_TYPE)()
+    msgpack_body = render(MSGPACK_MEDIA_TYPE)()
+    assert msgpack.unpackb(msgpack_body) == orjson.loads(json_body), "форматы расходятся"
+
+    print(f"{args.rows} x SDeviceRead, {args.repeat} повторов (медиана)")
+    print(f"{'':<10}{'байт':>10}{'сервер, мс':>13}{'клиент, мс':>13}")
+    print(
+        f"{'json':<10}{len(json_body):>10}"
+        f"{median_ms(render(JSON_MEDIA_TYPE), args.repeat):>13.2f}"
+        f"{median_ms(lambda: json.loads(json_body), args.repeat):>13.2f}"
+        "  (json.loads)"
+    )
+    print(
+        f"{'':<10}{'':>10}{'':>13}"
+        f"{median_ms(lambda: orjson.loads(json_body), args.repeat):>13.2f}"
+        "  (orjson.loads)"
+    )
+    print(
+        f"{'msgpack':<10}{len(msgpack_body):>10}"
+        f"{median_ms(render(MSGPACK_MEDIA_TYPE), args.repeat):>13.2f}"
+        f"{median_ms(lambda: msgpack.unpackb(msgpack_body), args.repeat):>13.2f}"
+        "  (msgpack.unpackb)"
+    )
+    print(f"msgpack / json по размеру: {len(msgpack_body) / len(json_body):.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.types import Receive, Scope, Send
+
+from src.config import settings
+from src.exceptions import ServiceUnavailableException
+
+admission_in_flight_gauge = Gauge(
+    "admission_in_flight", "Requests currently admitted", ["group"]
+)
+admission_queue_depth_gauge = Gauge(
+    "admission_queue_depth", "Requests waiting for admission", ["group"]
+)
+admission_rejected_counter = Counter(
+    "admission_rejected_total",
+    "Requests rejected with 503 by admission control",
+    ["group", "reason"],
+)
+admission_wait_histogram = Histogram(
+    "admission_wait_seconds",
+    "Time spent waiting for admission",
+    ["group"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+
+class AdmissionLimiter:
+    """
+    Ограничитель одновременных тяжёлых запросов группы маршрутов в пределах воркера.
+
+    Не более concurrency запросов выполняются одновременно, ещё до queue_size
+    ждут своей очереди не дольше queue_timeout секунд. Остальные сразу получают
+    503 с Retry-After, не занимая соединений с БД.
+    """
+
+    def __init__(self, group: str, concurrency: int, queue_size: int, queue_timeout: float):
+        self.group = group
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = max(1, math.ceil(queue_timeout))
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._waiting = 0
+
+    @classmethod
+    def from_settings(cls, group: str) -> "AdmissionLimiter":
+        return cls(
+            group,
+            concurrency=getattr(settings, f"admission_{group}_concurrency"),
+            queue_size=getattr(settings, f"admission_{group}_queue"),
+            queue_timeout=getattr(settings, f"admission_{group}_queue_timeout"),
+        )
+
+    def _reject(self, reason: str) -> ServiceUnavailableException:
+        admission_rejected_counter.labels(group=self.group, reason=reason).inc()
+        return ServiceUnavailableException(retry_after=self.retry_after)
+
+    async def acquire(self) -> None:
+        """Занимает слот или выбрасывает ServiceUnavailableException."""
+        if self._semaphore.locked():
+            if self._waiting >= self.queue_size:
+                raise self._reject("queue_full")
+            self._waiting += 1
+            admission_queue_depth_gauge.labels(group=self.group).inc()
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                raise self._reject("timeout")
+            finally:
+                self._waiting -= 1
+                admission_queue_depth_gauge.labels(group=self.group).dec()
+                admission_wait_histogram.labels(group=self.group).observe(
+                    time.perf_counter() - started
+                )
+        else:
+            await self._semaphore.acquire()
+            admission_wait_histogram.labels(group=self.group).observe(0)
+        admission_in_flight_gauge.labels(group=self.group).inc()
+
+    def release(self) -> None:
+        admission_in_flight_gauge.labels(group=self.group).dec()
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def __call__(self) -> AsyncIterator[None]:
+        """
+        Зависимость маршрута: слот занят на время выполнения обработчика.
+
+        Подключается последним параметром обработчика, а не в dependencies=[...]:
+        их FastAPI выполняет раньше параметров, и слот занимали бы запросы,
+        которые затем отклонит аутентификация или завершит 304 по ETag.
+        """
+        async with self.admit():
+            yield
+
+    def for_large_pages(self, threshold: int) -> Callable[[Request], AsyncIterator[None]]:
+        """
+        Зависимость для списков: ограничивает только запросы с limit больше threshold,
+        обычные страницы проходят без очереди. Как и __call__, подключается
+        последним параметром обработчика.
+        """
+        async def dependency(request: Request) -> AsyncIterator[None]:
+            try:
+                limit = int(request.query_params.get("limit", 0))
+            except ValueError:
+                limit = 0
+            if limit <= threshold:
+                yield
+                return
+            async with self.admit():
+                yield
+
+        return dependency
+
+
+class AdmittedStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse, который держит слот ограничителя до конца отправки тела.
+    Зависимость освободила бы слот раньше: FastAPI закрывает её до начала стриминга.
+    Слот занимается в обработчике (чтобы успеть ответить 503), а освобождается здесь
+    при любом исходе, включая обрыв соединения.
+    """
+
+    def __init__(self, *args, limiter: AdmissionLimiter, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.limiter.release()
+
+
+analytics_limiter = AdmissionLimiter.from_settings("analytics")
+bulk_list_limiter = AdmissionLimiter.from_settings("bulk_list")
+export_limiter = AdmissionLimiter.from_settings("export")
+limit_large_pages = bulk_list_limiter.for_large_pages(settings.admission_bulk_list_threshold)
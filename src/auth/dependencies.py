@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Optional
 from fastapi import Depends, HTTPException, Request
@@ -8,6 +9,12 @@ from src.users.dao import UserDAO
 from src.exceptions import UnauthorizedException, ForbiddenException
 from src.users.models import User
 
+# Уже аутентифицированный пользователь (подзапросы POST /batch):
+# токен не проверяется повторно, пользователь не перечитывается из БД
+authenticated_user: ContextVar[Optional[User]] = ContextVar(
+    "authenticated_user", default=None
+)
+
 
 def get_token(request: Request) -> str:
     token = request.cookies.get("shelter_access_token")
@@ -17,6 +24,10 @@ def get_token(request: Request) -> str:
 
 
 async def get_current_user(token: str = Depends(get_token)) -> User:
+    user = authenticated_user.get()
+    if user is not None:
+        return user
+
     try:
         payload = jwt.decode(
             token,
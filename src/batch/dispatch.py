@@ -0,0 +1,142 @@
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, Dict
+from urllib.parse import unquote, urlsplit
+
+import orjson
+from fastapi.routing import APIRoute
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.responses import FileResponse, StreamingResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Scope
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Ключи scope, которые подзапрос наследует от POST /batch
+_INHERITED_SCOPE_KEYS = (
+    "type",
+    "asgi",
+    "http_version",
+    "scheme",
+    "server",
+    "client",
+    "root_path",
+    "app",
+    "state",
+)
+# Заголовки тела и условных запросов к подзапросам не относятся
+_DROPPED_HEADERS = frozenset(
+    {b"content-length", b"content-type", b"accept", b"if-none-match", b"if-modified-since"}
+)
+
+
+@lru_cache(maxsize=None)
+def _sub_app(app: ASGIApp) -> ASGIApp:
+    """
+    Маршрутизатор приложения под ExceptionMiddleware с обработчиками
+    исключений приложения: подзапрос получает те же ответы на ошибки
+    (422 валидации параметров, 404/405, HTTPException, ошибки БД), что и
+    обычный запрос, но без внешних HTTP-middleware.
+    """
+    return ExceptionMiddleware(app.router, handlers=app.exception_handlers)
+
+
+def _sub_scope(parent: Scope, target: str) -> Scope:
+    url = urlsplit(target)
+    path = parent.get("root_path", "") + unquote(url.path)
+    headers = [(name, value) for name, value in parent["headers"] if name not in _DROPPED_HEADERS]
+    headers.append((b"accept", b"application/json"))
+    scope = {key: parent[key] for key in _INHERITED_SCOPE_KEYS if key in parent}
+    scope.update(
+        method="GET",
+        path=path,
+        raw_path=path.encode(),
+        query_string=url.query.encode(),
+        headers=headers,
+    )
+    return scope
+
+
+def _streams(app: ASGIApp, scope: Scope) -> bool:
+    """
+    Маршрут отдаёт поток или файл (SSE, выгрузки, готовые отчёты): в пакете
+    такой ответ либо не завершится, либо целиком буферизуется в памяти.
+    """
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match is Match.FULL:
+            if not isinstance(route, APIRoute):
+                return False
+            response_class = getattr(route.response_class, "value", route.response_class)
+            return issubclass(response_class, (StreamingResponse, FileResponse))
+    return False
+
+
+async def dispatch_get(parent: Scope, target: str) -> Dict[str, Any]:
+    """
+    Выполняет GET-подзапрос внутри процесса: маршрутизатор приложения
+    с его обработчиками исключений вызывается напрямую, минуя сеть и
+    HTTP-middleware. Ошибки подзапроса возвращаются его статусом и телом,
+    остальные подзапросы не прерываются. Потоковые и файловые маршруты
+    не выполняются (406), подзапрос дольше batch_sub_request_timeout
+    прерывается (504).
+    """
+    app = parent["app"]
+    scope = _sub_scope(parent, target)
+    if _streams(app, scope):
+        return {
+            "path": target,
+            "status": 406,
+            "body": {"detail": "Streaming and file responses are not supported in a batch"},
+        }
+
+    status = 500
+    content_type = b""
+    body = bytearray()
+    request_sent = False
+    finished = asyncio.Event()
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # StreamingResponse ждёт отключения клиента: оно наступает, когда ответ получен
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status, content_type
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    try:
+        await asyncio.wait_for(
+            _sub_app(app)(scope, receive, send), settings.batch_sub_request_timeout
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Batch sub-request %s timed out", target)
+        return {"path": target, "status": 504, "body": {"detail": "Sub-request timed out"}}
+    except Exception:
+        # необработанные исключения в приложении обрабатывает ServerErrorMiddleware,
+        # в подзапросе это 500 только для него
+        logger.exception("Batch sub-request %s failed", target)
+        return {"path": target, "status": 500, "body": {"detail": "Internal Server Error"}}
+    finally:
+        finished.set()
+
+    if not body:
+        return {"path": target, "status": status, "body": None}
+    if not content_type.startswith(b"application/json"):
+        return {
+            "path": target,
+            "status": 406,
+            "body": {"detail": "Only JSON responses are supported in a batch"},
+        }
+    return {"path": target, "status": status, "body": orjson.loads(body)}
@@ -0,0 +1,61 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Request
+
+from src.auth.dependencies import authenticated_user, get_current_user
+from src.batch.dispatch import dispatch_get
+from src.batch.schemas import SBatchRequest, SBatchResponse
+from src.config import settings
+from src.database import share_read_session
+from src.exceptions import BadRequestException
+from src.schemas.responses import JSON_MEDIA_TYPE, NegotiatedResponse, response_media_type
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["Пакетные запросы"],
+)
+
+
+def _check_path(path: str) -> None:
+    if not path.startswith("/") or path.startswith("//"):
+        raise BadRequestException(f"Batch path must be relative to the API root: {path}")
+    if path.split("?", 1)[0].rstrip("/") == router.prefix:
+        raise BadRequestException("Nested batch requests are not allowed")
+
+
+@router.post(
+    "",
+    response_model=SBatchResponse,
+    summary="Несколько GET-запросов за один вызов",
+    description=(
+        "Подзапросы выполняются параллельно от имени текущего пользователя "
+        "(токен проверяется один раз) и читают данные через одну сессию БД; "
+        "маршруты аналитики (/stats, /analytics) читают через свой пул. "
+        "Ответы возвращаются в порядке запросов, каждый со своим статусом; "
+        "тела — только JSON, потоковые и файловые маршруты не выполняются (406), "
+        "подзапрос дольше batch_sub_request_timeout получает 504."
+    ),
+)
+async def run_batch(
+    payload: SBatchRequest, request: Request, current_user=Depends(get_current_user)
+) -> SBatchResponse:
+    if len(payload.requests) > settings.batch_max_requests:
+        raise BadRequestException(
+            f"Too many sub-requests: at most {settings.batch_max_requests} allowed"
+        )
+    for item in payload.requests:
+        _check_path(item.path)
+
+    # контекст копируется в задачи подзапросов при их создании
+    user_token = authenticated_user.set(current_user)
+    format_token = response_media_type.set(JSON_MEDIA_TYPE)
+    try:
+        async with share_read_session():
+            responses = await asyncio.gather(
+                *(dispatch_get(request.scope, item.path) for item in payload.requests)
+            )
+    finally:
+        response_media_type.reset(format_token)
+        authenticated_user.reset(user_token)
+
+    return NegotiatedResponse({"responses": responses})
@@ -0,0 +1,25 @@
+from typing import Any, List
+
+from pydantic import BaseModel, Field
+
+
+class SBatchSubRequest(BaseModel):
+    path: str = Field(
+        ...,
+        description="Относительный URL GET-запроса, например /device-types/3?fields=id,model",
+        examples=["/auth/me"],
+    )
+
+
+class SBatchRequest(BaseModel):
+    requests: List[SBatchSubRequest] = Field(..., min_length=1)
+
+
+class SBatchSubResponse(BaseModel):
+    path: str
+    status: int
+    body: Any = None
+
+
+class SBatchResponse(BaseModel):
+    responses: List[SBatchSubResponse]
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List
 from pydantic import SecretStr, Field, PostgresDsn, ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -14,6 +15,57 @@ class Settings(BaseSettings):
     db_user: str = Field(..., env="DB_USER")
     db_pass: SecretStr = Field(..., env="DB_PASS")
     db_name: str = Field(..., env="DB_NAME")
+    # Реплики только для чтения: "host[:port],host[:port]"; пусто — всё идёт в основную БД
+    db_replica_hosts: str = Field("", env="DB_REPLICA_HOSTS")
+    # Сколько секунд после собственной записи клиент читает из основной БД
+    db_read_your_writes_seconds: float = Field(5.0, env="DB_READ_YOUR_WRITES_SECONDS")
+
+    # Пулы соединений по классам нагрузки: размер, переполнение, ожидание соединения (с)
+    db_pool_interactive_size: int = Field(10, env="DB_POOL_INTERACTIVE_SIZE")
+    db_pool_interactive_overflow: int = Field(10, env="DB_POOL_INTERACTIVE_OVERFLOW")
+    db_pool_interactive_timeout: float = Field(5.0, env="DB_POOL_INTERACTIVE_TIMEOUT")
+    db_pool_analytics_size: int = Field(3, env="DB_POOL_ANALYTICS_SIZE")
+    db_pool_analytics_overflow: int = Field(2, env="DB_POOL_ANALYTICS_OVERFLOW")
+    db_pool_analytics_timeout: float = Field(30.0, env="DB_POOL_ANALYTICS_TIMEOUT")
+    db_pool_background_size: int = Field(2, env="DB_POOL_BACKGROUND_SIZE")
+    db_pool_background_overflow: int = Field(0, env="DB_POOL_BACKGROUND_OVERFLOW")
+    db_pool_background_timeout: float = Field(120.0, env="DB_POOL_BACKGROUND_TIMEOUT")
+
+    # statement_timeout по классам нагрузки, мс; 0 — без ограничения
+    db_statement_timeout_interactive: int = Field(10_000, env="DB_STATEMENT_TIMEOUT_INTERACTIVE")
+    db_statement_timeout_analytics: int = Field(60_000, env="DB_STATEMENT_TIMEOUT_ANALYTICS")
+    db_statement_timeout_background: int = Field(0, env="DB_STATEMENT_TIMEOUT_BACKGROUND")
+
+    # Допуск тяжёлых запросов на воркер: одновременно, в очереди, ожидание в очереди (с)
+    admission_analytics_concurrency: int = Field(2, env="ADMISSION_ANALYTICS_CONCURRENCY")
+    admission_analytics_queue: int = Field(8, env="ADMISSION_ANALYTICS_QUEUE")
+    admission_analytics_queue_timeout: float = Field(10.0, env="ADMISSION_ANALYTICS_QUEUE_TIMEOUT")
+    admission_bulk_list_concurrency: int = Field(4, env="ADMISSION_BULK_LIST_CONCURRENCY")
+    admission_bulk_list_queue: int = Field(16, env="ADMISSION_BULK_LIST_QUEUE")
+    admission_bulk_list_queue_timeout: float = Field(5.0, env="ADMISSION_BULK_LIST_QUEUE_TIMEOUT")
+    admission_export_concurrency: int = Field(2, env="ADMISSION_EXPORT_CONCURRENCY")
+    admission_export_queue: int = Field(2, env="ADMISSION_EXPORT_QUEUE")
+    admission_export_queue_timeout: float = Field(5.0, env="ADMISSION_EXPORT_QUEUE_TIMEOUT")
+    # Списки с limit больше этого значения считаются тяжёлыми
+    admission_bulk_list_threshold: int = Field(200, env="ADMISSION_BULK_LIST_THRESHOLD")
+
+    # Не больше multi_get_max_ids значений в одном запросе /many и /lookup
+    multi_get_max_ids: int = Field(500, env="MULTI_GET_MAX_IDS")
+    # Не больше batch_max_requests подзапросов в одном POST /batch
+    batch_max_requests: int = Field(20, env="BATCH_MAX_REQUESTS")
+    # Подзапрос пакета дольше batch_sub_request_timeout (с) прерывается с 504
+    batch_sub_request_timeout: float = Field(15.0, env="BATCH_SUB_REQUEST_TIMEOUT")
+
+    # Фоновые отчёты: каталог файлов, число воркеров, опрос очереди (с),
+    # задание running дольше report_job_timeout (с) считается брошенным
+    reports_dir: Path = Field(Path("var/reports"), env="REPORTS_DIR")
+    report_workers: int = Field(2, env="REPORT_WORKERS")
+    report_poll_interval: float = Field(30.0, env="REPORT_POLL_INTERVAL")
+    report_job_timeout: int = Field(3600, env="REPORT_JOB_TIMEOUT")
+    report_max_attempts: int = Field(3, env="REPORT_MAX_ATTEMPTS")
+    # Вытеснение готовых файлов: старше report_max_age_hours или сверх общего объёма
+    report_max_age_hours: float = Field(72.0, env="REPORT_MAX_AGE_HOURS")
+    report_max_total_mb: int = Field(2048, env="REPORT_MAX_TOTAL_MB")
 
     secret_key: SecretStr = Field(..., env="SECRET_KEY")
     algorithm: str = Field("HS256", env="ALGORITHM")
@@ -32,5 +84,30 @@ class Settings(BaseSettings):
             )
         )
 
+    @property
+    def replica_urls(self) -> List[str]:
+        """URL реплик с теми же учётными данными и именем БД, что у основной."""
+        urls = []
+        for entry in filter(None, (part.strip() for part in self.db_replica_hosts.split(","))):
+            host, _, port = entry.partition(":")
+            urls.append(
+                str(
+                    PostgresDsn.build(
+                        scheme="postgresql+asyncpg",
+                        username=self.db_user,
+                        password=self.db_pass.get_secret_value(),
+                        host=host,
+                        port=int(port) if port else self.db_port,
+                        path=f"{self.db_name}",
+                    )
+                )
+            )
+        return urls
+
+    @property
+    def asyncpg_dsn(self) -> str:
+        """DSN для прямого подключения asyncpg (без префикса драйвера SQLAlchemy)."""
+        return self.db_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
 
 settings = Settings()
@@ -1,26 +1,75 @@
-from typing import Any, List, Optional, Type, TypeVar
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence, Type, TypeVar
 
-from sqlalchemy import select, func
+from sqlalchemy import ColumnElement, Select, any_, bindparam, select, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.base import ExecutableOption
 
-from src.database import async_session_maker
+from src.database import async_session_maker, read_session_maker
+from src.pubsub.invalidation import publish_invalidation
 
 T = TypeVar("T")
 
+# Объектов за одно чтение из серверного курсора при потоковой выдаче списков
+STREAM_BATCH_SIZE = 500
+
+def matches_any(column: InstrumentedAttribute, values: Sequence[Any]) -> ColumnElement[bool]:
+    """
+    column = ANY(:values) с массивом одним параметром: текст запроса один
+    и тот же при любом числе значений, в отличие от IN (...).
+    """
+    return column == any_(bindparam(None, list(values), type_=ARRAY(column.type)))
+
+
 class BaseDAO:
     model: Type[T]  
 
     @classmethod
     async def find_all(cls, **filters: Any) -> List[T]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = select(cls.model)
             if filters:
                 query = query.filter_by(**filters)
             result = await session.execute(query)
             return result.scalars().all()
 
+    @classmethod
+    async def find_many(
+        cls,
+        values: Sequence[Any],
+        *,
+        column: Optional[InstrumentedAttribute] = None,
+        options: Iterable[ExecutableOption] = (),
+    ) -> List[T]:
+        """Объекты, у которых column (по умолчанию id) входит в values, одним запросом."""
+        if not values:
+            return []
+        column = column if column is not None else cls.model.id
+        async with read_session_maker() as session:
+            result = await session.execute(
+                select(cls.model).where(matches_any(column, values)).options(*options)
+            )
+            return result.scalars().all()
+
+    @classmethod
+    async def stream_scalars(
+        cls, query: Select, batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[Sequence[T]]:
+        """
+        Читает ORM-объекты серверным курсором пачками по batch_size:
+        selectinload-связи подгружаются отдельно для каждой пачки.
+        Объекты пачки живут, пока не запрошена следующая.
+        """
+        async with read_session_maker() as session:
+            result = await session.stream_scalars(
+                query.execution_options(yield_per=batch_size)
+            )
+            async for batch in result.partitions():
+                yield batch
+
     @classmethod
     async def find_by_id(cls, id_: Any) -> Optional[T]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             result = await session.execute(
                 select(cls.model).where(cls.model.id == id_)
             )
@@ -28,14 +77,14 @@ class BaseDAO:
 
     @classmethod
     async def find_one_or_none(cls, **filters: Any) -> Optional[T]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = select(cls.model).filter_by(**filters)
             result = await session.execute(query)
             return result.scalar_one_or_none()
 
     @classmethod
     async def count(cls) -> int:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             result = await session.execute(
                 select(func.count()).select_from(cls.model)
             )
@@ -48,7 +97,7 @@ class BaseDAO:
         limit: int = 100,
         **filters: Any
     ) -> List[T]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = select(cls.model).offset(offset).limit(limit)
             if filters:
                 query = query.filter_by(**filters)
@@ -60,6 +109,8 @@ class BaseDAO:
         async with async_session_maker() as session:
             instance = cls.model(**data)
             session.add(instance)
+            await session.flush()
+            await publish_invalidation(session, cls.model.__tablename__, [instance.id])
             await session.commit()
             await session.refresh(instance)
             return instance
@@ -77,6 +128,7 @@ class BaseDAO:
             for key, value in data.items():
                 setattr(instance, key, value)
 
+            await publish_invalidation(session, cls.model.__tablename__, [id_])
             await session.commit()
             await session.refresh(instance)
             return instance
@@ -92,5 +144,6 @@ class BaseDAO:
                 return False
 
             await session.delete(instance)
+            await publish_invalidation(session, cls.model.__tablename__, [id_])
             await session.commit()
             return True
\ No newline at end of file
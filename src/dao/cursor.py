@@ -0,0 +1,22 @@
+import base64
+from typing import Any, List
+
+import orjson
+
+from src.exceptions import BadRequestException
+
+
+def encode_cursor(*values: Any) -> str:
+    """Непрозрачный курсор keyset-пагинации: base64url(JSON-массив ключа)."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Разбирает курсор из encode_cursor; битый курсор — 400."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise BadRequestException(detail="Invalid cursor")
+    return values
@@ -0,0 +1,93 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.exceptions import BadRequestException
+
+
+class FieldSet:
+    """
+    Набор полей модели, доступных для выборочной загрузки (?fields=).
+
+    Поля связанных объектов задаются через точку: "current_location.name".
+    Для каждого такого префикса описывается LEFT JOIN
+    (путь -> (цель, ключ цели, внешний ключ)); в запрос попадают только
+    соединения, нужные запрошенным полям. Вложенные пути ("type.part_types")
+    присоединяются после родительских.
+    """
+
+    def __init__(
+        self,
+        base: Any,
+        fields: Dict[str, ColumnElement],
+        joins: Optional[Dict[str, Tuple[Any, ColumnElement, ColumnElement]]] = None,
+    ):
+        self.base = base
+        self.fields = fields
+        self.joins = joins or {}
+
+    @property
+    def description(self) -> str:
+        return "Поля через запятую: " + ", ".join(self.fields)
+
+    def parse(self, raw: Optional[str]) -> Optional[List[str]]:
+        """Разбирает ?fields=; None означает «все поля, полная схема»."""
+        if raw is None:
+            return None
+        names = list(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise BadRequestException(detail=f"Unknown fields: {', '.join(unknown)}")
+        if not names:
+            raise BadRequestException(detail="No fields requested")
+        return names
+
+    def join_paths(self, names: Iterable[str], require: Iterable[str] = ()) -> List[str]:
+        needed = set()
+        for path in [*(name.rsplit(".", 1)[0] for name in names if "." in name), *require]:
+            parts = path.split(".")
+            needed.update(".".join(parts[: i + 1]) for i in range(len(parts)))
+        # порядок описания соединений гарантирует, что родитель идёт раньше
+        return [path for path in self.joins if path in needed]
+
+    def select(self, names: Sequence[str], require: Iterable[str] = ()) -> Select:
+        """
+        SELECT только запрошенных колонок с минимально нужными соединениями.
+        require — соединения, необходимые фильтрам (например, для проверки доступа).
+        """
+        paths = self.join_paths(names, require)
+        query = select(
+            *(self.fields[name].label(name) for name in names),
+            *(self.joins[path][1].label(f"__{path}") for path in paths),
+        ).select_from(self.base)
+        for path in paths:
+            target, key, foreign_key = self.joins[path]
+            query = query.outerjoin(target, key == foreign_key)
+        return query
+
+    def to_dicts(self, rows: Iterable[Any], names: Sequence[str]) -> List[Dict[str, Any]]:
+        """Собирает строки в словари, вкладывая поля с точкой в подобъекты."""
+        paths = self.join_paths(names)
+        items = []
+        for row in rows:
+            mapping = row._mapping
+            item: Dict[str, Any] = {}
+            for name in names:
+                *parents, leaf = name.split(".")
+                target = item
+                for parent in parents:
+                    target = target.setdefault(parent, {})
+                target[leaf] = mapping[name]
+            # отсутствующий связанный объект отдаём как null, а не {поле: null}
+            for path in paths:
+                if mapping[f"__{path}"] is not None:
+                    continue
+                *parents, leaf = path.split(".")
+                target = item
+                for parent in parents:
+                    target = target.get(parent) if isinstance(target, dict) else None
+                if isinstance(target, dict) and leaf in target:
+                    target[leaf] = None
+            items.append(item)
+        return items
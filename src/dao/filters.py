@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.config import settings
+from src.dao.base import matches_any
+from src.exceptions import BadRequestException
+
+# Условий ?filter= в одном запросе
+MAX_CONDITIONS = 20
+
+_RANGE_OPS = {
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+}
+_ORDERED_TYPES = (int, float, Decimal, date, datetime)
+
+
+@dataclass(frozen=True)
+class ListCriteria:
+    """Разобранные ?filter= и ?sort=: условия WHERE и порядок строк."""
+
+    where: Tuple[ColumnElement[bool], ...] = ()
+    order_by: Tuple[ColumnElement[Any], ...] = ()
+
+    def apply(self, query: Select) -> Select:
+        query = query.where(*self.where)
+        if self.order_by:
+            # явная сортировка клиента заменяет порядок по умолчанию
+            query = query.order_by(None).order_by(*self.order_by)
+        return query
+
+
+NO_CRITERIA = ListCriteria()
+
+
+def _is_indexed(column: InstrumentedAttribute) -> bool:
+    """Колонка — первая в первичном ключе или в каком-либо btree-индексе таблицы."""
+    table_column = column.property.columns[0]
+    table = table_column.table
+    if list(table.primary_key.columns)[:1] == [table_column]:
+        return True
+    if table_column.unique or table_column.index:
+        return True
+    for index in table.indexes:
+        using = index.dialect_options["postgresql"].get("using")
+        if using and using != "btree":
+            continue
+        if index.expressions and index.expressions[0] is table_column:
+            return True
+    return False
+
+
+def _parser(column: InstrumentedAttribute) -> Callable[[str], Any]:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat
+    if python_type is date:
+        return date.fromisoformat
+    if python_type is bool:
+        return lambda raw: {"true": True, "false": False}[raw.lower()]
+    return python_type
+
+
+class FilterSet:
+    """
+    Фильтры и сортировка списков через параметры запроса.
+
+    ?filter=поле:операция:значение (параметр повторяется, условия через AND):
+    eq, in (значения через запятую), gt/gte/lt/lte для чисел и дат,
+    is_null (true/false) для необязательных колонок.
+    ?sort=поле,-поле — сортировка по нескольким колонкам, «-» — по убыванию.
+
+    Фильтровать можно только по перечисленным полям, сортировать — только по
+    тем из них, что проиндексированы (первая колонка PK или btree-индекса):
+    сортировка без индекса на больших таблицах превращается в полный обход.
+    """
+
+    def __init__(self, model: Any, fields: Dict[str, InstrumentedAttribute]):
+        self.model = model
+        self.fields = fields
+        self.sortable = [name for name, column in fields.items() if _is_indexed(column)]
+        self._parsers = {name: _parser(column) for name, column in fields.items()}
+        self._tiebreaker = model.id
+
+    @property
+    def description(self) -> str:
+        return (
+            "Условие поле:операция:значение, параметр можно повторять. "
+            "Операции: eq, in, gt, gte, lt, lte, is_null. Поля: " + ", ".join(self.fields)
+        )
+
+    @property
+    def sort_description(self) -> str:
+        return "Поля через запятую, «-» — по убыванию. Доступны: " + ", ".join(self.sortable)
+
+    def parse(self, conditions: Sequence[str], sort: Optional[str]) -> ListCriteria:
+        if len(conditions) > MAX_CONDITIONS:
+            raise BadRequestException(
+                detail=f"Too many filters: at most {MAX_CONDITIONS} allowed"
+            )
+        return ListCriteria(
+            where=tuple(self._condition(raw) for raw in conditions),
+            order_by=tuple(self._order_by(sort)) if sort else (),
+        )
+
+    def _condition(self, raw: str) -> ColumnElement[bool]:
+        name, op, value = (raw.split(":", 2) + ["", ""])[:3]
+        column = self.fields.get(name)
+        if column is None:
+            raise BadRequestException(detail=f"Unknown filter field: {name}")
+        try:
+            if op == "eq":
+                return column == self._parsers[name](value)
+            if op == "in":
+                values = list(dict.fromkeys(self._parsers[name](v) for v in value.split(",") if v))
+                if not values or len(values) > settings.multi_get_max_ids:
+                    raise ValueError
+                return matches_any(column, values)
+            if op in _RANGE_OPS and issubclass(column.type.python_type, _ORDERED_TYPES):
+                return _RANGE_OPS[op](column, self._parsers[name](value))
+            if op == "is_null" and column.property.columns[0].nullable:
+                is_null = {"true": True, "false": False}[value.lower()]
+                return column.is_(None) if is_null else column.is_not(None)
+        except (ValueError, KeyError):
+            raise BadRequestException(detail=f"Invalid filter value: {raw}")
+        raise BadRequestException(detail=f"Unsupported filter operation for {name}: {op}")
+
+    def _order_by(self, sort: str) -> List[ColumnElement[Any]]:
+        order_by, names = [], set()
+        for item in (part.strip() for part in sort.split(",")):
+            name = item.lstrip("-")
+            if name not in self.fields:
+                raise BadRequestException(detail=f"Unknown sort field: {name}")
+            if name not in self.sortable:
+                raise BadRequestException(
+                    detail=f"Sorting by {name} is not supported: column is not indexed"
+                )
+            if name in names:
+                continue
+            names.add(name)
+            column = self.fields[name]
+            order_by.append(column.desc() if item.startswith("-") else column.asc())
+        # id в конце делает порядок однозначным для постраничной выборки
+        if not any(self.fields[name] is self._tiebreaker for name in names):
+            order_by.append(self._tiebreaker.asc())
+        return order_by
@@ -0,0 +1,35 @@
+from typing import Any, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+
+
+def jsonb_object(*pairs: Any) -> Any:
+    """jsonb_build_object(k1, v1, ...) с типом результата JSONB."""
+    return func.jsonb_build_object(*pairs, type_=JSONB)
+
+
+def _row_object(subquery) -> Any:
+    return jsonb_object(*(part for c in subquery.c for part in (c.key, c)))
+
+
+def jsonb_first(query) -> Any:
+    """Первая строка (коррелированного) подзапроса как jsonb-объект или null."""
+    row = query.limit(1).subquery()
+    return select(_row_object(row)).select_from(row).scalar_subquery()
+
+
+def jsonb_rows(query, *order_by: Callable[[Any], Any]) -> Any:
+    """
+    Все строки (коррелированного) подзапроса как jsonb-массив, пустой — [].
+    order_by — функции от подзапроса, задающие порядок элементов массива.
+    """
+    rows = query.subquery()
+    item = _row_object(rows)
+    if order_by:
+        item = aggregate_order_by(item, *(o(rows) for o in order_by))
+    return (
+        select(func.coalesce(func.jsonb_agg(item), func.jsonb_build_array(), type_=JSONB))
+        .select_from(rows)
+        .scalar_subquery()
+    )
@@ -0,0 +1,121 @@
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Sequence, Tuple, TypeVar
+
+from prometheus_client import Counter
+
+from src.pubsub.invalidation import register_invalidator
+
+R = TypeVar("R")
+
+singleflight_calls_counter = Counter(
+    "singleflight_calls_total",
+    "Calls to single-flight functions by outcome",
+    ["function", "outcome"],
+)
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    key = (args, tuple(sorted(kwargs.items())))
+    hash(key)
+    return key
+
+
+def singleflight(
+    ttl: float = 0.0,
+    invalidate_on: Sequence[str] = (),
+) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]:
+    """
+    Объединяет одновременные одинаковые вызовы асинхронной функции в один.
+
+    Вызовы с одинаковыми аргументами, пришедшие, пока первый ещё выполняется,
+    ждут его результата вместо повторного запроса к БД. При ttl > 0 результат
+    дополнительно хранится указанное число секунд. Вызовы с явно переданной
+    сессией выполняются напрямую: они принадлежат транзакции вызывающего.
+
+    Общий вызов защищён от отмены отдельных ожидающих (клиент отключился),
+    но отменяется, когда уходит последний из них: результат больше никому
+    не нужен, и запрос к БД прерывается.
+
+    invalidate_on — таблицы, изменение которых (через шину инвалидации)
+    сбрасывает закешированные результаты на всех воркерах.
+
+    Метрика singleflight_calls_total{outcome} различает
+    executed (реальный вызов), coalesced (ожидание чужого вызова) и cached.
+    """
+
+    def decorator(func: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+        name = func.__qualname__
+        inflight: Dict[Hashable, asyncio.Task] = {}
+        # число вызовов, ожидающих каждую выполняющуюся задачу
+        waiters: Dict[asyncio.Task, int] = {}
+        cache: Dict[Hashable, Tuple[float, Any]] = {}
+        # поколение кеша: результат вызова, начатого до сброса, не кешируется
+        generation = [0]
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> R:
+            if kwargs.get("session") is not None:
+                return await func(*args, **kwargs)
+            try:
+                key = _make_key(args, kwargs)
+            except TypeError:
+                return await func(*args, **kwargs)
+
+            if ttl > 0 and key in cache:
+                expires_at, value = cache[key]
+                if expires_at > time.monotonic():
+                    singleflight_calls_counter.labels(name, "cached").inc()
+                    return value
+                del cache[key]
+
+            task = inflight.get(key)
+            if task is None:
+                singleflight_calls_counter.labels(name, "executed").inc()
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                inflight[key] = task
+                started_in = generation[0]
+
+                def _done(t: asyncio.Task) -> None:
+                    if inflight.get(key) is t:
+                        del inflight[key]
+                    if (
+                        ttl > 0
+                        and started_in == generation[0]
+                        and not t.cancelled()
+                        and t.exception() is None
+                    ):
+                        cache[key] = (time.monotonic() + ttl, t.result())
+
+                task.add_done_callback(_done)
+            else:
+                singleflight_calls_counter.labels(name, "coalesced").inc()
+
+            waiters[task] = waiters.get(task, 0) + 1
+            try:
+                # shield: отмена одного из ожидающих не должна прерывать остальных
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if waiters[task] == 1 and not task.done():
+                    # ушёл последний ожидающий: новые вызовы не должны
+                    # присоединяться к отменяемой задаче
+                    if inflight.get(key) is task:
+                        del inflight[key]
+                    task.cancel()
+                raise
+            finally:
+                waiters[task] -= 1
+                if not waiters[task]:
+                    del waiters[task]
+
+        def cache_clear(*_: Any) -> None:
+            generation[0] += 1
+            cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        for table in invalidate_on:
+            register_invalidator(table, cache_clear)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,25 @@
+from typing import Dict, Iterable, Type
+from sqlalchemy import select
+from src.dao.base import BaseDAO
+from src.database import async_session_maker
+from src.data_versions.models import DataVersion
+
+
+class DataVersionDAO(BaseDAO):
+    model: Type[DataVersion] = DataVersion
+
+    @classmethod
+    async def get_versions(cls, tables: Iterable[str]) -> Dict[str, int]:
+        """
+        Возвращает текущие версии данных для перечисленных таблиц одним запросом.
+        Таблицы без счётчика получают версию 0.
+        """
+        tables = sorted(set(tables))
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(cls.model.table_name, cls.model.version).where(
+                    cls.model.table_name.in_(tables)
+                )
+            )
+            versions = {name: version for name, version in result.all()}
+        return {name: versions.get(name, 0) for name in tables}
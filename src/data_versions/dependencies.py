@@ -0,0 +1,55 @@
+import hashlib
+from datetime import date
+from typing import Callable, Awaitable
+
+from fastapi import Request, Response
+
+from src.data_versions.dao import DataVersionDAO
+from src.exceptions import NotModifiedException
+from src.schemas.responses import response_media_type
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match сравнивается слабо: W/"x" совпадает с "x"
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def conditional_etag(*tables: str) -> Callable[[Request, Response], Awaitable[str]]:
+    """
+    Зависимость для условных GET-запросов.
+
+    ETag строится из пути, параметров запроса, формата ответа, текущей даты
+    и версий данных перечисленных таблиц. Если клиент прислал совпадающий If-None-Match,
+    запрос завершается ответом 304 без выполнения агрегаций.
+    """
+
+    async def dependency(request: Request, response: Response) -> str:
+        versions = await DataVersionDAO.get_versions(tables)
+        key = "|".join(
+            [
+                request.url.path,
+                "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items())),
+                response_media_type.get(),
+                date.today().isoformat(),
+                ",".join(f"{name}:{version}" for name, version in versions.items()),
+            ]
+        )
+        etag = '"%s"' % hashlib.sha1(key.encode()).hexdigest()
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            raise NotModifiedException(headers=headers)
+
+        response.headers.update(headers)
+        return etag
+
+    return dependency
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, BigInteger, String
+from src.database import Base
+
+
+class DataVersion(Base):
+    """
+    Счётчик версий данных по таблицам.
+    Увеличивается триггерами БД при любой записи в отслеживаемую таблицу.
+    """
+    __tablename__ = "data_versions"
+
+    table_name = Column(String(63), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -1,17 +1,342 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+import itertools
+import re
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 from src.config import settings
 
-engine = create_async_engine(
-    settings.db_url,
+class Workload(str, Enum):
+    """Класс нагрузки: у каждого свой пул соединений со своими размерами и таймаутами."""
+    interactive = "interactive"
+    analytics = "analytics"
+    background = "background"
+
+
+current_workload: ContextVar[Workload] = ContextVar(
+    "current_workload", default=Workload.interactive
+)
+# Переопределение statement_timeout (мс) для отдельных маршрутов
+statement_timeout_override: ContextVar[Optional[int]] = ContextVar(
+    "statement_timeout_override", default=None
+)
+
+db_pool_checked_out_gauge = Gauge(
+    "db_pool_checked_out", "Connections currently checked out of the pool", ["pool", "host"]
+)
+db_pool_capacity_gauge = Gauge(
+    "db_pool_capacity", "Pool size plus max overflow", ["pool", "host"]
 )
+db_pool_overflow_gauge = Gauge(
+    "db_pool_overflow", "Overflow connections currently open", ["pool", "host"]
+)
+db_query_cancellations_counter = Counter(
+    "db_query_cancellations_total",
+    "Queries cancelled by the server (sqlstate 57014)",
+    ["pool", "reason"],
+)
+
+QUERY_CANCELED_SQLSTATE = "57014"
+
+
+def _apply_statement_timeout(workload: Workload) -> Callable[..., None]:
+    default = getattr(settings, f"db_statement_timeout_{workload.value}")
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        timeout = statement_timeout_override.get()
+        if timeout is None:
+            timeout = default
+        # SET только при смене значения; вне транзакции, чтобы откат при возврате
+        # соединения в пул его не сбросил
+        if connection_record.info.get("statement_timeout") != timeout:
+            dbapi_connection.run_async(
+                lambda conn: conn.execute(f"SET statement_timeout = {int(timeout)}")
+            )
+            connection_record.info["statement_timeout"] = timeout
+
+    return on_checkout
+
 
-async_session_maker = async_sessionmaker(
+def _count_cancellation(workload: Workload) -> Callable[..., None]:
+    def on_error(context) -> None:
+        error = context.original_exception
+        if getattr(error, "sqlstate", None) != QUERY_CANCELED_SQLSTATE:
+            return
+        reason = "timeout" if "statement timeout" in str(error) else "cancel"
+        db_query_cancellations_counter.labels(pool=workload.value, reason=reason).inc()
+
+    return on_error
+
+
+def _create_engine(url: str, workload: Workload) -> AsyncEngine:
+    size = getattr(settings, f"db_pool_{workload.value}_size")
+    overflow = getattr(settings, f"db_pool_{workload.value}_overflow")
+    new_engine = create_async_engine(
+        url,
+        pool_size=size,
+        max_overflow=overflow,
+        pool_timeout=getattr(settings, f"db_pool_{workload.value}_timeout"),
+        pool_pre_ping=workload is not Workload.interactive,
+    )
+    labels = {"pool": workload.value, "host": new_engine.url.host}
+    pool = new_engine.sync_engine.pool
+    db_pool_checked_out_gauge.labels(**labels).set_function(pool.checkedout)
+    db_pool_overflow_gauge.labels(**labels).set_function(lambda: max(pool.overflow(), 0))
+    db_pool_capacity_gauge.labels(**labels).set(size + overflow)
+    event.listen(pool, "checkout", _apply_statement_timeout(workload))
+    event.listen(new_engine.sync_engine, "handle_error", _count_cancellation(workload))
+    return new_engine
+
+
+engines: Dict[Workload, AsyncEngine] = {
+    workload: _create_engine(settings.db_url, workload) for workload in Workload
+}
+engine = engines[Workload.interactive]
+
+replica_engines: Dict[Workload, List[AsyncEngine]] = {
+    workload: [_create_engine(url, workload) for url in settings.replica_urls]
+    for workload in Workload
+} if settings.replica_urls else {}
+_replica_cycles = {
+    workload: itertools.cycle(pool) for workload, pool in replica_engines.items()
+}
+
+
+def primary_engine() -> AsyncEngine:
+    """Движок основной БД для текущего класса нагрузки."""
+    return engines[current_workload.get()]
+
+
+class _WorkloadSessionMaker(async_sessionmaker):
+    """Фабрика сессий, привязывающая сессию к пулу текущего класса нагрузки."""
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        local_kw.setdefault("bind", primary_engine())
+        return super().__call__(**local_kw)
+
+
+async_session_maker = _WorkloadSessionMaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+
+@contextmanager
+def use_workload(
+    workload: Workload, statement_timeout: Optional[int] = None
+) -> Iterator[None]:
+    """
+    Выполняет блок на пулах указанного класса нагрузки.
+    statement_timeout (мс) заменяет значение по умолчанию для этого класса.
+    """
+    token = current_workload.set(workload)
+    timeout_token = statement_timeout_override.set(statement_timeout)
+    try:
+        yield
+    finally:
+        statement_timeout_override.reset(timeout_token)
+        current_workload.reset(token)
+
+
+def bind_workload(
+    workload: Workload, statement_timeout: Optional[int] = None
+) -> Callable[[], Awaitable[None]]:
+    """
+    Зависимость роутера: запросы к его маршрутам берут соединения из пула workload
+    и выполняются с его statement_timeout (или с переданным, в мс).
+    Зависимость асинхронная, поэтому значение видно в обработчике маршрута.
+    """
+    async def dependency() -> None:
+        current_workload.set(workload)
+        statement_timeout_override.set(statement_timeout)
+
+    return dependency
+
+
+@dataclass
+class ReadYourWrites:
+    """
+    Состояние маршрутизации чтений в рамках одного запроса.
+    sticky — клиент недавно писал (cookie), wrote — запрос уже что-то записал.
+    """
+    sticky: bool = False
+    wrote: bool = False
+
+    @property
+    def use_primary(self) -> bool:
+        return self.sticky or self.wrote
+
+
+read_your_writes: ContextVar[Optional[ReadYourWrites]] = ContextVar(
+    "read_your_writes", default=None
+)
+
+
+def _mark_write(conn, cursor, statement, parameters, context, executemany):
+    # INSERT/UPDATE/DELETE через основную БД: дальнейшие чтения запроса — тоже из неё
+    if context is not None and (context.isinsert or context.isupdate or context.isdelete):
+        state = read_your_writes.get()
+        if state is not None:
+            state.wrote = True
+
+
+for _primary in engines.values():
+    event.listen(_primary.sync_engine, "after_cursor_execute", _mark_write)
+
+
+@dataclass
+class SharedReadSession:
+    """
+    Одна сессия чтения на несколько параллельных задач (см. share_read_session).
+    AsyncSession не допускает конкурентного использования, поэтому задачи
+    работают с ней по очереди; повторный вход той же задачи не блокируется.
+
+    Сессия привязана к пулу и statement_timeout класса нагрузки, в котором
+    открыта; задачи другого класса (маршруты с bind_workload) её не получают.
+    """
+    session: AsyncSession
+    workload: Workload
+    statement_timeout: Optional[int]
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    owner: Optional[asyncio.Task] = None
+
+    def serves_current_workload(self) -> bool:
+        return (
+            current_workload.get() is self.workload
+            and statement_timeout_override.get() == self.statement_timeout
+        )
+
+    @asynccontextmanager
+    async def use(self) -> AsyncIterator[AsyncSession]:
+        task = asyncio.current_task()
+        if self.owner is task:
+            yield self.session
+            return
+        async with self.lock:
+            self.owner = task
+            try:
+                yield self.session
+            finally:
+                self.owner = None
+
+
+shared_read_session: ContextVar[Optional[SharedReadSession]] = ContextVar(
+    "shared_read_session", default=None
+)
+
+
+def read_session_maker() -> AsyncContextManager[AsyncSession]:
+    """
+    Сессия для запросов только на чтение.
+    Уходит на реплику (по кругу), если реплики настроены и клиент не писал
+    в последние db_read_your_writes_seconds; иначе — на основную БД.
+    Внутри share_read_session отдаётся общая сессия блока, она не закрывается,
+    если класс нагрузки тот же, что при её открытии.
+    """
+    shared = shared_read_session.get()
+    if shared is not None and shared.serves_current_workload():
+        return shared.use()
+    state = read_your_writes.get()
+    if not replica_engines or (state is not None and state.use_primary):
+        return async_session_maker()
+    return async_session_maker(bind=next(_replica_cycles[current_workload.get()]))
+
+
+@asynccontextmanager
+async def share_read_session() -> AsyncIterator[AsyncSession]:
+    """
+    Все чтения через read_session_maker внутри блока, в том числе в задачах,
+    созданных в нём, идут через одну сессию и одно соединение — кроме задач,
+    переключившихся на другой класс нагрузки: они читают через свой пул.
+    """
+    async with read_session_maker() as session:
+        token = shared_read_session.set(
+            SharedReadSession(
+                session, current_workload.get(), statement_timeout_override.get()
+            )
+        )
+        try:
+            yield session
+        finally:
+            shared_read_session.reset(token)
+
+
+_SNAPSHOT_ID_RE = re.compile(r"^[0-9A-Fa-f-]+$")
+
+
+@asynccontextmanager
+async def session_scope(session: Optional[AsyncSession] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Отдаёт переданную сессию как есть либо открывает новую.
+    Позволяет DAO выполняться как самостоятельно, так и в чужой транзакции.
+    Новая сессия открывается только на чтение (см. read_session_maker).
+    """
+    if session is not None:
+        yield session
+        return
+    async with read_session_maker() as new_session:
+        yield new_session
+
+
+@asynccontextmanager
+async def snapshot_session(snapshot_id: str) -> AsyncIterator[AsyncSession]:
+    """
+    Сессия на отдельном соединении, читающая экспортированный снимок данных.
+    """
+    if not _SNAPSHOT_ID_RE.match(snapshot_id):
+        raise ValueError(f"Invalid snapshot id: {snapshot_id!r}")
+    async with primary_engine().connect() as conn:
+        await conn.execution_options(
+            isolation_level="REPEATABLE READ", postgresql_readonly=True
+        )
+        async with conn.begin():
+            # SET TRANSACTION не принимает параметры, id проверен выше
+            await conn.execute(text(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'"))
+            async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+                yield session
+
+
+@asynccontextmanager
+async def exported_snapshot() -> AsyncIterator[Callable[[], AsyncIterator[AsyncSession]]]:
+    """
+    Открывает транзакцию REPEATABLE READ и экспортирует её снимок.
+    Отдаёт фабрику сессий, которые на своих соединениях видят те же данные;
+    снимок действует, пока открыт этот контекст.
+    """
+    async with primary_engine().connect() as leader:
+        await leader.execution_options(
+            isolation_level="REPEATABLE READ", postgresql_readonly=True
+        )
+        async with leader.begin():
+            snapshot_id = (
+                await leader.execute(text("SELECT pg_export_snapshot()"))
+            ).scalar_one()
+            yield lambda: snapshot_session(snapshot_id)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -28,6 +353,9 @@ def _register_models():
     import src.write_off_reports.models
     import src.failure_records.models
     import src.replacement_suggestions.models
+    import src.data_versions.models
+    import src.stats.models
+    import src.reports.models
     
 
 _register_models()
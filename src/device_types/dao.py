@@ -1,8 +1,9 @@
-from typing import Optional, List, Type, Any
+from typing import Optional, List, Sequence, Type, Any
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from src.dao.base import BaseDAO
-from src.database import async_session_maker
+from src.pubsub.invalidation import publish_invalidation
+from src.database import async_session_maker, read_session_maker
 from src.device_types.models import DeviceType
 
 
@@ -18,7 +19,7 @@ class DeviceTypeDAO(BaseDAO):
         creator_id: Optional[int] = None,
         **filters: Any
     ) -> List[DeviceType]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = (
                 select(cls.model)
                 .options(
@@ -37,7 +38,7 @@ class DeviceTypeDAO(BaseDAO):
 
     @classmethod
     async def find_by_id(cls, id_: int) -> Optional[DeviceType]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = (
                 select(cls.model)
                 .where(cls.model.id == id_)
@@ -46,6 +47,11 @@ class DeviceTypeDAO(BaseDAO):
             result = await session.execute(query)
             return result.scalars().first()
 
+    @classmethod
+    async def find_many(cls, ids: Sequence[int]) -> List[DeviceType]:
+        """Типы устройств по списку id, part_types подгружаются сразу."""
+        return await super().find_many(ids, options=[selectinload(cls.model.part_types)])
+
     @classmethod
     async def create(cls, **data: Any) -> DeviceType:
         """
@@ -54,6 +60,8 @@ class DeviceTypeDAO(BaseDAO):
         async with async_session_maker() as session:
             instance = cls.model(**data)
             session.add(instance)
+            await session.flush()
+            await publish_invalidation(session, cls.model.__tablename__, [instance.id])
             await session.commit()
 
             # Перезагружаем объект из базы со связанными сущностями
@@ -84,6 +92,7 @@ class DeviceTypeDAO(BaseDAO):
             for key, value in data.items():
                 setattr(instance, key, value)
 
+            await publish_invalidation(session, cls.model.__tablename__, [id_])
             await session.commit()
             await session.refresh(instance)
 
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, BigInteger, ForeignKey, String, Integer
+from sqlalchemy import Column, BigInteger, ForeignKey, String, Integer, Index, func, literal_column
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -8,6 +8,20 @@ if TYPE_CHECKING:
     from src.part_types.models import PartType
 
 
+def device_type_title(manufacturer, model):
+    """
+    «Производитель модель» без пустых частей, как concat_ws(' ', ...).
+    Собрано из IMMUTABLE-операций: concat_ws помечена STABLE,
+    и построить по ней индекс нельзя.
+    """
+    return func.coalesce(
+        manufacturer.concat(literal_column("' '")).concat(model),
+        manufacturer,
+        model,
+        literal_column("''"),
+    )
+
+
 class DeviceType(Base):
     __tablename__ = "device_types"
 
@@ -18,6 +32,28 @@ class DeviceType(Base):
     part_type_id = Column(BigInteger, ForeignKey("part_types.id"), nullable=False)
     created_by = Column(BigInteger, ForeignKey("users.id"), nullable=False)
 
+    __table_args__ = (
+        Index(
+            "ix_device_types_manufacturer_trgm",
+            manufacturer,
+            postgresql_using="gin",
+            postgresql_ops={"manufacturer": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_device_types_model_trgm",
+            model,
+            postgresql_using="gin",
+            postgresql_ops={"model": "gin_trgm_ops"},
+        ),
+        Index("ix_device_types_manufacturer_prefix", func.lower(manufacturer).collate("C")),
+        Index("ix_device_types_model_prefix", func.lower(model).collate("C")),
+        Index(
+            "ix_device_types_title_prefix",
+            func.lower(device_type_title(manufacturer, model)).collate("C"),
+            id,
+        ),
+    )
+
     devices = relationship("Device", back_populates="type")
     part_types = relationship("PartType", back_populates="device_types")
     creator = relationship("User", back_populates="created_device_types")
@@ -2,6 +2,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.admission import limit_large_pages
 from src.auth.dependencies import get_current_user
 from src.device_types.dao import DeviceTypeDAO
 from src.device_types.schemas import (
@@ -10,6 +11,8 @@ from src.device_types.schemas import (
     SDeviceTypeUpdate,
 )
 from src.part_types.dao import PartTypeDAO
+from src.schemas.many import IDS_DESCRIPTION, SManyRead, orm_many_response, parse_ids
+from src.schemas.responses import orm_list_response
 
 router = APIRouter(
     prefix="/device-types",
@@ -18,13 +21,16 @@ router = APIRouter(
 
 
 @router.get(
-    "/", response_model=List[SDeviceTypeRead], summary="Список всех типов устройств"
+    "/",
+    response_model=List[SDeviceTypeRead],
+    summary="Список всех типов устройств",
 )
 async def list_device_types(
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     part_type_id: Optional[int] = Query(None, description="Фильтр по типу детали"),
     current_user=Depends(get_current_user),
+    admission: None = Depends(limit_large_pages),
 ):
     filters = {}
     if part_type_id is not None:
@@ -32,19 +38,22 @@ async def list_device_types(
 
     try:
         items = await DeviceTypeDAO.find_all(offset=offset, limit=limit, **filters)
-        return [SDeviceTypeRead.model_validate(it) for it in items]
+        return orm_list_response(SDeviceTypeRead, items)
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
 
 @router.get(
-    "/my", response_model=List[SDeviceTypeRead], summary="Список своих типов устройств"
+    "/my",
+    response_model=List[SDeviceTypeRead],
+    summary="Список своих типов устройств",
 )
 async def list_my_device_types(
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     part_type_id: Optional[int] = Query(None, description="Фильтр по типу детали"),
     current_user=Depends(get_current_user),
+    admission: None = Depends(limit_large_pages),
 ):
     filters = {}
     if part_type_id is not None:
@@ -54,11 +63,25 @@ async def list_my_device_types(
         items = await DeviceTypeDAO.find_all(
             offset=offset, limit=limit, creator_id=current_user.id, **filters
         )
-        return [SDeviceTypeRead.model_validate(it) for it in items]
+        return orm_list_response(SDeviceTypeRead, items)
     except SQLAlchemyError:
         raise HTTPException(status_code=500, detail="Database error")
 
 
+@router.get(
+    "/many",
+    response_model=SManyRead[SDeviceTypeRead],
+    summary="Несколько типов устройств по ID",
+)
+async def get_device_types_many(
+    ids: str = Query(..., description=IDS_DESCRIPTION),
+    current_user=Depends(get_current_user),
+):
+    requested = parse_ids(ids)
+    items = await DeviceTypeDAO.find_many(requested)
+    return orm_many_response(SDeviceTypeRead, items, requested)
+
+
 @router.get(
     "/{type_id}",
     response_model=SDeviceTypeRead,
@@ -1,14 +1,61 @@
-from typing import Any, Optional, List, Type
-from sqlalchemy import select, or_, func
-from sqlalchemy.orm import selectinload, joinedload
-from src.dao.base import BaseDAO
-from src.database import async_session_maker
+from typing import Any, AsyncIterator, Dict, Optional, List, Sequence, Type
+from sqlalchemy import Select, select, or_, func
+from sqlalchemy.orm import InstrumentedAttribute, selectinload, joinedload
+from src.dao.base import BaseDAO, matches_any
+from src.dao.fields import FieldSet
+from src.dao.filters import NO_CRITERIA, FilterSet, ListCriteria
+from src.pubsub.invalidation import publish_invalidation
+from src.database import async_session_maker, read_session_maker
 from src.devices.models import Device
 from src.locations.models import Location
 from src.device_types.models import DeviceType
 from src.part_types.models import PartType
 
 
+DEVICE_FIELDS = FieldSet(
+    Device,
+    fields={
+        "id": Device.id,
+        "serial_number": Device.serial_number,
+        "purchase_date": Device.purchase_date,
+        "warranty_end": Device.warranty_end,
+        "type_id": Device.type_id,
+        "status": Device.status,
+        "current_location_id": Device.current_location_id,
+        "created_by": Device.created_by,
+        "type.id": DeviceType.id,
+        "type.manufacturer": DeviceType.manufacturer,
+        "type.model": DeviceType.model,
+        "type.expected_lifetime_months": DeviceType.expected_lifetime_months,
+        "type.part_type_id": DeviceType.part_type_id,
+        "type.created_by": DeviceType.created_by,
+        "type.part_types.id": PartType.id,
+        "type.part_types.name": PartType.name,
+        "current_location.id": Location.id,
+        "current_location.name": Location.name,
+    },
+    joins={
+        "type": (DeviceType, DeviceType.id, Device.type_id),
+        "type.part_types": (PartType, PartType.id, DeviceType.part_type_id),
+        "current_location": (Location, Location.id, Device.current_location_id),
+    },
+)
+
+DEVICE_FILTERS = FilterSet(
+    Device,
+    fields={
+        "id": Device.id,
+        "serial_number": Device.serial_number,
+        "type_id": Device.type_id,
+        "status": Device.status,
+        "current_location_id": Device.current_location_id,
+        "purchase_date": Device.purchase_date,
+        "warranty_end": Device.warranty_end,
+        "created_by": Device.created_by,
+    },
+)
+
+
 class DeviceDAO(BaseDAO):
     model: Type[Device] = Device
 
@@ -22,48 +69,149 @@ class DeviceDAO(BaseDAO):
         limit: int = 100,
         type_id: int | None = None,
         status: str | None = None,
-        current_location_id: int | None = None
+        current_location_id: int | None = None,
+        criteria: ListCriteria = NO_CRITERIA,
     ) -> List[Device]:
         """
         Возвращает устройства:
         - Для админа: все устройства
         - Для обычного пользователя: устройства, у которых current_location.created_by == creator_id или created_by == creator_id
         """
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
+            q = cls._find_all_query(
+                creator_id=creator_id,
+                is_admin=is_admin,
+                offset=offset,
+                limit=limit,
+                type_id=type_id,
+                status=status,
+                current_location_id=current_location_id,
+                criteria=criteria,
+            )
+            result = await session.execute(q)
+            return result.scalars().all()
+
+    @classmethod
+    def stream_all(
+        cls,
+        *,
+        creator_id: int,
+        is_admin: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+        type_id: int | None = None,
+        status: str | None = None,
+        current_location_id: int | None = None,
+        criteria: ListCriteria = NO_CRITERIA,
+    ) -> AsyncIterator[Sequence[Device]]:
+        """То же, что find_all, но пачками из курсора; без limit — все устройства."""
+        return cls.stream_scalars(
+            cls._find_all_query(
+                creator_id=creator_id,
+                is_admin=is_admin,
+                offset=offset,
+                limit=limit,
+                type_id=type_id,
+                status=status,
+                current_location_id=current_location_id,
+                criteria=criteria,
+            )
+        )
+
+    @classmethod
+    def _find_all_query(
+        cls,
+        *,
+        creator_id: int,
+        is_admin: bool,
+        offset: int,
+        limit: int | None,
+        type_id: int | None,
+        status: str | None,
+        current_location_id: int | None,
+        criteria: ListCriteria,
+    ) -> Select:
+        q = (
+            select(cls.model)
+            # подгружаем связанные объекты
+            .options(
+                selectinload(cls.model.type),
+                selectinload(cls.model.type).selectinload(DeviceType.part_types),
+                selectinload(cls.model.current_location),
+            )
+            .offset(offset)
+            .limit(limit)
+        )
+
+        # Применяем фильтры доступа только для не-админов
+        if not is_admin:
             q = (
-                select(cls.model)
-                # подгружаем связанные объекты
-                .options(
-                    selectinload(cls.model.type),
-                    selectinload(cls.model.type).selectinload(DeviceType.part_types),
-                    selectinload(cls.model.current_location),
+                q
+                # join на Location, чтобы фильтровать по created_by
+                .outerjoin(cls.model.current_location).where(
+                    or_(
+                        Location.created_by == creator_id,
+                        cls.model.created_by == creator_id,
+                    )
                 )
+            )
+
+        q = q.where(*cls._list_filters(type_id, status, current_location_id))
+        return criteria.apply(q)
+
+    @classmethod
+    def _list_filters(
+        cls,
+        type_id: int | None,
+        status: str | None,
+        current_location_id: int | None,
+    ) -> list:
+        filters = []
+        if type_id is not None:
+            filters.append(cls.model.type_id == type_id)
+        if status is not None:
+            filters.append(cls.model.status == status)
+        if current_location_id is not None:
+            filters.append(cls.model.current_location_id == current_location_id)
+        return filters
+
+    @classmethod
+    async def find_all_projected(
+        cls,
+        fields: List[str],
+        *,
+        creator_id: int,
+        is_admin: bool = False,
+        offset: int = 0,
+        limit: int = 100,
+        type_id: int | None = None,
+        status: str | None = None,
+        current_location_id: int | None = None,
+        criteria: ListCriteria = NO_CRITERIA,
+    ) -> List[Dict[str, Any]]:
+        """
+        То же, что find_all, но одним SELECT только по запрошенным полям
+        (без загрузки ORM-объектов и лишних связей).
+        """
+        async with read_session_maker() as session:
+            q = (
+                DEVICE_FIELDS.select(
+                    fields, require=() if is_admin else ("current_location",)
+                )
+                .where(*cls._list_filters(type_id, status, current_location_id))
                 .offset(offset)
                 .limit(limit)
             )
-
-            # Применяем фильтры доступа только для не-админов
             if not is_admin:
-                q = (
-                    q
-                    # join на Location, чтобы фильтровать по created_by
-                    .outerjoin(cls.model.current_location).where(
-                        or_(
-                            Location.created_by == creator_id,
-                            cls.model.created_by == creator_id,
-                        )
+                q = q.where(
+                    or_(
+                        Location.created_by == creator_id,
+                        cls.model.created_by == creator_id,
                     )
                 )
 
-            if type_id is not None:
-                q = q.where(cls.model.type_id == type_id)
-            if status is not None:
-                q = q.where(cls.model.status == status)
-            if current_location_id is not None:
-                q = q.where(cls.model.current_location_id == current_location_id)
-
-            result = await session.execute(q)
-            return result.scalars().all()
+            result = await session.execute(criteria.apply(q))
+            return DEVICE_FIELDS.to_dicts(result, fields)
 
     @classmethod
     async def find_by_id(
@@ -75,7 +223,7 @@ class DeviceDAO(BaseDAO):
         - Для обычного пользователя: если оно принадлежит пользователю (created_by == creator_id) или находится
           в локации пользователя (current_location.created_by == creator_id)
         """
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             q = (
                 select(cls.model)
                 .options(
@@ -98,6 +246,63 @@ class DeviceDAO(BaseDAO):
             result = await session.execute(q)
             return result.scalars().first()
 
+    @classmethod
+    async def find_many(
+        cls,
+        values: Sequence[Any],
+        *,
+        creator_id: int,
+        is_admin: bool = False,
+        column: Optional[InstrumentedAttribute] = None,
+    ) -> List[Device]:
+        """
+        Устройства по списку id (или значений column, например serial_number)
+        одним запросом = ANY($1). Правило доступа то же, что в find_by_id:
+        недоступные устройства просто не возвращаются.
+        """
+        if not values:
+            return []
+        column = column if column is not None else cls.model.id
+        async with read_session_maker() as session:
+            q = (
+                select(cls.model)
+                .options(
+                    selectinload(cls.model.type),
+                    selectinload(cls.model.type).selectinload(DeviceType.part_types),
+                    selectinload(cls.model.current_location),
+                )
+                .where(matches_any(column, values))
+            )
+            if not is_admin:
+                q = q.outerjoin(cls.model.current_location).where(
+                    or_(
+                        Location.created_by == creator_id,
+                        cls.model.created_by == creator_id,
+                    )
+                )
+            result = await session.execute(q)
+            return result.scalars().all()
+
+    @classmethod
+    async def is_accessible(
+        cls, device_id: int, *, creator_id: int, is_admin: bool = False
+    ) -> bool:
+        """
+        Проверка доступа к устройству одним SELECT EXISTS, без загрузки связей.
+        Правило то же, что в find_by_id.
+        """
+        async with read_session_maker() as session:
+            q = select(cls.model.id).where(cls.model.id == device_id)
+            if not is_admin:
+                q = q.outerjoin(cls.model.current_location).where(
+                    or_(
+                        Location.created_by == creator_id,
+                        cls.model.created_by == creator_id,
+                    )
+                )
+            result = await session.execute(select(q.exists()))
+            return bool(result.scalar())
+
     @classmethod
     async def update_status(cls, device_id: int, status: str) -> Optional[Device]:
         """
@@ -109,6 +314,7 @@ class DeviceDAO(BaseDAO):
                 return None
 
             device.status = status
+            await publish_invalidation(session, cls.model.__tablename__, [device_id])
             await session.commit()
             await session.refresh(device)
             return device
@@ -118,7 +324,7 @@ class DeviceDAO(BaseDAO):
         """
         Возвращает устройство без проверки прав доступа (для админских операций)
         """
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             q = (
                 select(cls.model)
                 .options(
@@ -133,13 +339,13 @@ class DeviceDAO(BaseDAO):
 
     @classmethod
     async def count_all(cls) -> int:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             result = await session.execute(select(func.count(cls.model.id)))
             return result.scalar()
 
     @classmethod
     async def count_created_between(cls, start, end) -> int:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             result = await session.execute(
                 select(func.count(cls.model.id)).where(
                     cls.model.purchase_date >= start, cls.model.purchase_date < end
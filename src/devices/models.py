@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, BigInteger, String, Date, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Date, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -19,13 +19,24 @@ class Device(Base):
 
     id = Column(BigInteger, primary_key=True)
     serial_number = Column(String(100), unique=True, nullable=False)
-    type_id = Column(BigInteger, ForeignKey("device_types.id"), nullable=False)
-    purchase_date = Column(Date)
-    warranty_end = Column(Date)
-    current_location_id = Column(BigInteger, ForeignKey("locations.id"))
-    status = Column(String(20), nullable=False)
+    type_id = Column(BigInteger, ForeignKey("device_types.id"), nullable=False, index=True)
+    purchase_date = Column(Date, index=True)
+    warranty_end = Column(Date, index=True)
+    current_location_id = Column(BigInteger, ForeignKey("locations.id"), index=True)
+    status = Column(String(20), nullable=False, index=True)
     created_by = Column(BigInteger, ForeignKey("users.id"), nullable=False)
 
+    __table_args__ = (
+        # поиск: GIN по триграммам и btree для автодополнения по префиксу
+        Index(
+            "ix_devices_serial_number_trgm",
+            serial_number,
+            postgresql_using="gin",
+            postgresql_ops={"serial_number": "gin_trgm_ops"},
+        ),
+        Index("ix_devices_serial_number_prefix", func.lower(serial_number).collate("C"), id),
+    )
+
     type = relationship("DeviceType", back_populates="devices")
     current_location = relationship("Location", back_populates="devices")
     movements = relationship("Movement", back_populates="device")
@@ -0,0 +1,191 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, literal, or_, select
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+from sqlalchemy.orm import aliased
+
+from src.dao.jsonb import jsonb_first, jsonb_object, jsonb_rows
+from src.database import read_session_maker
+from src.device_types.models import DeviceType
+from src.devices.models import Device
+from src.failure_records.models import FailureRecord
+from src.inventory_events.models import InventoryEvent
+from src.inventory_items.models import InventoryItem
+from src.locations.models import Location
+from src.maintenance_tasks.models import MaintenanceTask
+from src.movements.models import Movement
+from src.part_types.models import PartType
+from src.write_off_reports.models import WriteOffReport
+
+
+class DeviceOverviewDAO:
+    @classmethod
+    async def get(
+        cls,
+        device_id: int,
+        *,
+        creator_id: int,
+        is_admin: bool = False,
+        movements_limit: int = 5,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Карточка устройства одним SQL-запросом: само устройство с типом,
+        путь локации от корня, последние перемещения, открытые отказы,
+        ближайшее ТО, неутверждённое списание и последняя инвентаризация.
+
+        Вложенные части — коррелированные подзапросы, собираемые в jsonb
+        на стороне БД. Доступ проверяется один раз условием на строку устройства
+        (то же правило, что в DeviceDAO.find_by_id); None — нет устройства или доступа.
+        """
+        current_location = aliased(Location, name="current_location")
+
+        # Путь локации: рекурсивно поднимаемся от текущей локации к корню.
+        path = (
+            select(
+                Location.id, Location.name, Location.parent_id, literal(0).label("depth")
+            )
+            .join(Device, Device.current_location_id == Location.id)
+            .where(Device.id == device_id)
+            .cte("location_path", recursive=True)
+        )
+        parent = aliased(Location, name="parent")
+        path = path.union_all(
+            select(parent.id, parent.name, parent.parent_id, path.c.depth + 1)
+            .join(path, path.c.parent_id == parent.id)
+        )
+        location_path = (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(
+                        aggregate_order_by(
+                            jsonb_object("id", path.c.id, "name", path.c.name), path.c.depth.desc()
+                        )
+                    ),
+                    func.jsonb_build_array(),
+                    type_=JSONB,
+                )
+            )
+            .scalar_subquery()
+        )
+
+        from_location = aliased(Location, name="from_location")
+        to_location = aliased(Location, name="to_location")
+        recent_movements = jsonb_rows(
+            select(
+                Movement.id,
+                Movement.moved_at,
+                Movement.from_location_id,
+                from_location.name.label("from_location_name"),
+                Movement.to_location_id,
+                to_location.name.label("to_location_name"),
+                Movement.performed_by,
+            )
+            .outerjoin(from_location, from_location.id == Movement.from_location_id)
+            .outerjoin(to_location, to_location.id == Movement.to_location_id)
+            .where(Movement.device_id == Device.id)
+            .order_by(Movement.moved_at.desc(), Movement.id.desc())
+            .limit(movements_limit)
+            .correlate(Device),
+            lambda rows: rows.c.moved_at.desc(),
+            lambda rows: rows.c.id.desc(),
+        )
+
+        open_failures = jsonb_rows(
+            select(
+                FailureRecord.id,
+                FailureRecord.failure_date,
+                FailureRecord.part_type_id,
+                PartType.name.label("part_type_name"),
+                FailureRecord.description,
+            )
+            .join(PartType, PartType.id == FailureRecord.part_type_id)
+            .where(FailureRecord.device_id == Device.id, FailureRecord.resolved_date.is_(None))
+            .correlate(Device),
+            lambda rows: rows.c.failure_date.desc(),
+            lambda rows: rows.c.id.desc(),
+        )
+
+        next_maintenance = jsonb_first(
+            select(
+                MaintenanceTask.id,
+                MaintenanceTask.task_type,
+                MaintenanceTask.scheduled_date,
+                MaintenanceTask.assigned_to,
+            )
+            .where(
+                MaintenanceTask.device_id == Device.id,
+                MaintenanceTask.status == "scheduled",
+                MaintenanceTask.completed_date.is_(None),
+            )
+            .order_by(MaintenanceTask.scheduled_date, MaintenanceTask.id)
+            .correlate(Device)
+        )
+
+        pending_write_off = jsonb_first(
+            select(
+                WriteOffReport.id,
+                WriteOffReport.report_date,
+                WriteOffReport.reason,
+                WriteOffReport.disposed_by,
+            )
+            .where(WriteOffReport.device_id == Device.id, WriteOffReport.approved_by.is_(None))
+            .order_by(WriteOffReport.report_date.desc(), WriteOffReport.id.desc())
+            .correlate(Device)
+        )
+
+        last_sighting = jsonb_first(
+            select(
+                InventoryEvent.id.label("inventory_event_id"),
+                InventoryEvent.event_date,
+                InventoryEvent.location_id,
+                InventoryItem.condition,
+            )
+            .join(InventoryEvent, InventoryEvent.id == InventoryItem.inventory_event_id)
+            .where(InventoryItem.device_id == Device.id, InventoryItem.found.is_(True))
+            .order_by(InventoryEvent.event_date.desc(), InventoryEvent.id.desc())
+            .correlate(Device)
+        )
+
+        query = (
+            select(
+                jsonb_object(
+                    "id", Device.id,
+                    "serial_number", Device.serial_number,
+                    "purchase_date", Device.purchase_date,
+                    "warranty_end", Device.warranty_end,
+                    "status", Device.status,
+                    "created_by", Device.created_by,
+                    "type", jsonb_object(
+                        "id", DeviceType.id,
+                        "manufacturer", DeviceType.manufacturer,
+                        "model", DeviceType.model,
+                        "expected_lifetime_months", DeviceType.expected_lifetime_months,
+                        "part_type_id", DeviceType.part_type_id,
+                        "part_type_name", PartType.name,
+                    ),
+                ).label("device"),
+                location_path.label("location_path"),
+                recent_movements.label("recent_movements"),
+                open_failures.label("open_failures"),
+                next_maintenance.label("next_maintenance"),
+                pending_write_off.label("pending_write_off"),
+                last_sighting.label("last_sighting"),
+            )
+            .select_from(Device)
+            .join(DeviceType, DeviceType.id == Device.type_id)
+            .outerjoin(PartType, PartType.id == DeviceType.part_type_id)
+            .where(Device.id == device_id)
+        )
+        if not is_admin:
+            query = query.outerjoin(
+                current_location, current_location.id == Device.current_location_id
+            ).where(
+                or_(
+                    current_location.created_by == creator_id,
+                    Device.created_by == creator_id,
+                )
+            )
+
+        async with read_session_maker() as session:
+            row = (await session.execute(query)).mappings().first()
+        return dict(row) if row is not None else None
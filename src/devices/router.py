@@ -1,14 +1,40 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
 
+from src.admission import export_limiter, limit_large_pages
+from src.exceptions import BadRequestException
 from src.auth.dependencies import get_current_user
-from src.devices.dao import DeviceDAO
-from src.devices.schemas import SDeviceRead, SDeviceCreate, SDeviceUpdate
+from src.devices.dao import DEVICE_FIELDS, DEVICE_FILTERS, DeviceDAO
+from src.devices.schemas import (
+    SDeviceRead,
+    SDeviceCreate,
+    SDeviceLookup,
+    SDeviceUpdate,
+    SDeviceOverview,
+    STimelinePage,
+)
+from src.devices.overview import DeviceOverviewDAO
+from src.devices.timeline import DeviceTimelineDAO, parse_kinds
 from src.device_types.dao import DeviceTypeDAO
 from src.locations.dao import LocationDAO
+from src.schemas.many import (
+    IDS_DESCRIPTION,
+    SManyRead,
+    orm_many_response,
+    parse_ids,
+    unique_values,
+)
+from src.schemas.responses import (
+    NegotiatedResponse,
+    NDJSON_LIMIT_DESCRIPTION,
+    ndjson_limit,
+    ndjson_response,
+    orm_list_response,
+    wants_ndjson,
+)
 
 # Настройка логирования
 logger = logging.getLogger(__name__)
@@ -25,25 +51,83 @@ router = APIRouter(
     summary="Список устройств",
 )
 async def list_devices(
+    request: Request,
     type_id: Optional[int] = Query(None, description="Фильтр по типу устройства"),
     status: Optional[str] = Query(None, description="Фильтр по статусу"),
     current_location_id: Optional[int] = Query(
         None, description="Фильтр по текущей локации"
     ),
     offset: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: int = Query(100, ge=1, le=1000, description=NDJSON_LIMIT_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=DEVICE_FIELDS.description),
+    conditions: List[str] = Query(
+        [], alias="filter", description=DEVICE_FILTERS.description
+    ),
+    sort: Optional[str] = Query(None, description=DEVICE_FILTERS.sort_description),
     current_user=Depends(get_current_user),
+    admission: None = Depends(limit_large_pages),
 ) -> List[SDeviceRead]:
-    devices = await DeviceDAO.find_all(
+    field_names = DEVICE_FIELDS.parse(fields)
+    filters = dict(
         creator_id=current_user.id,
         is_admin=current_user.role == "admin",
         type_id=type_id,
         status=status,
         current_location_id=current_location_id,
+        criteria=DEVICE_FILTERS.parse(conditions, sort),
         offset=offset,
         limit=limit,
     )
-    return [SDeviceRead.model_validate(d) for d in devices]
+    if wants_ndjson(request):
+        if field_names is not None:
+            raise BadRequestException("fields is not supported for application/x-ndjson")
+        filters["limit"] = ndjson_limit(request, limit)
+        return await ndjson_response(
+            SDeviceRead, DeviceDAO.stream_all(**filters), limiter=export_limiter
+        )
+    if field_names is not None:
+        # выборочные поля: один SELECT по нужным колонкам, без полной схемы
+        return NegotiatedResponse(
+            await DeviceDAO.find_all_projected(field_names, **filters)
+        )
+
+    devices = await DeviceDAO.find_all(**filters)
+    return orm_list_response(SDeviceRead, devices)
+
+
+@router.get(
+    "/many",
+    response_model=SManyRead[SDeviceRead],
+    summary="Несколько устройств по ID",
+)
+async def get_devices_many(
+    ids: str = Query(..., description=IDS_DESCRIPTION),
+    current_user=Depends(get_current_user),
+) -> SManyRead[SDeviceRead]:
+    requested = parse_ids(ids)
+    devices = await DeviceDAO.find_many(
+        requested, creator_id=current_user.id, is_admin=current_user.role == "admin"
+    )
+    return orm_many_response(SDeviceRead, devices, requested)
+
+
+@router.post(
+    "/lookup",
+    response_model=SManyRead[SDeviceRead],
+    summary="Поиск устройств по серийным номерам",
+    description="Все найденные устройства одним запросом; ненайденные номера — в missing.",
+)
+async def lookup_devices(
+    payload: SDeviceLookup, current_user=Depends(get_current_user)
+) -> SManyRead[SDeviceRead]:
+    requested = unique_values(payload.serial_numbers)
+    devices = await DeviceDAO.find_many(
+        requested,
+        creator_id=current_user.id,
+        is_admin=current_user.role == "admin",
+        column=DeviceDAO.model.serial_number,
+    )
+    return orm_many_response(SDeviceRead, devices, requested, key="serial_number")
 
 
 @router.get(
@@ -65,6 +149,61 @@ async def get_device(
     return SDeviceRead.model_validate(device)
 
 
+@router.get(
+    "/{device_id}/overview",
+    response_model=SDeviceOverview,
+    summary="Карточка устройства одним запросом",
+)
+async def get_device_overview(
+    device_id: int,
+    movements: int = Query(5, ge=0, le=50, description="Сколько последних перемещений вернуть"),
+    current_user=Depends(get_current_user),
+) -> SDeviceOverview:
+    overview = await DeviceOverviewDAO.get(
+        device_id,
+        creator_id=current_user.id,
+        is_admin=current_user.role == "admin",
+        movements_limit=movements,
+    )
+    if overview is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Device with id={device_id} not found",
+        )
+    # все вложенные части собраны в БД как jsonb — отдаём как есть
+    return NegotiatedResponse(overview)
+
+
+@router.get(
+    "/{device_id}/timeline",
+    response_model=STimelinePage,
+    summary="История устройства (все события одной лентой)",
+)
+async def get_device_timeline(
+    device_id: int,
+    types: Optional[str] = Query(
+        None,
+        description="Типы событий через запятую: movement, failure, maintenance, inventory, write_off",
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor предыдущей страницы"),
+    current_user=Depends(get_current_user),
+) -> STimelinePage:
+    kinds = parse_kinds(types)
+    if not await DeviceDAO.is_accessible(
+        device_id, creator_id=current_user.id, is_admin=current_user.role == "admin"
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Device with id={device_id} not found",
+        )
+    items, next_cursor = await DeviceTimelineDAO.get_page(
+        device_id, kinds=kinds, limit=limit, cursor=cursor
+    )
+    # details уже собраны в БД как JSONB — отдаём без повторной валидации
+    return NegotiatedResponse({"items": items, "next_cursor": next_cursor})
+
+
 @router.post(
     "/",
     response_model=SDeviceRead,
@@ -1,5 +1,6 @@
-from datetime import date
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Any, Dict, Optional, List
+from pydantic import Field
 from src.schemas.base import OrmModel
 from src.device_types.schemas import (
     SDeviceTypeRead as DeviceTypeReadSchema,
@@ -21,6 +22,12 @@ class SDeviceCreate(SDeviceBase):
     pass
 
 
+class SDeviceLookup(OrmModel):
+    serial_numbers: List[str] = Field(
+        ..., min_length=1, description="Серийные номера, например отсканированные со стойки"
+    )
+
+
 class SDeviceUpdate(OrmModel):
     serial_number: Optional[str] = None
     type_id: Optional[int] = None
@@ -60,3 +67,89 @@ class SDeviceRead(OrmModel):
     created_by: int
 
     model_config = {"from_attributes": True}
+
+
+class STimelineEvent(OrmModel):
+    kind: str
+    id: int
+    ts: datetime
+    details: Dict[str, Any]
+
+
+class STimelinePage(OrmModel):
+    items: List[STimelineEvent]
+    next_cursor: Optional[str] = None
+
+
+# Карточка устройства (/devices/{id}/overview)
+class SOverviewDeviceType(OrmModel):
+    id: int
+    manufacturer: Optional[str]
+    model: Optional[str]
+    expected_lifetime_months: Optional[int]
+    part_type_id: int
+    part_type_name: Optional[str]
+
+
+class SOverviewDevice(OrmModel):
+    id: int
+    serial_number: str
+    purchase_date: Optional[date]
+    warranty_end: Optional[date]
+    status: str
+    created_by: int
+    type: SOverviewDeviceType
+
+
+class SLocationPathItem(OrmModel):
+    id: int
+    name: str
+
+
+class SOverviewMovement(OrmModel):
+    id: int
+    moved_at: datetime
+    from_location_id: Optional[int]
+    from_location_name: Optional[str]
+    to_location_id: int
+    to_location_name: Optional[str]
+    performed_by: Optional[int]
+
+
+class SOverviewFailure(OrmModel):
+    id: int
+    failure_date: date
+    part_type_id: int
+    part_type_name: str
+    description: Optional[str]
+
+
+class SOverviewMaintenance(OrmModel):
+    id: int
+    task_type: str
+    scheduled_date: date
+    assigned_to: Optional[int]
+
+
+class SOverviewWriteOff(OrmModel):
+    id: int
+    report_date: date
+    reason: str
+    disposed_by: Optional[int]
+
+
+class SOverviewSighting(OrmModel):
+    inventory_event_id: int
+    event_date: date
+    location_id: int
+    condition: Optional[str]
+
+
+class SDeviceOverview(OrmModel):
+    device: SOverviewDevice
+    location_path: List[SLocationPathItem]
+    recent_movements: List[SOverviewMovement]
+    open_failures: List[SOverviewFailure]
+    next_maintenance: Optional[SOverviewMaintenance]
+    pending_write_off: Optional[SOverviewWriteOff]
+    last_sighting: Optional[SOverviewSighting]
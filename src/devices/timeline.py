@@ -0,0 +1,173 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import TIMESTAMP, cast, func, literal, select, tuple_, union_all
+
+from src.dao.cursor import decode_cursor, encode_cursor
+from src.dao.jsonb import jsonb_object
+from src.database import read_session_maker
+from src.exceptions import BadRequestException
+from src.failure_records.models import FailureRecord
+from src.inventory_events.models import InventoryEvent
+from src.inventory_items.models import InventoryItem
+from src.maintenance_tasks.models import MaintenanceTask
+from src.movements.models import Movement
+from src.write_off_reports.models import WriteOffReport
+
+
+class TimelineKind(str, Enum):
+    failure = "failure"
+    inventory = "inventory"
+    maintenance = "maintenance"
+    movement = "movement"
+    write_off = "write_off"
+
+
+def _as_timestamp(column):
+    return cast(column, TIMESTAMP(timezone=True))
+
+
+def _sources(device_id: int):
+    """kind -> (ключ id, момент события, детали, SELECT-основа с фильтром по устройству)."""
+    ts_maintenance = _as_timestamp(
+        func.coalesce(MaintenanceTask.completed_date, MaintenanceTask.scheduled_date)
+    )
+    return {
+        TimelineKind.movement: (
+            Movement.id,
+            Movement.moved_at,
+            jsonb_object(
+                "from_location_id", Movement.from_location_id,
+                "to_location_id", Movement.to_location_id,
+                "performed_by", Movement.performed_by,
+                "notes", Movement.notes,
+            ),
+            lambda q: q.where(Movement.device_id == device_id),
+        ),
+        TimelineKind.failure: (
+            FailureRecord.id,
+            _as_timestamp(FailureRecord.failure_date),
+            jsonb_object(
+                "part_type_id", FailureRecord.part_type_id,
+                "resolved_date", FailureRecord.resolved_date,
+                "description", FailureRecord.description,
+            ),
+            lambda q: q.where(FailureRecord.device_id == device_id),
+        ),
+        TimelineKind.maintenance: (
+            MaintenanceTask.id,
+            ts_maintenance,
+            jsonb_object(
+                "task_type", MaintenanceTask.task_type,
+                "status", MaintenanceTask.status,
+                "scheduled_date", MaintenanceTask.scheduled_date,
+                "completed_date", MaintenanceTask.completed_date,
+                "assigned_to", MaintenanceTask.assigned_to,
+            ),
+            lambda q: q.where(MaintenanceTask.device_id == device_id),
+        ),
+        TimelineKind.inventory: (
+            InventoryItem.id,
+            _as_timestamp(InventoryEvent.event_date),
+            jsonb_object(
+                "inventory_event_id", InventoryItem.inventory_event_id,
+                "location_id", InventoryEvent.location_id,
+                "found", InventoryItem.found,
+                "condition", InventoryItem.condition,
+                "comments", InventoryItem.comments,
+            ),
+            lambda q: q.select_from(InventoryItem)
+            .join(InventoryEvent, InventoryEvent.id == InventoryItem.inventory_event_id)
+            .where(InventoryItem.device_id == device_id),
+        ),
+        TimelineKind.write_off: (
+            WriteOffReport.id,
+            _as_timestamp(WriteOffReport.report_date),
+            jsonb_object(
+                "reason", WriteOffReport.reason,
+                "disposed_by", WriteOffReport.disposed_by,
+                "approved_by", WriteOffReport.approved_by,
+            ),
+            lambda q: q.where(WriteOffReport.device_id == device_id),
+        ),
+    }
+
+
+def parse_kinds(raw: Optional[str]) -> List[TimelineKind]:
+    """Разбирает ?types=movement,failure; пусто — все типы событий."""
+    if not raw:
+        return list(TimelineKind)
+    names = [name.strip() for name in raw.split(",") if name.strip()]
+    unknown = [name for name in names if name not in TimelineKind.__members__]
+    if unknown:
+        raise BadRequestException(detail=f"Unknown event types: {', '.join(unknown)}")
+    return [TimelineKind(name) for name in dict.fromkeys(names)]
+
+
+def _parse_cursor(cursor: str) -> Tuple[datetime, str, int]:
+    ts, kind, id_ = decode_cursor(cursor, 3)
+    try:
+        return datetime.fromisoformat(ts), TimelineKind(kind).value, int(id_)
+    except (TypeError, ValueError):
+        raise BadRequestException(detail="Invalid cursor")
+
+
+class DeviceTimelineDAO:
+    @classmethod
+    async def get_page(
+        cls,
+        device_id: int,
+        *,
+        kinds: Sequence[TimelineKind],
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        История устройства одним запросом UNION ALL по перемещениям, отказам,
+        регламентным работам, инвентаризациям и списаниям.
+
+        Порядок — (ts, kind, id) по убыванию. Каждая ветка берёт не больше
+        limit + 1 строк своего типа после курсора; kind внутри ветки постоянен,
+        поэтому условие курсора сводится к сравнению (ts, id).
+        Доступ к устройству проверяет вызывающий код.
+        """
+        after = _parse_cursor(cursor) if cursor else None
+        sources = _sources(device_id)
+
+        branches = []
+        for kind in kinds:
+            id_col, ts, details, base = sources[kind]
+            branch = base(
+                select(
+                    literal(kind.value).label("kind"),
+                    id_col.label("id"),
+                    ts.label("ts"),
+                    details.label("details"),
+                )
+            )
+            if after is not None:
+                after_ts, after_kind, after_id = after
+                if kind.value > after_kind:
+                    branch = branch.where(ts < after_ts)
+                elif kind.value == after_kind:
+                    branch = branch.where(tuple_(ts, id_col) < tuple_(after_ts, after_id))
+                else:
+                    branch = branch.where(ts <= after_ts)
+            branches.append(branch.order_by(ts.desc(), id_col.desc()).limit(limit + 1))
+
+        events = union_all(*branches).subquery("events")
+        query = (
+            select(events)
+            .order_by(events.c.ts.desc(), events.c.kind.desc(), events.c.id.desc())
+            .limit(limit + 1)
+        )
+        async with read_session_maker() as session:
+            rows = (await session.execute(query)).mappings().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last["ts"], last["kind"], last["id"])
+        return [dict(row) for row in rows], next_cursor
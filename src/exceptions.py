@@ -31,4 +31,21 @@ class NotFoundException(HTTPException):
         super().__init__(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=detail,
-        )
\ No newline at end of file
+        )
+
+
+class NotModifiedException(HTTPException):
+    def __init__(self, headers: dict | None = None):
+        super().__init__(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers,
+        )
+
+
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, detail: str = "Service is overloaded, retry later", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,132 @@
+import asyncio
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.orm import aliased
+
+from src.database import read_session_maker
+from src.device_types.models import DeviceType
+from src.devices.models import Device
+from src.exports.renderers import make_renderer
+from src.exports.schemas import ExportFormat
+from src.failure_records.models import FailureRecord
+from src.locations.models import Location
+from src.maintenance_tasks.models import MaintenanceTask
+from src.movements.models import Movement
+from src.part_types.models import PartType
+from src.users.models import User
+
+# Строк за одно чтение из курсора; столько же уходит в поток рендеринга
+EXPORT_BATCH_SIZE = 2000
+
+
+class ExportDAO:
+    """Запросы полных выгрузок: только нужные колонки, связанные имена через JOIN."""
+
+    @classmethod
+    def devices_query(cls) -> Select:
+        return (
+            select(
+                Device.id,
+                Device.serial_number,
+                DeviceType.manufacturer,
+                DeviceType.model,
+                Device.status,
+                Location.name.label("location"),
+                Device.purchase_date,
+                Device.warranty_end,
+                User.username.label("created_by"),
+            )
+            .join(DeviceType, DeviceType.id == Device.type_id)
+            .outerjoin(Location, Location.id == Device.current_location_id)
+            .join(User, User.id == Device.created_by)
+            .order_by(Device.id)
+        )
+
+    @classmethod
+    def movements_query(cls) -> Select:
+        from_location = aliased(Location)
+        to_location = aliased(Location)
+        return (
+            select(
+                Movement.id,
+                Movement.device_id,
+                Device.serial_number,
+                from_location.name.label("from_location"),
+                to_location.name.label("to_location"),
+                Movement.moved_at,
+                User.username.label("performed_by"),
+                Movement.notes,
+            )
+            .join(Device, Device.id == Movement.device_id)
+            .outerjoin(from_location, from_location.id == Movement.from_location_id)
+            .join(to_location, to_location.id == Movement.to_location_id)
+            .outerjoin(User, User.id == Movement.performed_by)
+            .order_by(Movement.id)
+        )
+
+    @classmethod
+    def failure_records_query(cls) -> Select:
+        return (
+            select(
+                FailureRecord.id,
+                FailureRecord.device_id,
+                Device.serial_number,
+                PartType.name.label("part_type"),
+                FailureRecord.failure_date,
+                FailureRecord.resolved_date,
+                FailureRecord.description,
+            )
+            .join(Device, Device.id == FailureRecord.device_id)
+            .join(PartType, PartType.id == FailureRecord.part_type_id)
+            .order_by(FailureRecord.id)
+        )
+
+    @classmethod
+    def maintenance_tasks_query(cls) -> Select:
+        return (
+            select(
+                MaintenanceTask.id,
+                MaintenanceTask.device_id,
+                Device.serial_number,
+                MaintenanceTask.task_type,
+                MaintenanceTask.scheduled_date,
+                MaintenanceTask.completed_date,
+                MaintenanceTask.status,
+                User.username.label("assigned_to"),
+                MaintenanceTask.notes,
+            )
+            .join(Device, Device.id == MaintenanceTask.device_id)
+            .outerjoin(User, User.id == MaintenanceTask.assigned_to)
+            .order_by(MaintenanceTask.id)
+        )
+
+    @classmethod
+    async def stream_rows(cls, query: Select) -> AsyncIterator[Sequence[Row]]:
+        """Читает результат серверным курсором пачками по EXPORT_BATCH_SIZE строк."""
+        async with read_session_maker() as session:
+            result = await session.stream(
+                query.execution_options(yield_per=EXPORT_BATCH_SIZE)
+            )
+            async for rows in result.partitions():
+                yield rows
+
+    @classmethod
+    async def render(
+        cls, query: Select, export_format: ExportFormat, title: str
+    ) -> AsyncIterator[bytes]:
+        """
+        Отдаёт файл выгрузки по частям. Чтение идёт на event loop, а
+        форматирование каждой пачки — в рабочем потоке, чтобы CSV/openpyxl
+        не блокировали остальные запросы.
+        """
+        renderer = await asyncio.to_thread(
+            make_renderer, export_format, list(query.selected_columns.keys()), title
+        )
+        async for rows in cls.stream_rows(query):
+            chunk = await asyncio.to_thread(renderer.write, rows)
+            if chunk:
+                yield chunk
+        tail = renderer.close()
+        while (chunk := await asyncio.to_thread(next, tail, None)) is not None:
+            yield chunk
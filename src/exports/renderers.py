@@ -0,0 +1,77 @@
+import csv
+import io
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Iterator, Sequence
+
+from openpyxl import Workbook
+
+from src.exports.schemas import ExportFormat
+
+CHUNK_SIZE = 64 * 1024
+
+
+class CsvRenderer:
+    """
+    CSV по частям: каждая пачка строк сразу превращается в байты,
+    в памяти держится только текущая пачка.
+    """
+
+    media_type = "text/csv; charset=utf-8"
+
+    def __init__(self, headers: Sequence[str]):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        # BOM — чтобы Excel открыл файл в UTF-8, а не в cp1251
+        self._buffer.write("\ufeff")
+        self._writer.writerow(headers)
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        self._writer.writerows(rows)
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def close(self) -> Iterator[bytes]:
+        return iter(())
+
+
+def _xlsx_value(value: Any) -> Any:
+    # Excel не хранит часовой пояс: datetime с tzinfo приводится к наивному UTC
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class XlsxRenderer:
+    """
+    XLSX через write_only-книгу openpyxl: строки сразу пишутся во временный
+    файл листа, а не копятся объектами ячеек. Zip-архив собирается в конце,
+    поэтому файл отдаётся после последней строки — память при этом не растёт.
+    """
+
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    def __init__(self, headers: Sequence[str], title: str = "Export"):
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet(title)
+        self._sheet.append(list(headers))
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        for row in rows:
+            self._sheet.append([_xlsx_value(value) for value in row])
+        return b""
+
+    def close(self) -> Iterator[bytes]:
+        with tempfile.TemporaryFile() as output:
+            self._workbook.save(output)
+            output.seek(0)
+            while chunk := output.read(CHUNK_SIZE):
+                yield chunk
+
+
+def make_renderer(export_format: ExportFormat, headers: Sequence[str], title: str):
+    if export_format is ExportFormat.xlsx:
+        return XlsxRenderer(headers, title=title)
+    return CsvRenderer(headers)
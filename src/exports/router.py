@@ -0,0 +1,77 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from src.admission import AdmittedStreamingResponse, export_limiter
+from src.auth.dependencies import get_current_admin_user
+from src.database import Workload, bind_workload
+from src.exports.dao import ExportDAO
+from src.exports.renderers import CsvRenderer, XlsxRenderer
+from src.exports.schemas import ExportFormat
+
+router = APIRouter(
+    prefix="/exports",
+    tags=["Выгрузки"],
+    dependencies=[
+        # курсор по миллионам строк законно работает долго; брошенная выгрузка
+        # отменяется при отключении клиента, поэтому statement_timeout снят
+        Depends(bind_workload(Workload.analytics, statement_timeout=0)),
+        Depends(get_current_admin_user),
+    ],
+)
+
+FORMAT_QUERY = Query(ExportFormat.csv, alias="format", description="Формат файла: csv или xlsx")
+
+
+async def _export(name: str, query: Select, export_format: ExportFormat):
+    await export_limiter.acquire()
+    media_type = (
+        XlsxRenderer.media_type if export_format is ExportFormat.xlsx else CsvRenderer.media_type
+    )
+    filename = f"{name}-{date.today().isoformat()}.{export_format.value}"
+    return AdmittedStreamingResponse(
+        ExportDAO.render(query, export_format, title=name),
+        limiter=export_limiter,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/devices",
+    summary="Полная выгрузка устройств (CSV/XLSX)",
+    response_class=StreamingResponse,
+)
+async def export_devices(export_format: ExportFormat = FORMAT_QUERY):
+    return await _export("devices", ExportDAO.devices_query(), export_format)
+
+
+@router.get(
+    "/movements",
+    summary="Полная выгрузка перемещений (CSV/XLSX)",
+    response_class=StreamingResponse,
+)
+async def export_movements(export_format: ExportFormat = FORMAT_QUERY):
+    return await _export("movements", ExportDAO.movements_query(), export_format)
+
+
+@router.get(
+    "/failure-records",
+    summary="Полная выгрузка отказов (CSV/XLSX)",
+    response_class=StreamingResponse,
+)
+async def export_failure_records(export_format: ExportFormat = FORMAT_QUERY):
+    return await _export("failure-records", ExportDAO.failure_records_query(), export_format)
+
+
+@router.get(
+    "/maintenance-tasks",
+    summary="Полная выгрузка регламентных работ (CSV/XLSX)",
+    response_class=StreamingResponse,
+)
+async def export_maintenance_tasks(export_format: ExportFormat = FORMAT_QUERY):
+    return await _export(
+        "maintenance-tasks", ExportDAO.maintenance_tasks_query(), export_format
+    )
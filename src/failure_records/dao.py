@@ -1,11 +1,36 @@
-from typing import Any, Optional, List, Type
-from sqlalchemy import select, func
+from typing import Any, AsyncIterator, Dict, Optional, List, Sequence, Type
+from sqlalchemy import Select, select, func
 from sqlalchemy.orm import selectinload, joinedload
 from src.dao.base import BaseDAO
-from src.database import async_session_maker
+from src.dao.fields import FieldSet
+from src.database import read_session_maker
 from src.failure_records.models import FailureRecord
 from src.devices.models import Device
 from src.locations.models import Location
+from src.part_types.models import PartType
+
+
+FAILURE_FIELDS = FieldSet(
+    FailureRecord,
+    fields={
+        "id": FailureRecord.id,
+        "device_id": FailureRecord.device_id,
+        "part_type_id": FailureRecord.part_type_id,
+        "failure_date": FailureRecord.failure_date,
+        "resolved_date": FailureRecord.resolved_date,
+        "description": FailureRecord.description,
+        "part_type.id": PartType.id,
+        "part_type.name": PartType.name,
+        "device.id": Device.id,
+        "device.serial_number": Device.serial_number,
+    },
+    joins={
+        "part_type": (PartType, PartType.id, FailureRecord.part_type_id),
+        "device": (Device, Device.id, FailureRecord.device_id),
+        # нужен только фильтру доступа по владельцу локации
+        "device.current_location": (Location, Location.id, Device.current_location_id),
+    },
+)
 
 
 class FailureRecordDAO(BaseDAO):
@@ -15,7 +40,7 @@ class FailureRecordDAO(BaseDAO):
     async def find_by_device_id(
         cls, device_id: int, *, creator_id: int
     ) -> List[FailureRecord]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             q = (
                 select(cls.model)
                 .join(cls.model.device)
@@ -35,7 +60,7 @@ class FailureRecordDAO(BaseDAO):
     async def find_by_part_type_id(
         cls, part_type_id: int, *, creator_id: int
     ) -> List[FailureRecord]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             q = (
                 select(cls.model)
                 .join(cls.model.device)
@@ -52,41 +77,82 @@ class FailureRecordDAO(BaseDAO):
             return result.scalars().all()
 
     @classmethod
-    async def find_by_id(cls, id_: Any, *, creator_id: int) -> Optional[FailureRecord]:
-        async with async_session_maker() as session:
+    async def find_projected(
+        cls,
+        fields: List[str],
+        *,
+        creator_id: int,
+        device_id: Optional[int] = None,
+        part_type_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Отказы одним SELECT только по запрошенным полям (?fields=)
+        с тем же фильтром доступа, что и find_by_device_id / find_by_part_type_id.
+        """
+        async with read_session_maker() as session:
             q = (
-                select(cls.model)
-                .join(cls.model.device)
-                .join(Device.current_location)
-                .where(cls.model.id == id_)
+                FAILURE_FIELDS.select(fields, require=("device.current_location",))
                 .where(Location.created_by == creator_id)
-                .options(
-                    selectinload(cls.model.part_type),
-                    selectinload(cls.model.device),
-                )
+                .order_by(cls.model.failure_date.desc())
             )
+            if device_id is not None:
+                q = q.where(cls.model.device_id == device_id)
+            if part_type_id is not None:
+                q = q.where(cls.model.part_type_id == part_type_id)
             result = await session.execute(q)
-            return result.scalars().first()
+            return FAILURE_FIELDS.to_dicts(result, fields)
 
     @classmethod
-    async def find_all_by_creator_id(cls, *, creator_id: int) -> List[FailureRecord]:
-        async with async_session_maker() as session:
+    async def find_by_id(cls, id_: Any, *, creator_id: int) -> Optional[FailureRecord]:
+        async with read_session_maker() as session:
             q = (
                 select(cls.model)
                 .join(cls.model.device)
                 .join(Device.current_location)
+                .where(cls.model.id == id_)
                 .where(Location.created_by == creator_id)
                 .options(
                     selectinload(cls.model.part_type),
                     selectinload(cls.model.device),
                 )
-                .order_by(cls.model.failure_date.desc())
             )
             result = await session.execute(q)
+            return result.scalars().first()
+
+    @classmethod
+    async def find_all_by_creator_id(
+        cls, *, creator_id: int, offset: int = 0, limit: Optional[int] = None
+    ) -> List[FailureRecord]:
+        async with read_session_maker() as session:
+            q = cls._by_creator_query(creator_id).offset(offset).limit(limit)
+            result = await session.execute(q)
             return result.scalars().all()
 
+    @classmethod
+    def stream_by_creator_id(
+        cls, *, creator_id: int, offset: int = 0, limit: Optional[int] = None
+    ) -> AsyncIterator[Sequence[FailureRecord]]:
+        """Отказы на локациях пользователя пачками из курсора, новые первыми."""
+        return cls.stream_scalars(
+            cls._by_creator_query(creator_id).offset(offset).limit(limit)
+        )
+
+    @classmethod
+    def _by_creator_query(cls, creator_id: int) -> Select:
+        return (
+            select(cls.model)
+            .join(cls.model.device)
+            .join(Device.current_location)
+            .where(Location.created_by == creator_id)
+            .options(
+                selectinload(cls.model.part_type),
+                selectinload(cls.model.device),
+            )
+            .order_by(cls.model.failure_date.desc())
+        )
+
     @classmethod
     async def count_all(cls) -> int:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             result = await session.execute(select(func.count(cls.model.id)))
             return result.scalar()
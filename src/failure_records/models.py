@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, BigInteger, ForeignKey, Date, Text
+from sqlalchemy import Column, BigInteger, ForeignKey, Date, Text, Index
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -17,5 +17,9 @@ class FailureRecord(Base):
     resolved_date = Column(Date)
     description = Column(Text)
 
+    __table_args__ = (
+        Index('ix_failure_records_device_id_failure_date', device_id, failure_date),
+    )
+
     device = relationship('Device', back_populates='failure_records')  
     part_type = relationship('PartType', back_populates='failure_records')  
\ No newline at end of file
@@ -1,15 +1,24 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, Response
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
+from src.admission import export_limiter, limit_large_pages
 from src.auth.dependencies import get_current_user
-from src.failure_records.dao import FailureRecordDAO
+from src.failure_records.dao import FAILURE_FIELDS, FailureRecordDAO
 from src.failure_records.schemas import (
     SFailureRecordRead,
     SFailureRecordCreate,
     SFailureRecordUpdate
 )
 from src.devices.dao import DeviceDAO
+from src.schemas.responses import (
+    NegotiatedResponse,
+    NDJSON_LIMIT_DESCRIPTION,
+    ndjson_limit,
+    ndjson_response,
+    orm_list_response,
+    wants_ndjson,
+)
 
 router = APIRouter(
     tags=["Записи об отказах"],
@@ -23,16 +32,24 @@ router = APIRouter(
 )
 async def list_failures_by_device(
     device_id: int,
+    fields: Optional[str] = Query(None, description=FAILURE_FIELDS.description),
     current_user=Depends(get_current_user),
 ) -> List[SFailureRecordRead]:
+    field_names = FAILURE_FIELDS.parse(fields)
     device = await DeviceDAO.find_by_id(device_id, creator_id=current_user.id)
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
     try:
+        if field_names is not None:
+            return NegotiatedResponse(
+                await FailureRecordDAO.find_projected(
+                    field_names, creator_id=current_user.id, device_id=device_id
+                )
+            )
         recs = await FailureRecordDAO.find_by_device_id(
             device_id, creator_id=current_user.id
         )
-        return [SFailureRecordRead.model_validate(r) for r in recs]
+        return orm_list_response(SFailureRecordRead, recs)
     except ValidationError:
         raise HTTPException(500, "Error serializing failure records")
     except SQLAlchemyError:
@@ -45,18 +62,54 @@ async def list_failures_by_device(
 )
 async def list_failures_by_part_type(
     part_type_id: int,
+    fields: Optional[str] = Query(None, description=FAILURE_FIELDS.description),
     current_user=Depends(get_current_user),
 ) -> List[SFailureRecordRead]:
+    field_names = FAILURE_FIELDS.parse(fields)
     try:
+        if field_names is not None:
+            return NegotiatedResponse(
+                await FailureRecordDAO.find_projected(
+                    field_names, creator_id=current_user.id, part_type_id=part_type_id
+                )
+            )
         recs = await FailureRecordDAO.find_by_part_type_id(
             part_type_id, creator_id=current_user.id
         )
-        return [SFailureRecordRead.model_validate(r) for r in recs]
+        return orm_list_response(SFailureRecordRead, recs)
     except ValidationError:
         raise HTTPException(500, "Error serializing failure records")
     except SQLAlchemyError:
         raise HTTPException(500, "Database error while listing failures")
 
+@router.get(
+    "/failure-records",
+    response_model=List[SFailureRecordRead],
+    summary="Отказы устройств на моих локациях",
+)
+async def list_my_failure_records(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000, description=NDJSON_LIMIT_DESCRIPTION),
+    current_user=Depends(get_current_user),
+    admission: None = Depends(limit_large_pages),
+) -> List[SFailureRecordRead]:
+    if wants_ndjson(request):
+        return await ndjson_response(
+            SFailureRecordRead,
+            FailureRecordDAO.stream_by_creator_id(
+                creator_id=current_user.id,
+                offset=offset,
+                limit=ndjson_limit(request, limit),
+            ),
+            limiter=export_limiter,
+        )
+    records = await FailureRecordDAO.find_all_by_creator_id(
+        creator_id=current_user.id, offset=offset, limit=limit
+    )
+    return orm_list_response(SFailureRecordRead, records)
+
+
 @router.post(
     "/failure-records",
     response_model=SFailureRecordRead,
@@ -1,10 +1,15 @@
 from datetime import date
-from typing import Optional, List
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from src.database import async_session_maker
+from typing import Any, Dict, Optional, List
+from sqlalchemy import Integer, cast, except_, func, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import selectinload, with_expression
+from src.database import read_session_maker
 from src.inventory_events.models import InventoryEvent
+from src.inventory_items.models import InventoryItem
+from src.devices.models import Device
+from src.locations.utils import location_subtree_cte
 from src.dao.base import BaseDAO
+from src.dao.jsonb import jsonb_rows
 
 
 class InventoryEventDAO(BaseDAO):
@@ -22,34 +27,85 @@ class InventoryEventDAO(BaseDAO):
         offset: int = 0,
         limit: int = 100
     ) -> List[InventoryEvent]:
-        async with async_session_maker() as session:
-            query = select(cls.model).options(
-                selectinload(cls.model.location),
-                selectinload(cls.model.performed_by_user),
-                selectinload(cls.model.items),
-            )
+        """
+        Страница событий со сводкой по позициям вместо самих позиций.
+
+        Сводка считается группирующим подзапросом только по событиям страницы:
+        сначала (event, condition) -> count, затем свёртка по событию
+        в total / found / not_found и jsonb {condition: count}.
+        """
+        async with read_session_maker() as session:
+            page = select(cls.model.id)
 
             # Применяем фильтры
             if date_from:
-                query = query.where(cls.model.event_date >= date_from)
+                page = page.where(cls.model.event_date >= date_from)
             if date_to:
-                query = query.where(cls.model.event_date <= date_to)
+                page = page.where(cls.model.event_date <= date_to)
             if location_id:
-                query = query.where(cls.model.location_id == location_id)
+                page = page.where(cls.model.location_id == location_id)
 
             # Фильтруем по пользователю только если не админ
             if not is_admin:
-                query = query.where(cls.model.performed_by == user_id)
+                page = page.where(cls.model.performed_by == user_id)
+
+            page = (
+                page.order_by(cls.model.event_date.desc(), cls.model.id.desc())
+                .offset(offset)
+                .limit(limit)
+                .cte("page")
+            )
 
-            # Добавляем пагинацию в конце
-            query = query.offset(offset).limit(limit)
+            by_condition = (
+                select(
+                    InventoryItem.inventory_event_id.label("event_id"),
+                    InventoryItem.condition.label("condition"),
+                    func.count().label("total"),
+                    func.count().filter(InventoryItem.found.is_(True)).label("found"),
+                )
+                .where(InventoryItem.inventory_event_id.in_(select(page.c.id)))
+                .group_by(InventoryItem.inventory_event_id, InventoryItem.condition)
+                .subquery("by_condition")
+            )
+            counts = (
+                select(
+                    by_condition.c.event_id,
+                    cast(func.sum(by_condition.c.total), Integer).label("total"),
+                    cast(func.sum(by_condition.c.found), Integer).label("found"),
+                    func.jsonb_object_agg(by_condition.c.condition, by_condition.c.total)
+                    .filter(by_condition.c.condition.is_not(None))
+                    .label("by_condition"),
+                )
+                .group_by(by_condition.c.event_id)
+                .subquery("counts")
+            )
+
+            total = func.coalesce(counts.c.total, 0)
+            found = func.coalesce(counts.c.found, 0)
+            query = (
+                select(cls.model)
+                .join(page, page.c.id == cls.model.id)
+                .outerjoin(counts, counts.c.event_id == cls.model.id)
+                .options(
+                    selectinload(cls.model.location),
+                    selectinload(cls.model.performed_by_user),
+                    with_expression(cls.model.items_total, total),
+                    with_expression(cls.model.items_found, found),
+                    with_expression(cls.model.items_not_found, total - found),
+                    with_expression(
+                        cls.model.items_by_condition,
+                        func.coalesce(counts.c.by_condition, func.jsonb_build_object(), type_=JSONB),
+                    ),
+                )
+                .order_by(cls.model.event_date.desc(), cls.model.id.desc())
+            )
 
             result = await session.execute(query)
             return result.scalars().all()
 
     @classmethod
     async def find_by_id(cls, id_: int) -> Optional[InventoryEvent]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = (
                 select(cls.model)
                 .where(cls.model.id == id_)
@@ -61,3 +117,90 @@ class InventoryEventDAO(BaseDAO):
             )
             result = await session.execute(query)
             return result.scalars().first()
+
+    @classmethod
+    async def get_reconciliation(
+        cls,
+        event: InventoryEvent,
+        *,
+        include_descendants: bool = False,
+        details: bool = True,
+        limit: int = 500,
+    ) -> Dict[str, Any]:
+        """
+        Сверка инвентаризации с учётом устройств в локации события.
+
+        expected — устройства, которые сейчас числятся в локации (и её потомках
+        при include_descendants), кроме списанных; found — позиции события,
+        отмеченные как найденные (позиция с found = false — это отметка
+        «не найдено», а не сканирование). missing = expected EXCEPT found,
+        foreign = found EXCEPT expected —
+        считаются в SQL одним запросом, списки ограничены limit.
+        Прогресс (scanned_count / found_count) берётся из счётчиков события,
+        которые ведёт триггер, поэтому details=False — это один индексный COUNT.
+        """
+        if include_descendants:
+            subtree = location_subtree_cte(event.location_id)
+            in_scope = Device.current_location_id.in_(select(subtree.c.id))
+        else:
+            in_scope = Device.current_location_id == event.location_id
+        expected = (
+            select(Device.id)
+            .where(in_scope, Device.status != "decommissioned")
+            .cte("expected")
+        )
+        expected_count = select(func.count()).select_from(expected).scalar_subquery()
+
+        columns = [expected_count.label("expected_count")]
+        if details:
+            found = (
+                select(InventoryItem.device_id.label("id"))
+                .where(
+                    InventoryItem.inventory_event_id == event.id,
+                    InventoryItem.found.is_(True),
+                )
+                .cte("found")
+            )
+            missing = except_(select(expected.c.id), select(found.c.id)).cte("missing")
+            foreign = except_(select(found.c.id), select(expected.c.id)).cte("foreign_found")
+
+            def device_list(ids):
+                return jsonb_rows(
+                    select(Device.id, Device.serial_number, Device.status, Device.current_location_id)
+                    .join(ids, ids.c.id == Device.id)
+                    .order_by(Device.id)
+                    .limit(limit),
+                    lambda rows: rows.c.id,
+                )
+
+            columns += [
+                select(func.count()).select_from(missing).scalar_subquery().label("missing_count"),
+                select(func.count()).select_from(foreign).scalar_subquery().label("foreign_count"),
+                device_list(missing).label("missing"),
+                device_list(foreign).label("foreign"),
+            ]
+
+        async with read_session_maker() as session:
+            row = (await session.execute(select(*columns))).mappings().one()
+
+        result = {
+            "event_id": event.id,
+            "location_id": event.location_id,
+            "include_descendants": include_descendants,
+            "expected_count": row["expected_count"],
+            "scanned_count": event.scanned_count,
+            "found_count": event.found_count,
+            "not_found_count": event.scanned_count - event.found_count,
+            "progress": (
+                min(event.scanned_count / row["expected_count"], 1.0)
+                if row["expected_count"]
+                else None
+            ),
+            "missing_count": None,
+            "foreign_count": None,
+            "missing": [],
+            "foreign": [],
+        }
+        if details:
+            result.update({key: row[key] for key in ("missing_count", "foreign_count", "missing", "foreign")})
+        return result
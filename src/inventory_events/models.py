@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, BigInteger, ForeignKey, Date, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, ForeignKey, Date, Integer, Text
+from sqlalchemy.orm import query_expression, relationship
 from src.database import Base
 
 if TYPE_CHECKING:
@@ -16,6 +16,15 @@ class InventoryEvent(Base):
     location_id = Column(BigInteger, ForeignKey('locations.id'), nullable=False)
     performed_by = Column(BigInteger, ForeignKey('users.id'))
     notes = Column(Text)
+    # Счётчики по inventory_items, ведутся триггером inventory_item_counters
+    scanned_count = Column(Integer, nullable=False, server_default='0')
+    found_count = Column(Integer, nullable=False, server_default='0')
+
+    # Сводка по позициям; заполняется только в InventoryEventDAO.find_all
+    items_total = query_expression()
+    items_found = query_expression()
+    items_not_found = query_expression()
+    items_by_condition = query_expression()
 
     location = relationship('Location', back_populates='inventory_events') 
     performed_by_user = relationship('User', back_populates='inventory_events')  
@@ -1,13 +1,17 @@
 from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from src.admission import limit_large_pages
 from src.auth.dependencies import get_current_user
 from src.inventory_events.dao import InventoryEventDAO
 from src.inventory_events.schemas import (
     SInventoryEventRead,
+    SInventoryEventSummary,
     SInventoryEventCreate,
     SInventoryEventUpdate,
+    SInventoryReconciliation,
 )
+from src.schemas.responses import NegotiatedResponse, orm_list_response
 
 router = APIRouter(
     prefix="/inventory-events",
@@ -17,8 +21,8 @@ router = APIRouter(
 
 @router.get(
     "/",
-    response_model=List[SInventoryEventRead],
-    summary="Список всех инвентаризаций",
+    response_model=List[SInventoryEventSummary],
+    summary="Список инвентаризаций со сводкой по позициям",
     dependencies=[Depends(get_current_user)],
 )
 async def list_inventory_events(
@@ -28,7 +32,8 @@ async def list_inventory_events(
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     current_user=Depends(get_current_user),
-) -> List[SInventoryEventRead]:
+    admission: None = Depends(limit_large_pages),
+) -> List[SInventoryEventSummary]:
     events = await InventoryEventDAO.find_all(
         date_from=date_from,
         date_to=date_to,
@@ -38,7 +43,7 @@ async def list_inventory_events(
         offset=offset,
         limit=limit,
     )
-    return [SInventoryEventRead.model_validate(e) for e in events]
+    return orm_list_response(SInventoryEventSummary, events)
 
 
 @router.get(
@@ -56,6 +61,35 @@ async def get_inventory_event(event_id: int) -> SInventoryEventRead:
     return SInventoryEventRead.model_validate(event)
 
 
+@router.get(
+    "/{event_id}/reconciliation",
+    response_model=SInventoryReconciliation,
+    summary="Сверка: ожидаемые и отсканированные устройства",
+    dependencies=[Depends(get_current_user)],
+)
+async def get_inventory_reconciliation(
+    event_id: int,
+    include_descendants: bool = Query(
+        False, description="Учитывать устройства во вложенных локациях"
+    ),
+    details: bool = Query(
+        True, description="false — только счётчики прогресса, без списков расхождений"
+    ),
+    limit: int = Query(500, ge=1, le=5000, description="Максимум устройств в каждом списке"),
+    admission: None = Depends(limit_large_pages),
+) -> SInventoryReconciliation:
+    # без подгрузки items: нужны только локация и счётчики события
+    event = await InventoryEventDAO.find_one_or_none(id=event_id)
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
+        )
+    reconciliation = await InventoryEventDAO.get_reconciliation(
+        event, include_descendants=include_descendants, details=details, limit=limit
+    )
+    return NegotiatedResponse(reconciliation)
+
+
 @router.post(
     "/",
     response_model=SInventoryEventRead,
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Optional, List
+from typing import Dict, Optional, List
 from src.schemas.base import OrmModel
 
 class SInventoryEventBase(OrmModel):
@@ -36,4 +36,38 @@ class SInventoryEventRead(OrmModel):
     location: SLocationMinimal
     performed_by_user: Optional[SUserMinimal]
     notes: Optional[str]
-    items: List[SInventoryItemMinimal] = []
\ No newline at end of file
+    items: List[SInventoryItemMinimal] = []
+
+class SReconciliationDevice(OrmModel):
+    id: int
+    serial_number: str
+    status: str
+    current_location_id: Optional[int]
+
+class SInventoryReconciliation(OrmModel):
+    event_id: int
+    location_id: int
+    include_descendants: bool
+    expected_count: int
+    scanned_count: int
+    found_count: int
+    not_found_count: int
+    # scanned_count / expected_count, не больше 1; None — в локации нет устройств
+    progress: Optional[float]
+    # None, если запрошена только сводка (details=false)
+    missing_count: Optional[int]
+    foreign_count: Optional[int]
+    missing: List[SReconciliationDevice]
+    foreign: List[SReconciliationDevice]
+
+class SInventoryEventSummary(OrmModel):
+    id: int
+    event_date: date
+    location: SLocationMinimal
+    performed_by_user: Optional[SUserMinimal]
+    notes: Optional[str]
+    items_total: int
+    items_found: int
+    items_not_found: int
+    # {condition: количество позиций}; позиции без condition сюда не входят
+    items_by_condition: Dict[str, int]
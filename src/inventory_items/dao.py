@@ -1,6 +1,33 @@
-from typing import Type
+from typing import List, Optional, Type
+from sqlalchemy import select
 from src.dao.base import BaseDAO
+from src.database import read_session_maker
 from src.inventory_items.models import InventoryItem
 
 class InventoryItemDAO(BaseDAO):
     model: Type[InventoryItem] = InventoryItem
+
+    @classmethod
+    async def find_by_event(
+        cls,
+        event_id: int,
+        *,
+        found: Optional[bool] = None,
+        condition: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> List[InventoryItem]:
+        async with read_session_maker() as session:
+            query = (
+                select(cls.model)
+                .where(cls.model.inventory_event_id == event_id)
+                .order_by(cls.model.id)
+                .offset(offset)
+                .limit(limit)
+            )
+            if found is not None:
+                query = query.where(cls.model.found == found)
+            if condition is not None:
+                query = query.where(cls.model.condition == condition)
+            result = await session.execute(query)
+            return result.scalars().all()
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, BigInteger, ForeignKey, Boolean, String, Text
+from sqlalchemy import Column, BigInteger, ForeignKey, Boolean, String, Text, Index
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -12,10 +12,14 @@ class InventoryItem(Base):
 
     id = Column(BigInteger, primary_key=True)
     inventory_event_id = Column(BigInteger, ForeignKey('inventory_events.id'), nullable=False)
-    device_id = Column(BigInteger, ForeignKey('devices.id'), nullable=False)
+    device_id = Column(BigInteger, ForeignKey('devices.id'), nullable=False, index=True)
     found = Column(Boolean, nullable=False)
     condition = Column(String(50))
     comments = Column(Text)
 
+    __table_args__ = (
+        Index('ix_inventory_items_event_id_device_id', inventory_event_id, device_id),
+    )
+
     event = relationship('InventoryEvent', back_populates='items') 
     device = relationship('Device', back_populates='inventory_items')  
\ No newline at end of file
@@ -1,5 +1,6 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from src.admission import limit_large_pages
 from src.devices.dao import DeviceDAO
 from src.auth.dependencies import get_current_user
 from src.inventory_items.dao import InventoryItemDAO
@@ -9,10 +10,33 @@ from src.inventory_items.schemas import (
     SInventoryItemUpdate,
 )
 from src.inventory_events.dao import InventoryEventDAO
+from src.schemas.responses import orm_list_response
 
 router = APIRouter(tags=["Инвентаризация по устройству"])
 
 
+@router.get(
+    "/inventory-events/{event_id}/items",
+    response_model=List[SInventoryItemRead],
+    summary="Позиции инвентаризации (постранично)",
+)
+async def list_inventory_items(
+    event_id: int,
+    found: Optional[bool] = Query(None, description="Фильтр по признаку «найдено»"),
+    condition: Optional[str] = Query(None, description="Фильтр по состоянию"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user=Depends(get_current_user),
+    admission: None = Depends(limit_large_pages),
+) -> List[SInventoryItemRead]:
+    if not await InventoryEventDAO.find_one_or_none(id=event_id):
+        raise HTTPException(status_code=404, detail="InventoryEvent not found")
+    items = await InventoryItemDAO.find_by_event(
+        event_id, found=found, condition=condition, offset=offset, limit=limit
+    )
+    return orm_list_response(SInventoryItemRead, items)
+
+
 @router.post(
     "/inventory-events/{event_id}/items",
     response_model=SInventoryItemRead,
@@ -22,7 +46,7 @@ router = APIRouter(tags=["Инвентаризация по устройству
 async def create_inventory_item(
     event_id: int, data: SInventoryItemCreate, current_user=Depends(get_current_user)
 ) -> SInventoryItemRead:
-    event = await InventoryEventDAO.find_by_id(event_id)
+    event = await InventoryEventDAO.find_one_or_none(id=event_id)
     if not event:
         raise HTTPException(status_code=404, detail="InventoryEvent not found")
 
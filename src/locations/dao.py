@@ -1,16 +1,16 @@
-from typing import Type, Optional
+from typing import List, Sequence, Type, Optional
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from src.locations.models import Location
 from src.dao.base import BaseDAO
-from src.database import async_session_maker
+from src.database import read_session_maker
 
 class LocationDAO(BaseDAO):
     model: Type[Location] = Location
 
     @classmethod
     async def find_all(cls, **filters) -> list[Location]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = select(cls.model).options(
                 selectinload(cls.model.children),
                 selectinload(cls.model.devices)
@@ -22,10 +22,18 @@ class LocationDAO(BaseDAO):
 
     @classmethod
     async def find_by_id(cls, id_: int) -> Optional[Location]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = select(cls.model).where(cls.model.id == id_).options(
                 selectinload(cls.model.children),
                 selectinload(cls.model.devices)
             )
             result = await session.execute(query)
-            return result.scalars().first()
\ No newline at end of file
+            return result.scalars().first()
+
+    @classmethod
+    async def find_many(cls, ids: Sequence[int]) -> List[Location]:
+        """Локации по списку id вместе с дочерними локациями и устройствами."""
+        return await super().find_many(
+            ids,
+            options=[selectinload(cls.model.children), selectinload(cls.model.devices)],
+        )
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, BigInteger, String, Text, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Text, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -20,6 +20,16 @@ class Location(Base):
     children = relationship('Location', back_populates='parent')  # type: list["Location"]
     created_by  = Column(BigInteger, ForeignKey('users.id'), nullable=False)
 
+    __table_args__ = (
+        Index(
+            'ix_locations_name_trgm',
+            name,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+        Index('ix_locations_name_prefix', func.lower(name).collate('C'), id),
+    )
+
     devices = relationship('Device', back_populates='current_location')  # type: list["Device"]
     movements_from = relationship(
         'Movement', back_populates='from_location', foreign_keys='Movement.from_location_id'
@@ -1,5 +1,5 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from src.auth.dependencies import get_current_admin_user, get_current_user
 from src.locations.dao import LocationDAO
 from src.locations.schemas import (
@@ -8,6 +8,7 @@ from src.locations.schemas import (
     SLocationUpdate,
 )
 from src.locations.utils import build_tree
+from src.schemas.many import IDS_DESCRIPTION, SManyRead, orm_many_response, parse_ids
 
 router = APIRouter(
     prefix="/locations",
@@ -20,6 +21,18 @@ async def list_locations() -> List[SLocationRead]:
     all_locs = await LocationDAO.find_all()
     return build_tree(all_locs)
 
+@router.get(
+    "/many",
+    response_model=SManyRead[SLocationRead],
+    summary="Несколько локаций по ID",
+)
+async def get_locations_many(
+    ids: str = Query(..., description=IDS_DESCRIPTION),
+) -> SManyRead[SLocationRead]:
+    requested = parse_ids(ids)
+    items = await LocationDAO.find_many(requested)
+    return orm_many_response(SLocationRead, items, requested)
+
 @router.get("/{location_id}", response_model=SLocationRead, summary="Информация по локации")
 async def get_location(location_id: int) -> SLocationRead:
     loc = await LocationDAO.find_by_id(location_id)
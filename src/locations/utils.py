@@ -1,4 +1,6 @@
 from typing import List, Dict
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
 from src.locations.schemas import SLocationRead
 from src.locations.models import Location
 
@@ -18,4 +20,34 @@ def build_tree(loc_models: List[Location]) -> List[SLocationRead]:
             schema_map[sch.parent_id].children.append(sch)
         else:
             tree.append(sch)
-    return tree
\ No newline at end of file
+    return tree
+
+
+def location_roots_cte():
+    """
+    Рекурсивный CTE (id, root_id): для каждой локации — id её корневой локации.
+    """
+    roots = (
+        select(Location.id.label("id"), Location.id.label("root_id"))
+        .where(Location.parent_id.is_(None))
+        .cte("location_roots", recursive=True)
+    )
+    child = aliased(Location)
+    return roots.union_all(
+        select(child.id, roots.c.root_id).join(roots, child.parent_id == roots.c.id)
+    )
+
+
+def location_subtree_cte(location_id: int):
+    """
+    Рекурсивный CTE (id): локация location_id и все её потомки.
+    """
+    subtree = (
+        select(Location.id.label("id"))
+        .where(Location.id == location_id)
+        .cte("location_subtree", recursive=True)
+    )
+    child = aliased(Location)
+    return subtree.union_all(
+        select(child.id).join(subtree, child.parent_id == subtree.c.id)
+    )
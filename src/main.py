@@ -24,6 +24,10 @@ from src.write_off_reports.router import router as router_reports
 from src.analytics.router import router as router_analytics
 from src.users.router import router as router_users
 from src.stats.router import router as router_stats
+from src.batch.router import router as router_batch
+from src.search.router import router as router_search
+from src.exports.router import router as router_exports
+from src.reports.router import router as router_report_jobs
 from src.adminpanel.views import (
     UserAdmin,
     DeviceAdmin,
@@ -40,19 +44,36 @@ from src.adminpanel.views import (
 )
 from src.adminpanel.auth import authentication_backend
 from src.database import engine
-from src.tasks.warranty_suggestions import start_scheduler
+from src.schemas.responses import NegotiatedResponse
+from src.middleware import (
+    CancelOnDisconnectMiddleware,
+    ContentNegotiationMiddleware,
+    ReadYourWritesMiddleware,
+)
+from src.tasks.scheduler import start_scheduler
+from src.pubsub.invalidation import register_invalidation_bus
+from src.pubsub.listener import pg_listener
+from src.reports.worker import register_report_workers, report_workers
+from src.stats.live import register_dashboard_events
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     scheduler = start_scheduler()
+    register_dashboard_events(pg_listener)
+    register_invalidation_bus(pg_listener)
+    register_report_workers(pg_listener)
+    pg_listener.start()
+    report_workers.start()
     try:
         yield
     finally:
+        await report_workers.stop()
+        await pg_listener.stop()
         scheduler.shutdown()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=NegotiatedResponse)
 
 app.include_router(router_auth)
 app.include_router(router_users)
@@ -70,6 +91,10 @@ app.include_router(router_replacement_suggestions)
 app.include_router(router_reports)
 app.include_router(router_analytics)
 app.include_router(router_stats)
+app.include_router(router_search)
+app.include_router(router_exports)
+app.include_router(router_report_jobs)
+app.include_router(router_batch)
 
 admin = Admin(app, engine, authentication_backend=authentication_backend)
 
@@ -95,6 +120,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(CancelOnDisconnectMiddleware)
+app.add_middleware(ContentNegotiationMiddleware)
 
 datacenter_load_gauge = Gauge("datacenter_load", "Current datacenter load", ["hour"])
 backend_action_counter = Counter(
@@ -1,10 +1,50 @@
 from datetime import date
-from typing import Optional, List, Type
+from typing import Any, Dict, Optional, List, Type
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
-from src.database import async_session_maker
+from src.database import read_session_maker
 from src.dao.base import BaseDAO
+from src.dao.fields import FieldSet
+from src.dao.filters import NO_CRITERIA, FilterSet, ListCriteria
+from src.devices.models import Device
 from src.maintenance_tasks.models import MaintenanceTask
+from src.users.models import User
+
+
+MAINTENANCE_FIELDS = FieldSet(
+    MaintenanceTask,
+    fields={
+        "id": MaintenanceTask.id,
+        "device_id": MaintenanceTask.device_id,
+        "task_type": MaintenanceTask.task_type,
+        "scheduled_date": MaintenanceTask.scheduled_date,
+        "completed_date": MaintenanceTask.completed_date,
+        "status": MaintenanceTask.status,
+        "assigned_to": MaintenanceTask.assigned_to,
+        "notes": MaintenanceTask.notes,
+        "device.id": Device.id,
+        "device.serial_number": Device.serial_number,
+        "assigned_user.id": User.id,
+        "assigned_user.full_name": User.full_name,
+    },
+    joins={
+        "device": (Device, Device.id, MaintenanceTask.device_id),
+        "assigned_user": (User, User.id, MaintenanceTask.assigned_to),
+    },
+)
+
+MAINTENANCE_FILTERS = FilterSet(
+    MaintenanceTask,
+    fields={
+        "id": MaintenanceTask.id,
+        "device_id": MaintenanceTask.device_id,
+        "task_type": MaintenanceTask.task_type,
+        "scheduled_date": MaintenanceTask.scheduled_date,
+        "completed_date": MaintenanceTask.completed_date,
+        "status": MaintenanceTask.status,
+        "assigned_to": MaintenanceTask.assigned_to,
+    },
+)
 
 
 class MaintenanceTaskDAO(BaseDAO):
@@ -23,8 +63,9 @@ class MaintenanceTaskDAO(BaseDAO):
         is_admin: bool = False,
         offset: int = 0,
         limit: int = 100,
+        criteria: ListCriteria = NO_CRITERIA,
     ) -> List[MaintenanceTask]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = (
                 select(cls.model)
                 .options(
@@ -34,24 +75,76 @@ class MaintenanceTaskDAO(BaseDAO):
                 .offset(offset)
                 .limit(limit)
             )
-            if device_id is not None:
-                query = query.where(cls.model.device_id == device_id)
-            if assigned_to is not None:
-                query = query.where(cls.model.assigned_to == assigned_to)
-            if status is not None:
-                query = query.where(cls.model.status == status)
-            if scheduled_from is not None:
-                query = query.where(cls.model.scheduled_date >= scheduled_from)
-            if scheduled_to is not None:
-                query = query.where(cls.model.scheduled_date <= scheduled_to)
-            if not is_admin and creator_user_id is not None:
-                query = query.where(cls.model.assigned_to == creator_user_id)
-            result = await session.execute(query)
+            query = query.where(
+                *cls._list_filters(
+                    device_id, assigned_to, status, scheduled_from, scheduled_to,
+                    creator_user_id, is_admin,
+                )
+            )
+            result = await session.execute(criteria.apply(query))
             return result.scalars().all()
 
+    @classmethod
+    def _list_filters(
+        cls,
+        device_id: Optional[int],
+        assigned_to: Optional[int],
+        status: Optional[str],
+        scheduled_from: Optional[date],
+        scheduled_to: Optional[date],
+        creator_user_id: Optional[int],
+        is_admin: bool,
+    ) -> list:
+        filters = []
+        if device_id is not None:
+            filters.append(cls.model.device_id == device_id)
+        if assigned_to is not None:
+            filters.append(cls.model.assigned_to == assigned_to)
+        if status is not None:
+            filters.append(cls.model.status == status)
+        if scheduled_from is not None:
+            filters.append(cls.model.scheduled_date >= scheduled_from)
+        if scheduled_to is not None:
+            filters.append(cls.model.scheduled_date <= scheduled_to)
+        if not is_admin and creator_user_id is not None:
+            filters.append(cls.model.assigned_to == creator_user_id)
+        return filters
+
+    @classmethod
+    async def find_all_projected(
+        cls,
+        fields: List[str],
+        *,
+        device_id: Optional[int] = None,
+        assigned_to: Optional[int] = None,
+        status: Optional[str] = None,
+        scheduled_from: Optional[date] = None,
+        scheduled_to: Optional[date] = None,
+        creator_user_id: Optional[int] = None,
+        is_admin: bool = False,
+        offset: int = 0,
+        limit: int = 100,
+        criteria: ListCriteria = NO_CRITERIA,
+    ) -> List[Dict[str, Any]]:
+        """Задачи одним SELECT только по запрошенным полям (?fields=)."""
+        async with read_session_maker() as session:
+            query = (
+                MAINTENANCE_FIELDS.select(fields)
+                .where(
+                    *cls._list_filters(
+                        device_id, assigned_to, status, scheduled_from, scheduled_to,
+                        creator_user_id, is_admin,
+                    )
+                )
+                .offset(offset)
+                .limit(limit)
+            )
+            result = await session.execute(criteria.apply(query))
+            return MAINTENANCE_FIELDS.to_dicts(result, fields)
+
     @classmethod
     async def find_by_id(cls, id_: int) -> Optional[MaintenanceTask]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = (
                 select(cls.model)
                 .where(cls.model.id == id_)
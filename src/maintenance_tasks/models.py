@@ -11,12 +11,12 @@ class MaintenanceTask(Base):
     __tablename__ = 'maintenance_tasks'
 
     id = Column(BigInteger, primary_key=True)
-    device_id = Column(BigInteger, ForeignKey('devices.id'), nullable=False)
+    device_id = Column(BigInteger, ForeignKey('devices.id'), nullable=False, index=True)
     task_type = Column(String(100), nullable=False)
-    scheduled_date = Column(Date, nullable=False)
+    scheduled_date = Column(Date, nullable=False, index=True)
     completed_date = Column(Date)
-    status = Column(String(20), nullable=False)
-    assigned_to = Column(BigInteger, ForeignKey('users.id'))
+    status = Column(String(20), nullable=False, index=True)
+    assigned_to = Column(BigInteger, ForeignKey('users.id'), index=True)
     notes = Column(Text)
 
     device = relationship('Device', back_populates='maintenance_tasks')  
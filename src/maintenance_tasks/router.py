@@ -1,14 +1,20 @@
 from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from src.admission import limit_large_pages
 from src.devices.dao import DeviceDAO
 from src.auth.dependencies import get_current_user
-from src.maintenance_tasks.dao import MaintenanceTaskDAO
+from src.maintenance_tasks.dao import (
+    MAINTENANCE_FIELDS,
+    MAINTENANCE_FILTERS,
+    MaintenanceTaskDAO,
+)
 from src.maintenance_tasks.schemas import (
     SMaintenanceTaskRead,
     SMaintenanceTaskCreate,
     SMaintenanceTaskUpdate,
 )
+from src.schemas.responses import NegotiatedResponse, orm_list_response
 
 router = APIRouter(
     prefix="/maintenance-tasks",
@@ -29,9 +35,16 @@ async def list_tasks(
     scheduled_to: Optional[date] = Query(None, description="Дата конца"),
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    fields: Optional[str] = Query(None, description=MAINTENANCE_FIELDS.description),
+    conditions: List[str] = Query(
+        [], alias="filter", description=MAINTENANCE_FILTERS.description
+    ),
+    sort: Optional[str] = Query(None, description=MAINTENANCE_FILTERS.sort_description),
     current_user=Depends(get_current_user),
+    admission: None = Depends(limit_large_pages),
 ) -> List[SMaintenanceTaskRead]:
-    tasks = await MaintenanceTaskDAO.find_all(
+    field_names = MAINTENANCE_FIELDS.parse(fields)
+    filters = dict(
         device_id=device_id,
         assigned_to=assigned_to,
         status=status,
@@ -39,10 +52,17 @@ async def list_tasks(
         scheduled_to=scheduled_to,
         creator_user_id=current_user.id,
         is_admin=current_user.role == "admin",
+        criteria=MAINTENANCE_FILTERS.parse(conditions, sort),
         offset=offset,
         limit=limit,
     )
-    return [SMaintenanceTaskRead.model_validate(t) for t in tasks]
+    if field_names is not None:
+        return NegotiatedResponse(
+            await MaintenanceTaskDAO.find_all_projected(field_names, **filters)
+        )
+
+    tasks = await MaintenanceTaskDAO.find_all(**filters)
+    return orm_list_response(SMaintenanceTaskRead, tasks)
 
 
 @router.get(
@@ -0,0 +1,172 @@
+import asyncio
+import time
+from http.cookies import SimpleCookie
+from typing import Collection
+
+from prometheus_client import Counter
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+from src.database import ReadYourWrites, read_your_writes, replica_engines
+from src.schemas.responses import MSGPACK_MEDIA_TYPE, response_media_type
+
+READ_PRIMARY_COOKIE = "db_read_primary_until"
+
+http_requests_cancelled_counter = Counter(
+    "http_requests_cancelled_total",
+    "Requests whose handler was cancelled because the client disconnected",
+    ["route"],
+)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Привязка чтений клиента к основной БД после его собственной записи.
+
+    Если запрос что-то записал, ответ ставит cookie со временем окончания окна
+    db_read_your_writes_seconds; пока окно не истекло, чтения этого клиента
+    идут в основную БД, а не на отстающую реплику. Без реплик ничего не делает.
+    """
+
+    def __init__(self, app: ASGIApp, window: float = settings.db_read_your_writes_seconds):
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not replica_engines:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            until = float(HTTPConnection(scope).cookies.get(READ_PRIMARY_COOKIE, 0))
+        except ValueError:
+            until = 0.0
+        state = ReadYourWrites(sticky=until > time.time())
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.wrote:
+                cookie = SimpleCookie()
+                cookie[READ_PRIMARY_COOKIE] = f"{time.time() + self.window:.3f}"
+                cookie[READ_PRIMARY_COOKIE]["max-age"] = int(self.window) + 1
+                cookie[READ_PRIMARY_COOKIE]["path"] = "/"
+                cookie[READ_PRIMARY_COOKIE]["httponly"] = True
+                cookie[READ_PRIMARY_COOKIE]["samesite"] = "lax"
+                MutableHeaders(scope=message).append(
+                    "set-cookie", cookie.output(header="").strip()
+                )
+            await send(message)
+
+        token = read_your_writes.set(state)
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            read_your_writes.reset(token)
+
+
+def _accepts(accept: str, media_types: Collection[str]) -> bool:
+    """Есть ли среди типов заголовка Accept один из media_types с q > 0."""
+    for item in accept.split(","):
+        media_type, *params = item.split(";")
+        if media_type.strip().lower() not in media_types:
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+class ContentNegotiationMiddleware:
+    """
+    Выбирает формат тела ответа по заголовку Accept: MessagePack для клиентов,
+    явно его запросивших, иначе JSON. Выбор кладётся в response_media_type,
+    его читает NegotiatedResponse.
+    """
+
+    msgpack_media_types = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack"})
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = HTTPConnection(scope).headers.get("accept", "")
+        if not _accepts(accept, self.msgpack_media_types):
+            await self.app(scope, receive, send)
+            return
+
+        token = response_media_type.set(MSGPACK_MEDIA_TYPE)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_media_type.reset(token)
+
+
+class CancelOnDisconnectMiddleware:
+    """
+    Отменяет обработчик запроса, если клиент отключился, не дождавшись ответа.
+
+    Отмена задачи прерывает ожидающий запрос asyncpg: драйвер отправляет
+    серверу CancelRequest, и соединение возвращается в пул, а не держится
+    до конца тяжёлого запроса. Применяется только к безопасным методам:
+    прерванная запись откатится, но клиент не узнает, что именно произошло.
+
+    После отправки последнего куска тела сервер тоже отвечает на receive()
+    сообщением http.disconnect; такой обработчик (например, с фоновыми
+    задачами) дорабатывает до конца и не считается отменённым.
+    """
+
+    def __init__(self, app: ASGIApp, methods: Collection[str] = ("GET", "HEAD")):
+        self.app = app
+        self.methods = frozenset(methods)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+
+        # receive читает только наблюдатель, приложению сообщения передаются через очередь
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+
+        async def watch_disconnect() -> None:
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        response_complete = False
+
+        async def send_tracking(message: Message) -> None:
+            nonlocal response_complete
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+
+        handler = asyncio.create_task(self.app(scope, messages.get, send_tracking))
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await asyncio.wait({handler, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if not handler.done() and not response_complete:
+                handler.cancel()
+                route = getattr(scope.get("route"), "path", "unmatched")
+                http_requests_cancelled_counter.labels(route=route).inc()
+                try:
+                    await handler
+                except asyncio.CancelledError:
+                    pass
+                return
+            await handler
+        finally:
+            watcher.cancel()
+            if not handler.done():
+                handler.cancel()
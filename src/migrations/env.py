@@ -23,6 +23,8 @@ from src.maintenance_tasks.models import MaintenanceTask
 from src.write_off_reports.models import WriteOffReport
 from src.failure_records.models import FailureRecord
 from src.replacement_suggestions.models import ReplacementSuggestion
+from src.data_versions.models import DataVersion
+from src.stats.models import DeviceStatusSnapshot
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,71 @@
+"""Trigram and prefix search indexes
+
+Revision ID: 5b8f0c2d6e17
+Revises: a7d2e4f19c03
+Create Date: 2026-10-19 14:05:42.118304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8f0c2d6e17'
+down_revision: Union[str, None] = 'a7d2e4f19c03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = (
+    ('ix_devices_serial_number_trgm', 'devices', 'serial_number'),
+    ('ix_device_types_manufacturer_trgm', 'device_types', 'manufacturer'),
+    ('ix_device_types_model_trgm', 'device_types', 'model'),
+    ('ix_locations_name_trgm', 'locations', 'name'),
+)
+
+# lower(col) COLLATE "C": и LIKE 'abc%', и ORDER BY / keyset по одному индексу
+PREFIX_INDEXES = (
+    ('ix_devices_serial_number_prefix', 'devices', ['lower(serial_number) COLLATE "C"', 'id']),
+    ('ix_device_types_manufacturer_prefix', 'device_types', ['lower(manufacturer) COLLATE "C"']),
+    ('ix_device_types_model_prefix', 'device_types', ['lower(model) COLLATE "C"']),
+    # сортировка и keyset ветки device_type: заголовок «производитель модель»
+    (
+        'ix_device_types_title_prefix',
+        'device_types',
+        [
+            "lower(coalesce(manufacturer || ' ' || model, manufacturer, model, '')) COLLATE \"C\"",
+            'id',
+        ],
+    ),
+    ('ix_locations_name_prefix', 'locations', ['lower(name) COLLATE "C"', 'id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+    for name, table, expressions in PREFIX_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [sa.text(e) if '(' in e else e for e in expressions],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in (*PREFIX_INDEXES, *TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
+    # расширение pg_trgm не удаляем: им могут пользоваться другие объекты
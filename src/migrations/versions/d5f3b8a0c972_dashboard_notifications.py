@@ -0,0 +1,92 @@
+"""Dashboard change notifications
+
+Revision ID: d5f3b8a0c972
+Revises: e9a2f6c1d384
+Create Date: 2026-10-19 17:12:50.337105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f3b8a0c972'
+down_revision: Union[str, None] = 'e9a2f6c1d384'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOTIFY доставляется при COMMIT, откатившиеся изменения не шлют ничего.
+    # Статусы устройств: только факт изменения на оператор, счётчики
+    # пересчитывает приложение (с дебаунсом)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_device_status() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('dashboard_events', '{"type": "device_status"}');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER devices_notify_status "
+        "AFTER INSERT OR DELETE OR UPDATE OF status ON devices "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_device_status()"
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_failure_created() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('dashboard_events', json_build_object(
+                'type', 'failure_created',
+                'id', NEW.id,
+                'device_id', NEW.device_id,
+                'part_type_id', NEW.part_type_id,
+                'failure_date', NEW.failure_date
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER failure_records_notify_created "
+        "AFTER INSERT ON failure_records "
+        "FOR EACH ROW EXECUTE FUNCTION notify_failure_created()"
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_write_off_approved() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('dashboard_events', json_build_object(
+                'type', 'write_off_approved',
+                'id', NEW.id,
+                'device_id', NEW.device_id,
+                'approved_by', NEW.approved_by
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER write_off_reports_notify_approved "
+        "AFTER UPDATE OF approved_by ON write_off_reports "
+        "FOR EACH ROW WHEN (OLD.approved_by IS NULL AND NEW.approved_by IS NOT NULL) "
+        "EXECUTE FUNCTION notify_write_off_approved()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS write_off_reports_notify_approved ON write_off_reports")
+    op.execute("DROP FUNCTION IF EXISTS notify_write_off_approved()")
+    op.execute("DROP TRIGGER IF EXISTS failure_records_notify_created ON failure_records")
+    op.execute("DROP FUNCTION IF EXISTS notify_failure_created()")
+    op.execute("DROP TRIGGER IF EXISTS devices_notify_status ON devices")
+    op.execute("DROP FUNCTION IF EXISTS notify_device_status()")
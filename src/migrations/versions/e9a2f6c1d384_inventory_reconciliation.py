@@ -0,0 +1,79 @@
+"""Inventory event counters and reconciliation indexes
+
+Revision ID: e9a2f6c1d384
+Revises: c41d7a9e2b68
+Create Date: 2026-10-19 16:02:37.481920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a2f6c1d384'
+down_revision: Union[str, None] = 'c41d7a9e2b68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('inventory_events', sa.Column('scanned_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('inventory_events', sa.Column('found_count', sa.Integer(), server_default='0', nullable=False))
+    op.create_index(op.f('ix_devices_current_location_id'), 'devices', ['current_location_id'], unique=False)
+    op.create_index('ix_inventory_items_event_id_device_id', 'inventory_items', ['inventory_event_id', 'device_id'], unique=False)
+
+    op.execute(
+        """
+        UPDATE inventory_events e
+        SET scanned_count = c.scanned, found_count = c.found
+        FROM (
+            SELECT inventory_event_id,
+                   count(*) AS scanned,
+                   count(*) FILTER (WHERE found) AS found
+            FROM inventory_items
+            GROUP BY inventory_event_id
+        ) c
+        WHERE c.inventory_event_id = e.id
+        """
+    )
+    # Триггер уровня строки: прогресс текущей инвентаризации читается из
+    # inventory_events без подсчёта позиций
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION inventory_item_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE inventory_events
+                SET scanned_count = scanned_count - 1,
+                    found_count = found_count - OLD.found::int
+                WHERE id = OLD.inventory_event_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE inventory_events
+                SET scanned_count = scanned_count + 1,
+                    found_count = found_count + NEW.found::int
+                WHERE id = NEW.inventory_event_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER inventory_items_counters "
+        "AFTER INSERT OR DELETE OR UPDATE OF found, inventory_event_id ON inventory_items "
+        "FOR EACH ROW EXECUTE FUNCTION inventory_item_counters()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS inventory_items_counters ON inventory_items")
+    op.execute("DROP FUNCTION IF EXISTS inventory_item_counters()")
+    op.drop_index('ix_inventory_items_event_id_device_id', table_name='inventory_items')
+    op.drop_index(op.f('ix_devices_current_location_id'), table_name='devices')
+    op.drop_column('inventory_events', 'found_count')
+    op.drop_column('inventory_events', 'scanned_count')
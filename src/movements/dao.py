@@ -1,10 +1,54 @@
-from typing import Type, Optional, Any, List
+from typing import Type, Optional, Any, AsyncIterator, Dict, List, Sequence
 from datetime import datetime
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Select, select
+from sqlalchemy.orm import aliased, selectinload
 from src.movements.models import Movement
+from src.locations.models import Location
+from src.users.models import User
 from src.dao.base import BaseDAO
-from src.database import async_session_maker
+from src.dao.fields import FieldSet
+from src.dao.filters import NO_CRITERIA, FilterSet, ListCriteria
+from src.database import read_session_maker
+
+
+_from_location = aliased(Location, name="from_location")
+_to_location = aliased(Location, name="to_location")
+
+MOVEMENT_FIELDS = FieldSet(
+    Movement,
+    fields={
+        "id": Movement.id,
+        "device_id": Movement.device_id,
+        "from_location_id": Movement.from_location_id,
+        "to_location_id": Movement.to_location_id,
+        "moved_at": Movement.moved_at,
+        "performed_by": Movement.performed_by,
+        "notes": Movement.notes,
+        "from_location.id": _from_location.id,
+        "from_location.name": _from_location.name,
+        "to_location.id": _to_location.id,
+        "to_location.name": _to_location.name,
+        "performed_by_user.id": User.id,
+        "performed_by_user.full_name": User.full_name,
+    },
+    joins={
+        "from_location": (_from_location, _from_location.id, Movement.from_location_id),
+        "to_location": (_to_location, _to_location.id, Movement.to_location_id),
+        "performed_by_user": (User, User.id, Movement.performed_by),
+    },
+)
+
+MOVEMENT_FILTERS = FilterSet(
+    Movement,
+    fields={
+        "id": Movement.id,
+        "device_id": Movement.device_id,
+        "from_location_id": Movement.from_location_id,
+        "to_location_id": Movement.to_location_id,
+        "moved_at": Movement.moved_at,
+        "performed_by": Movement.performed_by,
+    },
+)
 
 
 class MovementDAO(BaseDAO):
@@ -14,7 +58,7 @@ class MovementDAO(BaseDAO):
     async def find_by_device_id(
         cls, device_id: Any, user_id: Optional[int] = None
     ) -> List[Movement]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = (
                 select(cls.model)
                 .where(cls.model.device_id == device_id)
@@ -32,7 +76,7 @@ class MovementDAO(BaseDAO):
 
     @classmethod
     async def find_by_id(cls, id_: Any) -> Optional[Movement]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = (
                 select(cls.model)
                 .where(cls.model.id == id_)
@@ -57,35 +101,128 @@ class MovementDAO(BaseDAO):
         moved_to: Optional[datetime] = None,
         offset: int = 0,
         limit: int = 100,
+        criteria: ListCriteria = NO_CRITERIA,
     ) -> List[Movement]:
         """
         Получить все перемещения с фильтрацией и пагинацией
         """
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
+            query = cls._find_all_query(
+                device_id, performed_by, from_location_id, to_location_id,
+                moved_from, moved_to, offset, limit, criteria,
+            )
+            result = await session.execute(query)
+            return result.scalars().all()
+
+    @classmethod
+    def stream_all(
+        cls,
+        *,
+        device_id: Optional[int] = None,
+        performed_by: Optional[int] = None,
+        from_location_id: Optional[int] = None,
+        to_location_id: Optional[int] = None,
+        moved_from: Optional[datetime] = None,
+        moved_to: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        criteria: ListCriteria = NO_CRITERIA,
+    ) -> AsyncIterator[Sequence[Movement]]:
+        """То же, что find_all, но пачками из курсора; без limit — все перемещения."""
+        return cls.stream_scalars(
+            cls._find_all_query(
+                device_id, performed_by, from_location_id, to_location_id,
+                moved_from, moved_to, offset, limit, criteria,
+            )
+        )
+
+    @classmethod
+    def _find_all_query(
+        cls,
+        device_id: Optional[int],
+        performed_by: Optional[int],
+        from_location_id: Optional[int],
+        to_location_id: Optional[int],
+        moved_from: Optional[datetime],
+        moved_to: Optional[datetime],
+        offset: int,
+        limit: Optional[int],
+        criteria: ListCriteria,
+    ) -> Select:
+        query = (
+            select(cls.model)
+            .options(
+                selectinload(cls.model.from_location),
+                selectinload(cls.model.to_location),
+                selectinload(cls.model.performed_by_user),
+            )
+            .order_by(cls.model.moved_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+
+        query = query.where(
+            *cls._list_filters(
+                device_id, performed_by, from_location_id, to_location_id, moved_from, moved_to
+            )
+        )
+        return criteria.apply(query)
+
+    @classmethod
+    def _list_filters(
+        cls,
+        device_id: Optional[int],
+        performed_by: Optional[int],
+        from_location_id: Optional[int],
+        to_location_id: Optional[int],
+        moved_from: Optional[datetime],
+        moved_to: Optional[datetime],
+    ) -> list:
+        filters = []
+        if device_id is not None:
+            filters.append(cls.model.device_id == device_id)
+        if performed_by is not None:
+            filters.append(cls.model.performed_by == performed_by)
+        if from_location_id is not None:
+            filters.append(cls.model.from_location_id == from_location_id)
+        if to_location_id is not None:
+            filters.append(cls.model.to_location_id == to_location_id)
+        if moved_from is not None:
+            filters.append(cls.model.moved_at >= moved_from)
+        if moved_to is not None:
+            filters.append(cls.model.moved_at <= moved_to)
+        return filters
+
+    @classmethod
+    async def find_all_projected(
+        cls,
+        fields: List[str],
+        *,
+        device_id: Optional[int] = None,
+        performed_by: Optional[int] = None,
+        from_location_id: Optional[int] = None,
+        to_location_id: Optional[int] = None,
+        moved_from: Optional[datetime] = None,
+        moved_to: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        criteria: ListCriteria = NO_CRITERIA,
+    ) -> List[Dict[str, Any]]:
+        """
+        Перемещения одним SELECT только по запрошенным полям (?fields=).
+        Без limit возвращает все строки — как find_by_device_id.
+        """
+        async with read_session_maker() as session:
             query = (
-                select(cls.model)
-                .options(
-                    selectinload(cls.model.from_location),
-                    selectinload(cls.model.to_location),
-                    selectinload(cls.model.performed_by_user),
+                MOVEMENT_FIELDS.select(fields)
+                .where(
+                    *cls._list_filters(
+                        device_id, performed_by, from_location_id, to_location_id, moved_from, moved_to
+                    )
                 )
                 .order_by(cls.model.moved_at.desc())
                 .offset(offset)
                 .limit(limit)
             )
-
-            if device_id is not None:
-                query = query.where(cls.model.device_id == device_id)
-            if performed_by is not None:
-                query = query.where(cls.model.performed_by == performed_by)
-            if from_location_id is not None:
-                query = query.where(cls.model.from_location_id == from_location_id)
-            if to_location_id is not None:
-                query = query.where(cls.model.to_location_id == to_location_id)
-            if moved_from is not None:
-                query = query.where(cls.model.moved_at >= moved_from)
-            if moved_to is not None:
-                query = query.where(cls.model.moved_at <= moved_to)
-
-            result = await session.execute(query)
-            return result.scalars().all()
+            result = await session.execute(criteria.apply(query))
+            return MOVEMENT_FIELDS.to_dicts(result, fields)
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, BigInteger, ForeignKey, TIMESTAMP, Text
+from sqlalchemy import Column, BigInteger, ForeignKey, TIMESTAMP, Text, Index
 from sqlalchemy.orm import relationship
 from src.database import Base
 
@@ -13,12 +13,17 @@ class Movement(Base):
 
     id = Column(BigInteger, primary_key=True)
     device_id = Column(BigInteger, ForeignKey('devices.id'), nullable=False)
-    from_location_id = Column(BigInteger, ForeignKey('locations.id'))
-    to_location_id = Column(BigInteger, ForeignKey('locations.id'), nullable=False)
-    moved_at = Column(TIMESTAMP(timezone=True), nullable=False)
-    performed_by = Column(BigInteger, ForeignKey('users.id'))
+    from_location_id = Column(BigInteger, ForeignKey('locations.id'), index=True)
+    to_location_id = Column(BigInteger, ForeignKey('locations.id'), nullable=False, index=True)
+    moved_at = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
+    performed_by = Column(BigInteger, ForeignKey('users.id'), index=True)
     notes = Column(Text)
 
+    __table_args__ = (
+        # история перемещений устройства по времени (лента /devices/{id}/timeline)
+        Index('ix_movements_device_id_moved_at', device_id, moved_at),
+    )
+
     device = relationship('Device', back_populates='movements')  # type: "Device"
     from_location = relationship(
         'Location', back_populates='movements_from', foreign_keys=[from_location_id]
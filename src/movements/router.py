@@ -1,10 +1,20 @@
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from src.admission import export_limiter, limit_large_pages
+from src.exceptions import BadRequestException
 from src.auth.dependencies import get_current_user, get_current_admin_user
-from src.movements.dao import MovementDAO
+from src.movements.dao import MOVEMENT_FIELDS, MOVEMENT_FILTERS, MovementDAO
 from src.movements.schemas import SMovementRead, SMovementCreate
 from src.devices.dao import DeviceDAO
+from src.schemas.responses import (
+    NegotiatedResponse,
+    NDJSON_LIMIT_DESCRIPTION,
+    ndjson_limit,
+    ndjson_response,
+    orm_list_response,
+    wants_ndjson,
+)
 
 router = APIRouter(
     prefix="/devices/{device_id}/movements",
@@ -24,6 +34,7 @@ admin_router = APIRouter(
     summary="Список всех перемещений (только для админов)",
 )
 async def list_all_movements(
+    request: Request,
     device_id: Optional[int] = Query(None, description="Фильтр по устройству"),
     performed_by: Optional[int] = Query(None, description="Фильтр по исполнителю"),
     from_location_id: Optional[int] = Query(
@@ -39,20 +50,41 @@ async def list_all_movements(
         None, description="Фильтр по дате перемещения (до)"
     ),
     offset: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: int = Query(100, ge=1, le=1000, description=NDJSON_LIMIT_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=MOVEMENT_FIELDS.description),
+    conditions: List[str] = Query(
+        [], alias="filter", description=MOVEMENT_FILTERS.description
+    ),
+    sort: Optional[str] = Query(None, description=MOVEMENT_FILTERS.sort_description),
     current_user=Depends(get_current_admin_user),
+    admission: None = Depends(limit_large_pages),
 ) -> List[SMovementRead]:
-    movements = await MovementDAO.find_all(
+    field_names = MOVEMENT_FIELDS.parse(fields)
+    filters = dict(
         device_id=device_id,
         performed_by=performed_by,
         from_location_id=from_location_id,
         to_location_id=to_location_id,
         moved_from=moved_from,
         moved_to=moved_to,
+        criteria=MOVEMENT_FILTERS.parse(conditions, sort),
         offset=offset,
         limit=limit,
     )
-    return [SMovementRead.model_validate(m) for m in movements]
+    if wants_ndjson(request):
+        if field_names is not None:
+            raise BadRequestException("fields is not supported for application/x-ndjson")
+        filters["limit"] = ndjson_limit(request, limit)
+        return await ndjson_response(
+            SMovementRead, MovementDAO.stream_all(**filters), limiter=export_limiter
+        )
+    if field_names is not None:
+        return NegotiatedResponse(
+            await MovementDAO.find_all_projected(field_names, **filters)
+        )
+
+    movements = await MovementDAO.find_all(**filters)
+    return orm_list_response(SMovementRead, movements)
 
 
 @router.get(
@@ -62,10 +94,20 @@ async def list_all_movements(
     dependencies=[Depends(get_current_user)],
 )
 async def list_movements(
-    device_id: int, current_user=Depends(get_current_user)
+    device_id: int,
+    fields: Optional[str] = Query(None, description=MOVEMENT_FIELDS.description),
+    current_user=Depends(get_current_user),
 ) -> List[SMovementRead]:
+    field_names = MOVEMENT_FIELDS.parse(fields)
+    if field_names is not None:
+        return NegotiatedResponse(
+            await MovementDAO.find_all_projected(
+                field_names, device_id=device_id, performed_by=current_user.id
+            )
+        )
+
     movements = await MovementDAO.find_by_device_id(device_id, user_id=current_user.id)
-    return [SMovementRead.model_validate(m) for m in movements]
+    return orm_list_response(SMovementRead, movements)
 
 
 @router.post(
@@ -1,7 +1,7 @@
-from typing import List, Optional, Type
+from typing import List, Optional, Sequence, Type
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
-from src.database import async_session_maker
+from src.database import read_session_maker
 from src.dao.base import BaseDAO
 from src.part_types.models import PartType
 
@@ -11,7 +11,7 @@ class PartTypeDAO(BaseDAO):
 
     @classmethod
     async def find_all(cls, *, creator_id: Optional[int] = None) -> List[PartType]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             q = select(cls.model).options(selectinload(cls.model.device_types))
             if creator_id is not None:
                 q = q.where(cls.model.created_by == creator_id)
@@ -22,7 +22,7 @@ class PartTypeDAO(BaseDAO):
     async def find_by_id(
         cls, id_: int, *, creator_id: Optional[int] = None
     ) -> Optional[PartType]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             q = (
                 select(cls.model)
                 .where(cls.model.id == id_)
@@ -32,3 +32,8 @@ class PartTypeDAO(BaseDAO):
                 q = q.where(cls.model.created_by == creator_id)
             result = await session.execute(q)
             return result.scalars().first()
+
+    @classmethod
+    async def find_many(cls, ids: Sequence[int]) -> List[PartType]:
+        """Типы деталей по списку id вместе со связанными типами устройств."""
+        return await super().find_many(ids, options=[selectinload(cls.model.device_types)])
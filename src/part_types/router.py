@@ -1,13 +1,15 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.exc import SQLAlchemyError
 from src.auth.dependencies import get_current_admin_user, get_current_user
 from src.part_types.dao import PartTypeDAO
+from src.schemas.many import IDS_DESCRIPTION, SManyRead, orm_many_response, parse_ids
 from src.part_types.schemas import (
     SPartTypeRead,
     SPartTypeCreate,
     SPartTypeUpdate,
 )
+from src.schemas.responses import orm_list_response
 
 router = APIRouter(
     prefix="/part-types",
@@ -23,11 +25,25 @@ async def list_part_types(
 ) -> List[SPartTypeRead]:
     try:
         pts = await PartTypeDAO.find_all()
-        return [SPartTypeRead.model_validate(pt) for pt in pts]
+        return orm_list_response(SPartTypeRead, pts)
     except SQLAlchemyError:
         raise HTTPException(500, "Database error while listing part types")
 
 
+@router.get(
+    "/many",
+    response_model=SManyRead[SPartTypeRead],
+    summary="Несколько типов деталей по ID",
+)
+async def get_part_types_many(
+    ids: str = Query(..., description=IDS_DESCRIPTION),
+    current_user=Depends(get_current_user),
+) -> SManyRead[SPartTypeRead]:
+    requested = parse_ids(ids)
+    items = await PartTypeDAO.find_many(requested)
+    return orm_many_response(SPartTypeRead, items, requested)
+
+
 @router.get(
     "/{part_type_id}",
     response_model=SPartTypeRead,
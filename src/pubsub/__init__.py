@@ -0,0 +1 @@
+"""Уведомления Postgres LISTEN/NOTIFY: один слушатель на воркер и раздача подписчикам."""
@@ -0,0 +1,49 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Set
+
+from prometheus_client import Counter, Gauge
+
+broadcast_subscribers_gauge = Gauge(
+    "broadcast_subscribers", "Active in-process broadcast subscribers", ["stream"]
+)
+broadcast_dropped_counter = Counter(
+    "broadcast_dropped_total", "Messages dropped for slow subscribers", ["stream"]
+)
+
+
+class Broadcaster:
+    """
+    Раздача сообщений всем подписчикам внутри воркера.
+
+    У каждого подписчика своя ограниченная очередь: медленный клиент теряет
+    самые старые сообщения, но не тормозит остальных и не растит память.
+    Сообщения передаются как есть — кодировать их стоит один раз до publish.
+    """
+
+    def __init__(self, name: str, queue_size: int = 100):
+        self.name = name
+        self._queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def publish(self, message: Any) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                broadcast_dropped_counter.labels(stream=self.name).inc()
+            queue.put_nowait(message)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        broadcast_subscribers_gauge.labels(stream=self.name).inc()
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+            broadcast_subscribers_gauge.labels(stream=self.name).dec()
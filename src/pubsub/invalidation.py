@@ -0,0 +1,73 @@
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import orjson
+from prometheus_client import Counter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+# NOTIFY ограничивает payload 8000 байтами — большие пачки id режем на части
+_MAX_IDS_PER_MESSAGE = 500
+
+cache_invalidations_counter = Counter(
+    "cache_invalidations_total", "Cache invalidation events dispatched", ["table", "scope"]
+)
+
+# ids=None — сбросить всё, что кеш хранит по таблице
+Invalidator = Callable[[Optional[List[Any]]], Any]
+
+_invalidators: Dict[str, List[Invalidator]] = defaultdict(list)
+
+
+def register_invalidator(table: str, invalidator: Invalidator) -> None:
+    """
+    Подписывает кеш на изменения таблицы.
+
+    Вызывается с изменёнными id или с None: при полном сбросе после
+    переподключения слушателя, когда пропущенные события неизвестны.
+    """
+    _invalidators[table].append(invalidator)
+
+
+def _invalidate(table: str, ids: Optional[List[Any]]) -> None:
+    cache_invalidations_counter.labels(table, "full" if ids is None else "ids").inc()
+    for invalidator in _invalidators.get(table, ()):
+        try:
+            invalidator(ids)
+        except Exception:
+            logger.exception("Cache invalidator for %s failed", table)
+
+
+def flush_all() -> None:
+    for table in list(_invalidators):
+        _invalidate(table, None)
+
+
+def handle_invalidation(payload: str) -> None:
+    message = orjson.loads(payload)
+    _invalidate(message["table"], message.get("ids"))
+
+
+async def publish_invalidation(session: AsyncSession, table: str, ids: Iterable[Any]) -> None:
+    """
+    Ставит NOTIFY об изменении строк в транзакцию сессии.
+
+    Postgres доставит его слушателям всех воркеров (включая текущий) только
+    после COMMIT; при откате уведомление пропадает вместе с изменениями.
+    """
+    ids = list(ids)
+    for start in range(0, len(ids), _MAX_IDS_PER_MESSAGE):
+        payload = orjson.dumps(
+            {"table": table, "ids": ids[start:start + _MAX_IDS_PER_MESSAGE]}
+        ).decode()
+        await session.execute(select(func.pg_notify(INVALIDATION_CHANNEL, payload)))
+
+
+def register_invalidation_bus(listener: Any) -> None:
+    listener.subscribe(INVALIDATION_CHANNEL, handle_invalidation)
+    # пропущенные за время разрыва события неизвестны — сбрасываем всё
+    listener.on_connect(flush_all)
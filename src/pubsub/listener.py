@@ -0,0 +1,133 @@
+import asyncio
+import inspect
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+import asyncpg
+from prometheus_client import Counter, Gauge
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+pg_listener_connected_gauge = Gauge(
+    "pg_listener_connected", "Whether the LISTEN connection of this worker is up"
+)
+pg_listener_reconnects_counter = Counter(
+    "pg_listener_reconnects_total", "LISTEN connection (re)establishments"
+)
+pg_notifications_counter = Counter(
+    "pg_notifications_total", "NOTIFY messages received", ["channel"]
+)
+
+NotificationHandler = Callable[[str], Any]
+ReconnectHandler = Callable[[], Any]
+
+
+class PgListener:
+    """
+    Одно выделенное соединение asyncpg на воркер, слушающее каналы NOTIFY.
+
+    Обработчики каналов вызываются синхронно в цикле событий и должны быть
+    быстрыми (асинхронные запускаются отдельной задачей). При обрыве соединение
+    восстанавливается с экспоненциальной задержкой; после каждого подключения
+    вызываются обработчики on_connect — уведомления, пришедшие во время разрыва,
+    потеряны, и подписчики должны считать своё состояние устаревшим.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        keepalive: float = 30.0,
+        min_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ):
+        self._dsn = dsn
+        self._keepalive = keepalive
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._handlers: Dict[str, List[NotificationHandler]] = defaultdict(list)
+        self._connect_handlers: List[ReconnectHandler] = []
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, channel: str, handler: NotificationHandler) -> None:
+        """Регистрирует обработчик канала; вызывать до start()."""
+        self._handlers[channel].append(handler)
+
+    def on_connect(self, handler: ReconnectHandler) -> None:
+        self._connect_handlers.append(handler)
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="pg-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @staticmethod
+    def _call(handler: Callable[..., Any], *args: Any) -> None:
+        try:
+            result = handler(*args)
+            if inspect.isawaitable(result):
+                asyncio.ensure_future(result)
+        except Exception:
+            logger.exception("Notification handler %r failed", handler)
+
+    def _dispatch(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        pg_notifications_counter.labels(channel=channel).inc()
+        for handler in self._handlers.get(channel, ()):
+            self._call(handler, payload)
+
+    async def _listen_until_closed(self, connection: asyncpg.Connection) -> None:
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        for channel in self._handlers:
+            await connection.add_listener(channel, self._dispatch)
+
+        pg_listener_connected_gauge.set(1)
+        pg_listener_reconnects_counter.inc()
+        for handler in self._connect_handlers:
+            self._call(handler)
+
+        while not closed.is_set():
+            try:
+                await asyncio.wait_for(closed.wait(), timeout=self._keepalive)
+            except asyncio.TimeoutError:
+                # полуоткрытый TCP не закрывает соединение сам — проверяем запросом
+                await connection.fetchval("SELECT 1", timeout=self._keepalive)
+
+    async def _run(self) -> None:
+        delay = self._min_delay
+        while True:
+            try:
+                self._connection = await asyncpg.connect(self._dsn)
+                delay = self._min_delay
+                await self._listen_until_closed(self._connection)
+                logger.warning("LISTEN connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("LISTEN connection failed: %s; retry in %.0fs", e, delay)
+            finally:
+                pg_listener_connected_gauge.set(0)
+                connection, self._connection = self._connection, None
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_delay)
+
+
+pg_listener = PgListener(settings.asyncpg_dsn)
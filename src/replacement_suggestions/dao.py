@@ -3,7 +3,7 @@ from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
 from datetime import date
 from src.dao.base import BaseDAO
-from src.database import async_session_maker
+from src.database import read_session_maker
 from src.replacement_suggestions.models import ReplacementSuggestion
 
 class ReplacementSuggestionDAO(BaseDAO):
@@ -18,7 +18,7 @@ class ReplacementSuggestionDAO(BaseDAO):
         date_from:     date | None = None,
         date_to:       date | None = None
     ) -> List[ReplacementSuggestion]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = select(cls.model).options(
                 selectinload(cls.model.part_type)
             )
@@ -45,7 +45,7 @@ class ReplacementSuggestionDAO(BaseDAO):
 
     @classmethod
     async def find_by_id(cls, id_: Any) -> Optional[ReplacementSuggestion]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             result = await session.execute(
                 select(cls.model)
                 .where(cls.model.id == id_)
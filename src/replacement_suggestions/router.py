@@ -12,6 +12,7 @@ from src.replacement_suggestions.schemas import (
     SReplacementSuggestionUpdate
 )
 from src.part_types.dao import PartTypeDAO
+from src.schemas.responses import orm_list_response
 
 router = APIRouter(
     tags=["Предложения по замене устройств"],
@@ -37,7 +38,7 @@ async def list_suggestions(
             date_from=date_from,
             date_to=date_to
         )
-        return [SReplacementSuggestionRead.model_validate(i) for i in items]
+        return orm_list_response(SReplacementSuggestionRead, items)
     except ValidationError:
         raise HTTPException(status_code=500, detail="Error serializing suggestions")
     except SQLAlchemyError:
@@ -54,7 +55,7 @@ async def list_by_part_type(part_type_id: int) -> List[SReplacementSuggestionRea
         raise HTTPException(status_code=404, detail="PartType not found")
     try:
         items = await ReplacementSuggestionDAO.find_all(part_type_id=part_type_id)
-        return [SReplacementSuggestionRead.model_validate(i) for i in items]
+        return orm_list_response(SReplacementSuggestionRead, items)
     except ValidationError:
         raise HTTPException(status_code=500, detail="Error serializing suggestions")
     except SQLAlchemyError:
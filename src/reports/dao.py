@@ -0,0 +1,209 @@
+import hashlib
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Type
+
+import orjson
+from sqlalchemy import and_, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.config import settings
+from src.dao.base import BaseDAO
+from src.database import async_session_maker
+from src.reports.models import ACTIVE_STATUSES, ReportJob
+
+REPORT_JOBS_CHANNEL = "report_jobs"
+
+
+def params_hash(report: str, params: Dict[str, Any]) -> str:
+    """Хеш имени отчёта и параметров в каноническом виде (ключи отсортированы)."""
+    payload = orjson.dumps([report, params], option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class ReportJobDAO(BaseDAO):
+    model: Type[ReportJob] = ReportJob
+
+    @classmethod
+    async def enqueue(
+        cls, report: str, params: Dict[str, Any], created_by: int
+    ) -> ReportJob:
+        """
+        Ставит отчёт в очередь или возвращает живое задание с теми же параметрами
+        (queued/running/done). Воркеры будятся через NOTIFY после коммита.
+        """
+        digest = params_hash(report, params)
+        async with async_session_maker() as session:
+            job = await session.scalar(
+                insert(cls.model)
+                .values(
+                    report=report,
+                    params=params,
+                    params_hash=digest,
+                    created_by=created_by,
+                )
+                .on_conflict_do_nothing(
+                    index_elements=[cls.model.params_hash],
+                    # предикат частичного индекса литералом: с параметрами
+                    # Postgres не сопоставит его с uq_report_jobs_active_params_hash
+                    index_where=text(
+                        "status IN (%s)" % ", ".join(f"'{status}'" for status in ACTIVE_STATUSES)
+                    ),
+                )
+                .returning(cls.model)
+            )
+            if job is None:
+                job = await session.scalar(
+                    select(cls.model).where(
+                        cls.model.params_hash == digest,
+                        cls.model.status.in_(ACTIVE_STATUSES),
+                    )
+                )
+            else:
+                await session.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": REPORT_JOBS_CHANNEL, "payload": str(job.id)},
+                )
+            await session.commit()
+            return job
+
+    @classmethod
+    async def fail_abandoned(cls) -> List[ReportJob]:
+        """
+        Переводит в failed брошенные задания, которые уже исчерпали
+        report_max_attempts: claim_next их больше не возьмёт, а в статусе
+        running они навсегда заняли бы хеш параметров, и enqueue возвращал бы
+        мёртвое задание вместо нового.
+        """
+        stale_before = func.now() - timedelta(seconds=settings.report_job_timeout)
+        async with async_session_maker() as session:
+            result = await session.scalars(
+                update(cls.model)
+                .where(
+                    cls.model.status == "running",
+                    cls.model.started_at < stale_before,
+                    cls.model.attempts >= settings.report_max_attempts,
+                )
+                .values(
+                    status="failed",
+                    error=(
+                        "Abandoned by crashed workers "
+                        f"{settings.report_max_attempts} times"
+                    ),
+                    finished_at=func.now(),
+                )
+                .returning(cls.model)
+            )
+            jobs = list(result)
+            await session.commit()
+            return jobs
+
+    @classmethod
+    async def claim_next(cls) -> Optional[ReportJob]:
+        """
+        Забирает старейшее задание из очереди (FOR UPDATE SKIP LOCKED: воркеры
+        разных процессов не ждут друг друга). Задание running дольше
+        report_job_timeout считается брошенным упавшим воркером и берётся снова.
+        """
+        stale_before = func.now() - timedelta(seconds=settings.report_job_timeout)
+        candidate = (
+            select(cls.model.id)
+            .where(
+                or_(
+                    cls.model.status == "queued",
+                    and_(
+                        cls.model.status == "running",
+                        cls.model.started_at < stale_before,
+                    ),
+                ),
+                cls.model.attempts < settings.report_max_attempts,
+            )
+            .order_by(cls.model.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        async with async_session_maker() as session:
+            job = await session.scalar(
+                update(cls.model)
+                .where(cls.model.id == candidate)
+                .values(
+                    status="running",
+                    started_at=func.now(),
+                    attempts=cls.model.attempts + 1,
+                )
+                .returning(cls.model)
+            )
+            await session.commit()
+            return job
+
+    @classmethod
+    async def _set(cls, job_id: int, **values: Any) -> None:
+        async with async_session_maker() as session:
+            await session.execute(
+                update(cls.model).where(cls.model.id == job_id).values(**values)
+            )
+            await session.commit()
+
+    @classmethod
+    async def mark_done(cls, job_id: int, file_name: str, file_size: int) -> None:
+        await cls._set(
+            job_id,
+            status="done",
+            file_name=file_name,
+            file_size=file_size,
+            error=None,
+            finished_at=func.now(),
+        )
+
+    @classmethod
+    async def mark_failed(cls, job_id: int, error: str) -> None:
+        await cls._set(job_id, status="failed", error=error, finished_at=func.now())
+
+    @classmethod
+    async def requeue(cls, job_id: int) -> None:
+        """Возвращает задание в очередь (остановка воркера во время построения)."""
+        await cls._set(
+            job_id, status="queued", started_at=None, attempts=cls.model.attempts - 1
+        )
+
+    @classmethod
+    async def mark_expired(cls, job_ids: List[int]) -> None:
+        if not job_ids:
+            return
+        async with async_session_maker() as session:
+            await session.execute(
+                update(cls.model)
+                .where(cls.model.id.in_(job_ids))
+                .values(status="expired", file_name=None, file_size=None)
+            )
+            await session.commit()
+
+    @classmethod
+    async def find_evictable(
+        cls, max_age: timedelta, max_total_bytes: int
+    ) -> List[ReportJob]:
+        """
+        Готовые отчёты на вытеснение: старше max_age, а также самые старые
+        из оставшихся, пока общий объём файлов превышает max_total_bytes.
+        """
+        # объём всех более новых файлов, включая текущий
+        newer_total = func.sum(cls.model.file_size).over(
+            order_by=(cls.model.finished_at.desc(), cls.model.id.desc())
+        )
+        ranked = (
+            select(cls.model.id, newer_total.label("newer_total"))
+            .where(cls.model.status == "done")
+            .subquery()
+        )
+        async with async_session_maker() as session:
+            result = await session.scalars(
+                select(cls.model)
+                .join(ranked, ranked.c.id == cls.model.id)
+                .where(
+                    or_(
+                        cls.model.finished_at < func.now() - max_age,
+                        ranked.c.newer_total > max_total_bytes,
+                    )
+                )
+            )
+            return list(result)
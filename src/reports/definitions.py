@@ -0,0 +1,100 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Type
+
+from openpyxl import Workbook
+from pydantic import BaseModel
+
+from src.analytics.summary import XLSX_MEDIA_TYPE, build_summary_workbook, collect_summary
+from src.exports.dao import ExportDAO
+from src.exports.schemas import ExportFormat
+from src.reports.schemas import (
+    SFailureAnalysisParams,
+    SFleetDevicesParams,
+    SFleetSummaryParams,
+)
+from src.stats.dao import StatsDAO
+
+
+@dataclass(frozen=True)
+class ReportDefinition:
+    name: str
+    title: str
+    params: Type[BaseModel]
+    extension: str
+    media_type: str
+    # строит отчёт в файл по указанному пути
+    render: Callable[[BaseModel, Path], Awaitable[None]]
+
+
+async def _render_fleet_summary(params: SFleetSummaryParams, path: Path) -> None:
+    summary = await collect_summary()
+    workbook = await asyncio.to_thread(build_summary_workbook, summary)
+    await asyncio.to_thread(workbook.save, path)
+
+
+async def _render_fleet_devices(params: SFleetDevicesParams, path: Path) -> None:
+    with open(path, "wb") as output:
+        async for chunk in ExportDAO.render(
+            ExportDAO.devices_query(), ExportFormat.xlsx, title="devices"
+        ):
+            await asyncio.to_thread(output.write, chunk)
+
+
+def _failure_analysis_workbook(nodes, year: int) -> Workbook:
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(f"Отказы {year}")
+    sheet.append(["Тип устройства", "Компонент", "Причина", "Отказов", "Устранение, дней"])
+    names = {node["id"]: node for node in nodes}
+    for node in nodes:
+        if "value" not in node:
+            continue
+        part = names[node["parent"]]
+        device = names[part["parent"]]
+        sheet.append(
+            [device["name"], part["name"], node["name"], node["value"], node["resolution_time"]]
+        )
+    return workbook
+
+
+async def _render_failure_analysis(params: SFailureAnalysisParams, path: Path) -> None:
+    analysis = await StatsDAO.get_failure_analysis(
+        date_from=date(params.year, 1, 1), date_to=date(params.year, 12, 31)
+    )
+    workbook = await asyncio.to_thread(
+        _failure_analysis_workbook, analysis["nodes"], params.year
+    )
+    await asyncio.to_thread(workbook.save, path)
+
+
+REPORTS: Dict[str, ReportDefinition] = {
+    definition.name: definition
+    for definition in (
+        ReportDefinition(
+            name="fleet_summary",
+            title="Сводная статистика по парку оборудования",
+            params=SFleetSummaryParams,
+            extension="xlsx",
+            media_type=XLSX_MEDIA_TYPE,
+            render=_render_fleet_summary,
+        ),
+        ReportDefinition(
+            name="fleet_devices",
+            title="Полный список устройств парка",
+            params=SFleetDevicesParams,
+            extension="xlsx",
+            media_type=XLSX_MEDIA_TYPE,
+            render=_render_fleet_devices,
+        ),
+        ReportDefinition(
+            name="failure_analysis",
+            title="Анализ отказов за год",
+            params=SFailureAnalysisParams,
+            extension="xlsx",
+            media_type=XLSX_MEDIA_TYPE,
+            render=_render_failure_analysis,
+        ),
+    )
+}
@@ -0,0 +1,52 @@
+from sqlalchemy import (
+    TIMESTAMP,
+    BigInteger,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.database import Base
+
+# Задания в этих статусах участвуют в дедупликации по хешу параметров
+ACTIVE_STATUSES = ("queued", "running", "done")
+
+
+class ReportJob(Base):
+    """
+    Задание на построение отчёта. Выполняется пулом воркеров, результат
+    лежит файлом в settings.reports_dir; после вытеснения статус — expired.
+    """
+    __tablename__ = "report_jobs"
+
+    id = Column(BigInteger, primary_key=True)
+    report = Column(String(50), nullable=False)
+    params = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    params_hash = Column(String(64), nullable=False)
+    status = Column(String(20), nullable=False, server_default="queued")
+    attempts = Column(Integer, nullable=False, server_default="0")
+    file_name = Column(String(255))
+    file_size = Column(BigInteger)
+    error = Column(Text)
+    created_by = Column(BigInteger, ForeignKey("users.id"), nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    started_at = Column(TIMESTAMP(timezone=True))
+    finished_at = Column(TIMESTAMP(timezone=True))
+
+    __table_args__ = (
+        # одно живое задание на набор параметров: повторный запрос получает его же
+        Index(
+            "uq_report_jobs_active_params_hash",
+            params_hash,
+            unique=True,
+            postgresql_where=status.in_(ACTIVE_STATUSES),
+        ),
+        # очередь: воркеры берут старейшее queued-задание
+        Index("ix_report_jobs_queued", id, postgresql_where=status == "queued"),
+    )
@@ -0,0 +1,102 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import FileResponse
+from pydantic import ValidationError
+
+from src.auth.dependencies import get_current_admin_user
+from src.exceptions import BadRequestException, NotFoundException
+from src.reports.dao import ReportJobDAO
+from src.reports.definitions import REPORTS
+from src.reports.models import ReportJob
+from src.reports.schemas import SReportDefinition, SReportJobCreate, SReportJobRead
+from src.reports.worker import report_path
+
+router = APIRouter(
+    prefix="/reports",
+    tags=["Отчёты"],
+    dependencies=[Depends(get_current_admin_user)],
+)
+
+
+def _job_response(job: ReportJob) -> SReportJobRead:
+    result = SReportJobRead.model_validate(job)
+    if job.status == "done":
+        result.download_url = router.url_path_for("download_report_job", job_id=job.id)
+    return result
+
+
+@router.get(
+    "/",
+    response_model=List[SReportDefinition],
+    summary="Доступные отчёты и схемы их параметров",
+)
+async def list_reports() -> List[SReportDefinition]:
+    return [
+        SReportDefinition(
+            name=definition.name,
+            title=definition.title,
+            params_schema=definition.params.model_json_schema(),
+        )
+        for definition in REPORTS.values()
+    ]
+
+
+@router.post(
+    "/jobs",
+    response_model=SReportJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Поставить отчёт в очередь",
+    description=(
+        "Возвращает задание. Если такой же отчёт с теми же параметрами уже "
+        "в очереди, строится или готов, возвращается существующее задание."
+    ),
+)
+async def create_report_job(
+    payload: SReportJobCreate, current_user=Depends(get_current_admin_user)
+) -> SReportJobRead:
+    definition = REPORTS.get(payload.report)
+    if definition is None:
+        raise BadRequestException(f"Unknown report: {payload.report}")
+    try:
+        params = definition.params.model_validate(payload.params)
+    except ValidationError as exc:
+        raise BadRequestException(f"Invalid report params: {exc.errors()}")
+    job = await ReportJobDAO.enqueue(
+        definition.name, params.model_dump(mode="json"), created_by=current_user.id
+    )
+    return _job_response(job)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=SReportJobRead,
+    summary="Статус задания и ссылка на файл",
+)
+async def get_report_job(job_id: int) -> SReportJobRead:
+    job = await ReportJobDAO.find_by_id(job_id)
+    if job is None:
+        raise NotFoundException("Report job not found")
+    return _job_response(job)
+
+
+@router.get(
+    "/jobs/{job_id}/file",
+    name="download_report_job",
+    response_class=FileResponse,
+    summary="Скачать готовый отчёт (поддерживает Range)",
+)
+async def download_report_job(job_id: int) -> FileResponse:
+    job = await ReportJobDAO.find_by_id(job_id)
+    if job is None or job.status != "done":
+        raise NotFoundException("Report is not ready")
+    path = report_path(job)
+    if not path.is_file():
+        # файл вытеснен или построен на другом хосте
+        raise NotFoundException("Report file is not available")
+    definition = REPORTS[job.report]
+    return FileResponse(
+        path,
+        media_type=definition.media_type,
+        filename=f"{job.report}-{job.id}.{definition.extension}",
+    )
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SReportJobCreate(BaseModel):
+    report: str = Field(..., description="Имя отчёта, см. GET /reports")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Параметры отчёта")
+
+
+class SReportJobRead(BaseModel):
+    id: int
+    report: str
+    params: Dict[str, Any]
+    status: str
+    attempts: int
+    file_size: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    download_url: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SReportDefinition(BaseModel):
+    name: str
+    title: str
+    params_schema: Dict[str, Any]
+
+
+class SFleetSummaryParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class SFleetDevicesParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class SFailureAnalysisParams(BaseModel):
+    year: int = Field(..., ge=2000, le=2100, description="Год отказов")
+
+    model_config = ConfigDict(extra="forbid")
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from prometheus_client import Counter, Histogram
+
+from src.config import settings
+from src.database import Workload, use_workload
+from src.pubsub.listener import PgListener
+from src.reports.dao import REPORT_JOBS_CHANNEL, ReportJobDAO
+from src.reports.definitions import REPORTS
+from src.reports.models import ReportJob
+
+logger = logging.getLogger(__name__)
+
+report_jobs_counter = Counter(
+    "report_jobs_total", "Report jobs finished by outcome", ["report", "status"]
+)
+report_job_duration_histogram = Histogram(
+    "report_job_duration_seconds",
+    "Time to render a report",
+    ["report"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800),
+)
+
+
+def report_path(job: ReportJob) -> Path:
+    definition = REPORTS[job.report]
+    return settings.reports_dir / f"{job.id}-{job.params_hash[:12]}.{definition.extension}"
+
+
+class ReportWorkerPool:
+    """
+    Пул воркеров, строящих отчёты из очереди report_jobs.
+
+    Воркеры будятся уведомлением канала report_jobs и на всякий случай
+    опрашивают очередь раз в poll_interval секунд. Отчёт пишется во временный
+    файл и переименовывается после успешного построения.
+    """
+
+    def __init__(self, workers: int, poll_interval: float):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def wake(self, payload: Optional[str] = None) -> None:
+        self._wakeup.set()
+
+    def start(self) -> None:
+        settings.reports_dir.mkdir(parents=True, exist_ok=True)
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"report-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                for abandoned in await ReportJobDAO.fail_abandoned():
+                    logger.error(
+                        "Report job %s (%s) failed: abandoned after %d attempts",
+                        abandoned.id, abandoned.report, abandoned.attempts,
+                    )
+                    report_jobs_counter.labels(report=abandoned.report, status="failed").inc()
+                job = await ReportJobDAO.claim_next()
+            except Exception:
+                logger.exception("Failed to claim report job")
+                job = None
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._execute(job)
+
+    async def _execute(self, job: ReportJob) -> None:
+        definition = REPORTS.get(job.report)
+        if definition is None:
+            await ReportJobDAO.mark_failed(job.id, f"Unknown report: {job.report}")
+            report_jobs_counter.labels(report=job.report, status="failed").inc()
+            return
+
+        target = report_path(job)
+        partial = target.with_name(target.name + ".part")
+        started = time.perf_counter()
+        try:
+            params = definition.params.model_validate(job.params)
+            with use_workload(Workload.background):
+                await definition.render(params, partial)
+            os.replace(partial, target)
+        except asyncio.CancelledError:
+            partial.unlink(missing_ok=True)
+            await ReportJobDAO.requeue(job.id)
+            raise
+        except Exception as exc:
+            logger.exception("Report job %s (%s) failed", job.id, job.report)
+            partial.unlink(missing_ok=True)
+            await ReportJobDAO.mark_failed(job.id, str(exc) or type(exc).__name__)
+            report_jobs_counter.labels(report=job.report, status="failed").inc()
+            return
+
+        report_job_duration_histogram.labels(report=job.report).observe(
+            time.perf_counter() - started
+        )
+        await ReportJobDAO.mark_done(job.id, target.name, target.stat().st_size)
+        report_jobs_counter.labels(report=job.report, status="done").inc()
+
+
+report_workers = ReportWorkerPool(settings.report_workers, settings.report_poll_interval)
+
+
+def register_report_workers(listener: PgListener) -> None:
+    listener.subscribe(REPORT_JOBS_CHANNEL, report_workers.wake)
+    # уведомления за время разрыва потеряны — проверить очередь сразу
+    listener.on_connect(report_workers.wake)
@@ -0,0 +1,61 @@
+from typing import Any, Generic, Hashable, Iterable, List, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+
+from src.config import settings
+from src.exceptions import BadRequestException
+from src.schemas.responses import NegotiatedResponse, dump_mode, list_adapter
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+IDS_DESCRIPTION = f"ID через запятую, не больше {settings.multi_get_max_ids}"
+
+
+class SManyRead(BaseModel, Generic[T]):
+    items: List[T]
+    missing: List[Any]
+
+
+def unique_values(values: Iterable[K]) -> List[K]:
+    """Убирает повторы с сохранением порядка и проверяет ограничение на число значений."""
+    unique = list(dict.fromkeys(values))
+    if not unique:
+        raise BadRequestException(detail="No values requested")
+    if len(unique) > settings.multi_get_max_ids:
+        raise BadRequestException(
+            detail=f"Too many values: at most {settings.multi_get_max_ids} allowed"
+        )
+    return unique
+
+
+def parse_ids(raw: str) -> List[int]:
+    """Разбирает ?ids=1,2,3."""
+    try:
+        ids = [int(part) for part in raw.split(",") if part.strip()]
+    except ValueError:
+        raise BadRequestException(detail="ids must be a comma-separated list of integers")
+    return unique_values(ids)
+
+
+def orm_many_response(
+    schema: Type[BaseModel],
+    objects: Iterable[Any],
+    requested: Sequence[K],
+    key: str = "id",
+) -> NegotiatedResponse:
+    """
+    Ответ мульти-запроса: найденные объекты в порядке запроса и список
+    значений, для которых ничего не нашлось (или нет доступа).
+    """
+    by_key = {getattr(obj, key): obj for obj in objects}
+    adapter = list_adapter(schema)
+    items = adapter.validate_python(
+        [by_key[value] for value in requested if value in by_key], from_attributes=True
+    )
+    return NegotiatedResponse(
+        {
+            "items": adapter.dump_python(items, mode=dump_mode()),
+            "missing": [value for value in requested if value not in by_key],
+        }
+    )
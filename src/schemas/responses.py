@@ -0,0 +1,139 @@
+from contextvars import ContextVar
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable, List, Mapping, Optional, Sequence, Type
+from uuid import UUID
+
+import msgpack
+import orjson
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+
+from src.admission import AdmissionLimiter, AdmittedStreamingResponse
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_LIMIT_DESCRIPTION = (
+    "Размер страницы. С заголовком Accept: application/x-ndjson ответ идёт "
+    "потоком по объекту на строку, и без явного limit отдаются все записи"
+)
+
+# Формат тела ответа, выбранный по Accept (см. ContentNegotiationMiddleware)
+response_media_type: ContextVar[str] = ContextVar(
+    "response_media_type", default=JSON_MEDIA_TYPE
+)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    # те же представления, что дают orjson и jsonable_encoder
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+
+
+class NegotiatedResponse(Response):
+    """
+    Ответ с данными в формате, который выбрал клиент: JSON (orjson) по
+    умолчанию или MessagePack при Accept: application/msgpack. Схема данных
+    одна и та же, даты передаются строками ISO 8601 в обоих форматах.
+    """
+
+    media_type = JSON_MEDIA_TYPE
+
+    def __init__(
+        self,
+        content: Any = None,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        super().__init__(
+            content,
+            status_code,
+            headers,
+            media_type or response_media_type.get(),
+            background,
+        )
+        self.headers.add_vary_header("Accept")
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            return msgpack.packb(content, default=_msgpack_default)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def dump_mode() -> str:
+    """
+    Режим dump_python под формат ответа: для MessagePack даты сразу
+    строками, это дешевле, чем default-хук packb.
+    """
+    return "json" if response_media_type.get() == MSGPACK_MEDIA_TYPE else "python"
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Кешированный TypeAdapter для списка схем: строится один раз на схему."""
+    return TypeAdapter(List[schema])
+
+
+def orm_list_response(
+    schema: Type[BaseModel], objects: Iterable[Any], status_code: int = 200
+) -> NegotiatedResponse:
+    """
+    Валидирует список ORM-объектов одним проходом через TypeAdapter
+    и сразу кодирует его в запрошенный клиентом формат.
+
+    Возврат готового Response отключает повторную валидацию по response_model,
+    при этом response_model эндпоинта по-прежнему описывает схему в OpenAPI.
+    """
+    adapter = list_adapter(schema)
+    items = adapter.validate_python(objects, from_attributes=True)
+    return NegotiatedResponse(
+        adapter.dump_python(items, mode=dump_mode()), status_code=status_code
+    )
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Клиент запросил построчный JSON заголовком Accept."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_limit(request: Request, limit: int) -> Optional[int]:
+    """В потоковом режиме без явного ?limit= отдаётся вся выборка."""
+    return limit if "limit" in request.query_params else None
+
+
+async def ndjson_response(
+    schema: Type[BaseModel],
+    batches: AsyncIterator[Sequence[Any]],
+    limiter: Optional[AdmissionLimiter] = None,
+) -> StreamingResponse:
+    """
+    Отдаёт ORM-объекты построчным JSON (по объекту на строку) по мере чтения
+    из курсора: каждая пачка валидируется и кодируется целиком и уходит
+    клиенту одним куском, поэтому память не растёт с размером выборки.
+
+    Если передан limiter, слот занимается здесь и освобождается
+    после отправки последней строки.
+    """
+    adapter = list_adapter(schema)
+
+    async def body() -> AsyncIterator[bytes]:
+        async for batch in batches:
+            items = adapter.dump_python(adapter.validate_python(batch, from_attributes=True))
+            yield b"".join(orjson.dumps(item) + b"\n" for item in items)
+
+    if limiter is None:
+        return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+    await limiter.acquire()
+    return AdmittedStreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE, limiter=limiter)
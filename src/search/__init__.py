@@ -0,0 +1 @@
+"""Поиск по устройствам, типам устройств и локациям."""
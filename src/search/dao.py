@@ -0,0 +1,174 @@
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, func, literal, or_, select, tuple_, union_all
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.dao.cursor import decode_cursor, encode_cursor
+from src.database import read_session_maker
+from src.device_types.models import DeviceType, device_type_title
+from src.devices.models import Device
+from src.exceptions import BadRequestException
+from src.locations.models import Location
+from src.search.schemas import SearchMode, SSearchHit
+
+# Минимальная длина запроса для поиска по вхождению: короче трёх символов
+# триграммный индекс не сужает выборку.
+MIN_TRIGRAM_LENGTH = 3
+
+
+def prefix_key(column: ColumnElement) -> ColumnElement:
+    """
+    lower(col) COLLATE "C" — то же выражение, что в btree-индексах *_prefix:
+    по нему работают и LIKE 'abc%', и ORDER BY, и keyset-сравнение.
+    """
+    return func.lower(column).collate("C")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def parse_cursor(cursor: str, mode: SearchMode) -> Tuple[Any, str, int]:
+    cursor_mode, sort_key, kind, id_ = decode_cursor(cursor, 4)
+    key_type = str if mode is SearchMode.prefix else (int, float)
+    if (
+        cursor_mode != mode.value
+        or not isinstance(sort_key, key_type)
+        or not isinstance(kind, str)
+        or not isinstance(id_, int)
+    ):
+        raise BadRequestException(detail="Invalid cursor")
+    return sort_key, kind, id_
+
+
+class SearchDAO:
+    # kind -> (модель, заголовок, колонки для сопоставления)
+    sources = {
+        "device": (Device, Device.serial_number, (Device.serial_number,)),
+        "device_type": (
+            DeviceType,
+            device_type_title(DeviceType.manufacturer, DeviceType.model),
+            (DeviceType.manufacturer, DeviceType.model),
+        ),
+        "location": (Location, Location.name, (Location.name,)),
+    }
+
+    @classmethod
+    def _branch(
+        cls,
+        kind: str,
+        q: str,
+        mode: SearchMode,
+        after: Optional[Tuple[Any, str, int]],
+        limit: int,
+    ):
+        model, title, columns = cls.sources[kind]
+        if mode is SearchMode.prefix:
+            pattern = _escape_like(q.lower()) + "%"
+            match = or_(*(prefix_key(c).like(pattern, escape="/") for c in columns))
+            sort_key = prefix_key(columns[0] if len(columns) == 1 else title)
+            order_by = (sort_key, model.id)
+        else:
+            contains = "%" + _escape_like(q) + "%"
+            # ILIKE '%q%' и q <% col обслуживаются одним GIN-индексом gin_trgm_ops
+            match = or_(
+                *(c.ilike(contains, escape="/") for c in columns),
+                *(literal(q).bool_op("<%")(c) for c in columns),
+            )
+            scores = [func.word_similarity(q, c) for c in columns]
+            sort_key = scores[0] if len(scores) == 1 else func.greatest(*scores)
+            order_by = (sort_key.desc(), model.id)
+
+        query = select(
+            literal(kind).label("kind"),
+            model.id.label("id"),
+            title.label("title"),
+            sort_key.label("sort_key"),
+        ).where(match)
+
+        if after is not None:
+            # Глобальный порядок — (sort_key, kind, id); внутри ветки kind постоянен,
+            # поэтому условие раскладывается в сравнение, которое понимает индекс.
+            key, after_kind, after_id = after
+            if mode is SearchMode.prefix:
+                if kind < after_kind:
+                    query = query.where(sort_key > key)
+                elif kind == after_kind:
+                    query = query.where(tuple_(sort_key, model.id) > tuple_(key, after_id))
+                else:
+                    query = query.where(sort_key >= key)
+            else:
+                if kind < after_kind:
+                    query = query.where(sort_key < key)
+                elif kind == after_kind:
+                    query = query.where(
+                        or_(sort_key < key, and_(sort_key == key, model.id > after_id))
+                    )
+                else:
+                    query = query.where(sort_key <= key)
+
+        return query.order_by(*order_by).limit(limit)
+
+    @classmethod
+    async def search(
+        cls,
+        q: str,
+        *,
+        mode: SearchMode = SearchMode.trigram,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        user_id: int,
+        is_admin: bool = False,
+    ) -> Tuple[List[SSearchHit], Optional[str]]:
+        """
+        Ранжированный поиск по серийным номерам, типам устройств и локациям.
+
+        Каждая ветка UNION ALL отбирает не больше limit + 1 строк по своему
+        индексу, общий порядок — (sort_key, kind, id): по убыванию сходства в режиме
+        trigram и по алфавиту в режиме prefix. Для не-админов устройства
+        фильтруются так же, как в DeviceDAO.find_all.
+        """
+        q = q.strip()
+        if not q:
+            raise BadRequestException(detail="Empty search query")
+        if mode is SearchMode.trigram and len(q) < MIN_TRIGRAM_LENGTH:
+            raise BadRequestException(
+                detail=f"Query must be at least {MIN_TRIGRAM_LENGTH} characters, use mode=prefix for shorter input"
+            )
+        after = parse_cursor(cursor, mode) if cursor else None
+
+        branches = []
+        for kind in sorted(cls.sources):
+            branch = cls._branch(kind, q, mode, after, limit + 1)
+            if kind == "device" and not is_admin:
+                branch = branch.outerjoin(
+                    Location, Location.id == Device.current_location_id
+                ).where(or_(Location.created_by == user_id, Device.created_by == user_id))
+            branches.append(branch)
+
+        hits = union_all(*branches).subquery("hits")
+        if mode is SearchMode.prefix:
+            order_by = (hits.c.sort_key.collate("C"), hits.c.kind, hits.c.id)
+        else:
+            order_by = (hits.c.sort_key.desc(), hits.c.kind, hits.c.id)
+        query = select(hits).order_by(*order_by).limit(limit + 1)
+
+        async with read_session_maker() as session:
+            rows = (await session.execute(query)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(mode.value, last.sort_key, last.kind, last.id)
+
+        items = [
+            SSearchHit(
+                kind=row.kind,
+                id=row.id,
+                title=row.title,
+                score=row.sort_key if mode is SearchMode.trigram else None,
+            )
+            for row in rows
+        ]
+        return items, next_cursor
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from src.auth.dependencies import get_current_user
+from src.search.dao import SearchDAO
+from src.search.schemas import SearchMode, SSearchPage
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Поиск"],
+)
+
+
+@router.get(
+    "/",
+    response_model=SSearchPage,
+    summary="Поиск по устройствам, типам устройств и локациям",
+)
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="Строка поиска"),
+    mode: SearchMode = Query(
+        SearchMode.trigram,
+        description="trigram — нечёткий поиск по вхождению, prefix — автодополнение",
+    ),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor предыдущей страницы"),
+    current_user=Depends(get_current_user),
+) -> SSearchPage:
+    items, next_cursor = await SearchDAO.search(
+        q,
+        mode=mode,
+        limit=limit,
+        cursor=cursor,
+        user_id=current_user.id,
+        is_admin=current_user.role == "admin",
+    )
+    return SSearchPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchMode(str, Enum):
+    """trigram — нечёткий поиск по вхождению, prefix — автодополнение по началу строки."""
+
+    trigram = "trigram"
+    prefix = "prefix"
+
+
+class SSearchHit(BaseModel):
+    kind: Literal["device", "device_type", "location"]
+    id: int
+    title: str
+    # сходство с запросом (0..1); в режиме prefix не считается
+    score: Optional[float] = None
+
+
+class SSearchPage(BaseModel):
+    items: List[SSearchHit]
+    next_cursor: Optional[str] = None
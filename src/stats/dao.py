@@ -1,7 +1,11 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional, Type
 from sqlalchemy import (
     select,
+    insert,
+    delete,
+    literal,
     func,
     case,
     and_,
@@ -13,11 +17,16 @@ from sqlalchemy import (
     Interval,
     DateTime,
     Float,
+    Numeric,
+    join,
 )
 from sqlalchemy.sql import expression
 from sqlalchemy.orm import joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import async_session_maker
+from src.database import async_session_maker, read_session_maker, exported_snapshot, session_scope
+from src.dao.base import BaseDAO
+from src.dao.singleflight import singleflight
 from src.devices.models import Device
 from src.device_types.models import DeviceType
 from src.maintenance_tasks.models import MaintenanceTask
@@ -25,6 +34,10 @@ from src.failure_records.models import FailureRecord
 from src.replacement_suggestions.models import ReplacementSuggestion
 from src.write_off_reports.models import WriteOffReport
 from src.part_types.models import PartType
+from src.locations.models import Location
+from src.stats.models import DeviceStatusSnapshot
+from src.locations.utils import location_roots_cte
+from src.stats.timeseries import Granularity, dense_series, resolve_range, truncate
 from src.devices.dao import DeviceDAO
 from src.maintenance_tasks.dao import MaintenanceTaskDAO
 from src.failure_records.dao import FailureRecordDAO
@@ -36,81 +49,123 @@ class StatsDAO:
     @classmethod
     async def get_device_lifecycle(
         cls,
+        granularity: Granularity = Granularity.month,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
         months: int = 12,
-    ) -> List[Dict[str, Any]]:
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, Any]:
         """
         Получает данные для диаграммы жизненного цикла устройств:
         - Количество устройств в разных состояниях по типам
         - Динамика изменения состояний во времени
+
+        Читает ежедневные срезы device_status_snapshots: для каждого интервала
+        берётся последний срез внутри интервала.
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=months * 30)
+        date_from, date_to = resolve_range(granularity, date_from, date_to, months)
+        snapshot = DeviceStatusSnapshot
 
-        async with async_session_maker() as session:
-            # Получаем все устройства с их типами и статусами
+        async with session_scope(session) as session:
+            last_in_bucket = (
+                select(func.max(snapshot.snapshot_date))
+                .where(snapshot.snapshot_date.between(date_from, date_to))
+                .group_by(truncate(granularity, snapshot.snapshot_date))
+            )
+            total = func.sum(snapshot.total)
+            maintenance = func.sum(snapshot.in_maintenance)
+            failed = func.sum(snapshot.with_open_failures)
+            return await dense_series(
+                session,
+                granularity=granularity,
+                date_from=date_from,
+                date_to=date_to,
+                timestamp=snapshot.snapshot_date,
+                group_by={
+                    "device_type": func.concat_ws(
+                        " ", DeviceType.manufacturer, DeviceType.model
+                    ),
+                    "status": snapshot.status,
+                },
+                values={
+                    "total": cast(total, Integer),
+                    "working": cast(func.greatest(total - maintenance - failed, 0), Integer),
+                    "maintenance": cast(maintenance, Integer),
+                    "failed": cast(failed, Integer),
+                },
+                # ноль — только в интервалах со срезом: до первого среза данных нет
+                fill={"total": 0, "working": 0, "maintenance": 0, "failed": 0},
+                fill_observed_only=True,
+                select_from=join(
+                    snapshot, DeviceType, DeviceType.id == snapshot.device_type_id
+                ),
+                where=[snapshot.snapshot_date.in_(last_in_bucket)],
+            )
+
+    @classmethod
+    async def get_device_status_history(
+        cls,
+        date_from: date,
+        date_to: date,
+        device_type_id: Optional[int] = None,
+        location_root_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Возвращает ежедневные срезы состояния парка за произвольный период
+        с необязательными фильтрами по типу устройства и корневой локации.
+        """
+        snapshot = DeviceStatusSnapshot
+        async with read_session_maker() as session:
             query = (
                 select(
+                    snapshot.snapshot_date,
+                    snapshot.device_type_id,
                     DeviceType.manufacturer,
                     DeviceType.model,
-                    Device.status,
-                    func.date_part("year", Device.purchase_date).label("year"),
-                    func.date_part("month", Device.purchase_date).label("month"),
-                    func.count(Device.id).label("count"),
-                    func.count(MaintenanceTask.id).label("in_maintenance"),
-                    func.count(FailureRecord.id).label("has_failures"),
-                )
-                .select_from(Device)
-                .join(DeviceType)
-                .outerjoin(
-                    MaintenanceTask,
-                    and_(
-                        MaintenanceTask.device_id == Device.id,
-                        MaintenanceTask.status == "in_progress",
-                    ),
-                )
-                .outerjoin(
-                    FailureRecord,
-                    and_(
-                        FailureRecord.device_id == Device.id,
-                        FailureRecord.resolved_date.is_(None),
-                    ),
-                )
-                .where(Device.purchase_date.between(start_date, end_date))
-                .group_by(
-                    DeviceType.manufacturer,
-                    DeviceType.model,
-                    Device.status,
-                    "year",
-                    "month",
+                    snapshot.location_root_id,
+                    Location.name.label("location_name"),
+                    snapshot.status,
+                    snapshot.total,
+                    snapshot.in_maintenance,
+                    snapshot.with_open_failures,
                 )
+                .join(DeviceType, DeviceType.id == snapshot.device_type_id)
+                .outerjoin(Location, Location.id == snapshot.location_root_id)
+                .where(snapshot.snapshot_date.between(date_from, date_to))
+                .order_by(snapshot.snapshot_date, snapshot.device_type_id)
             )
+            if device_type_id is not None:
+                query = query.where(snapshot.device_type_id == device_type_id)
+            if location_root_id is not None:
+                query = query.where(snapshot.location_root_id == location_root_id)
 
             result = await session.execute(query)
-            data = result.fetchall()
-
             return [
                 {
+                    "date": row.snapshot_date.isoformat(),
+                    "device_type_id": row.device_type_id,
                     "device_type": f"{row.manufacturer} {row.model}",
+                    "location_root_id": row.location_root_id,
+                    "location": row.location_name,
                     "status": row.status,
-                    "date": f"{int(row.year)}-{int(row.month):02d}",
-                    "total": row.count,
-                    "states": {
-                        "working": row.count - row.in_maintenance - row.has_failures,
-                        "maintenance": row.in_maintenance,
-                        "failed": row.has_failures,
-                    },
+                    "total": row.total,
+                    "in_maintenance": row.in_maintenance,
+                    "with_open_failures": row.with_open_failures,
                 }
-                for row in data
+                for row in result.fetchall()
             ]
 
     @classmethod
-    async def get_reliability_map(cls) -> List[Dict[str, Any]]:
+    @singleflight()
+    async def get_reliability_map(
+        cls, session: Optional[AsyncSession] = None
+    ) -> List[Dict[str, Any]]:
         """
         Получает данные для тепловой карты надежности оборудования:
         - Показатели надежности по производителям и моделям
         - Статистика отказов
         """
-        async with async_session_maker() as session:
+        async with session_scope(session) as session:
             # Подзапрос для подсчета всех устройств
             devices_count = (
                 select(Device.type_id, func.count(Device.id).label("total_devices"))
@@ -176,86 +231,78 @@ class StatsDAO:
             ]
 
     @classmethod
-    async def get_maintenance_efficiency(cls, months: int = 12) -> List[Dict[str, Any]]:
+    async def get_maintenance_efficiency(
+        cls,
+        granularity: Granularity = Granularity.month,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        months: int = 12,
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, Any]:
         """
         Получает данные для диаграммы эффективности обслуживания:
         - Плановые и внеплановые обслуживания
         - Время простоя
         - Своевременность выполнения
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=months * 30)
+        date_from, date_to = resolve_range(granularity, date_from, date_to, months)
+        task = MaintenanceTask
 
-        async with async_session_maker() as session:
-            query = (
-                select(
-                    func.date_part("year", MaintenanceTask.scheduled_date).label(
-                        "year"
-                    ),
-                    func.date_part("month", MaintenanceTask.scheduled_date).label(
-                        "month"
-                    ),
-                    MaintenanceTask.task_type,
-                    func.count(MaintenanceTask.id).label("tasks_count"),
-                    func.coalesce(
-                        func.avg(
-                            func.extract(
-                                "epoch",
-                                cast(MaintenanceTask.completed_date, DateTime)
-                                - cast(MaintenanceTask.scheduled_date, DateTime),
-                            )
-                            / 86400.0  # в днях
-                        ),
-                        0.0,
-                    ).label("avg_completion_time"),
-                    func.coalesce(
-                        func.sum(
-                            case(
-                                (
-                                    MaintenanceTask.completed_date
-                                    <= MaintenanceTask.scheduled_date,
-                                    1,
+        async with session_scope(session) as session:
+            tasks_count = func.count(task.id)
+            on_time_count = func.count(task.id).filter(
+                task.completed_date <= task.scheduled_date
+            )
+            return await dense_series(
+                session,
+                granularity=granularity,
+                date_from=date_from,
+                date_to=date_to,
+                timestamp=task.scheduled_date,
+                group_by={"task_type": task.task_type},
+                values={
+                    "total_tasks": tasks_count,
+                    # разность дат в PostgreSQL — целое число дней
+                    "avg_completion_days": cast(
+                        func.round(
+                            cast(
+                                func.coalesce(
+                                    func.avg(task.completed_date - task.scheduled_date),
+                                    0,
                                 ),
-                                else_=0,
-                            )
+                                Numeric,
+                            ),
+                            1,
                         ),
-                        0,
-                    ).label("on_time_count"),
-                )
-                .where(MaintenanceTask.scheduled_date.between(start_date, end_date))
-                .group_by("year", "month", MaintenanceTask.task_type)
-                .order_by("year", "month")
-            )
-
-            result = await session.execute(query)
-            data = result.fetchall()
-
-            return [
-                {
-                    "date": f"{int(row.year)}-{int(row.month):02d}",
-                    "task_type": row.task_type,
-                    "total_tasks": row.tasks_count,
-                    "avg_completion_days": round(float(row.avg_completion_time), 1),
-                    "on_time_percentage": round(
-                        (
-                            (row.on_time_count / row.tasks_count) * 100
-                            if row.tasks_count > 0
-                            else 0
+                        Float,
+                    ),
+                    "on_time_percentage": cast(
+                        func.round(
+                            cast(100.0 * on_time_count / func.nullif(tasks_count, 0), Numeric),
+                            1,
                         ),
-                        1,
+                        Float,
                     ),
-                }
-                for row in data
-            ]
+                },
+                fill={"total_tasks": 0},
+                select_from=task,
+            )
 
     @classmethod
-    async def get_failure_analysis(cls) -> Dict[str, List[Dict[str, Any]]]:
+    @singleflight()
+    async def get_failure_analysis(
+        cls,
+        session: Optional[AsyncSession] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Получает данные для диаграммы анализа отказов:
         - Иерархия: тип устройства -> тип компонента -> причина отказа
         - Статистика по времени устранения
+        date_from/date_to ограничивают отказы по failure_date (включительно).
         """
-        async with async_session_maker() as session:
+        async with session_scope(session) as session:
             query = (
                 select(
                     DeviceType.manufacturer,
@@ -286,6 +333,10 @@ class StatsDAO:
                     FailureRecord.description,
                 )
             )
+            if date_from is not None:
+                query = query.where(FailureRecord.failure_date >= date_from)
+            if date_to is not None:
+                query = query.where(FailureRecord.failure_date <= date_to)
 
             result = await session.execute(query)
             data = result.fetchall()
@@ -342,3 +393,141 @@ class StatsDAO:
 
             # Возвращаем словарь с узлами для Sunburst диаграммы
             return {"nodes": failure_data}
+
+    @classmethod
+    async def get_device_status_counts(cls) -> Dict[str, int]:
+        """
+        Количество устройств по статусам (для живых обновлений дашборда).
+        """
+        async with read_session_maker() as session:
+            result = await session.execute(
+                select(Device.status, func.count(Device.id)).group_by(Device.status)
+            )
+            return {status: count for status, count in result.all()}
+
+    @classmethod
+    async def get_summary(cls, session: Optional[AsyncSession] = None) -> Dict[str, int]:
+        """
+        Краткая статистика: количество устройств, неполадок и списаний.
+        """
+        async with session_scope(session) as session:
+            result = await session.execute(
+                select(
+                    select(func.count(Device.id)).scalar_subquery().label("devices"),
+                    select(func.count(FailureRecord.id)).scalar_subquery().label("failures"),
+                    select(func.count(WriteOffReport.id)).scalar_subquery().label("writeoffs"),
+                )
+            )
+            row = result.one()
+            return {
+                "total_devices": row.devices,
+                "total_failures": row.failures,
+                "total_writeoffs": row.writeoffs,
+            }
+
+    @classmethod
+    async def get_dashboard(
+        cls,
+        parts: List[str],
+        granularity: Granularity = Granularity.month,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        months: int = 12,
+    ) -> Dict[str, Any]:
+        """
+        Собирает разделы дашборда параллельно на отдельных соединениях.
+        Все соединения читают один экспортированный снимок REPEATABLE READ,
+        поэтому цифры разных разделов согласованы между собой.
+        """
+        # Период проверяется заранее, до захвата соединений под снимок
+        date_from, date_to = resolve_range(granularity, date_from, date_to, months)
+        series_params = dict(
+            granularity=granularity, date_from=date_from, date_to=date_to, months=months
+        )
+        loaders = {
+            "lifecycle": lambda session: cls.get_device_lifecycle(
+                **series_params, session=session
+            ),
+            "reliability": lambda session: cls.get_reliability_map(session=session),
+            "maintenance": lambda session: cls.get_maintenance_efficiency(
+                **series_params, session=session
+            ),
+            "failures": lambda session: cls.get_failure_analysis(session=session),
+            "summary": lambda session: cls.get_summary(session=session),
+        }
+
+        async with exported_snapshot() as open_session:
+
+            async def load(part: str) -> Any:
+                async with open_session() as session:
+                    return await loaders[part](session)
+
+            results = await asyncio.gather(*(load(part) for part in parts))
+        return dict(zip(parts, results))
+
+
+class DeviceStatusSnapshotDAO(BaseDAO):
+    model: Type[DeviceStatusSnapshot] = DeviceStatusSnapshot
+
+    @classmethod
+    async def create_for_date(cls, snapshot_date: date) -> int:
+        """
+        Записывает срез состояния парка на дату.
+        Повторный запуск за ту же дату перезаписывает срез.
+        Возвращает количество записанных строк.
+        """
+        roots = location_roots_cte()
+        in_maintenance = (
+            select(MaintenanceTask.id)
+            .where(
+                MaintenanceTask.device_id == Device.id,
+                MaintenanceTask.status == "in_progress",
+            )
+            .exists()
+        )
+        open_failures = (
+            select(FailureRecord.id)
+            .where(
+                FailureRecord.device_id == Device.id,
+                FailureRecord.resolved_date.is_(None),
+            )
+            .exists()
+        )
+        counts = (
+            select(
+                literal(snapshot_date, Date),
+                Device.type_id,
+                roots.c.root_id,
+                Device.status,
+                func.count(Device.id),
+                func.count(Device.id).filter(in_maintenance),
+                func.count(Device.id).filter(open_failures),
+            )
+            .outerjoin(roots, roots.c.id == Device.current_location_id)
+            .group_by(Device.type_id, roots.c.root_id, Device.status)
+        )
+
+        async with async_session_maker() as session:
+            # Сериализуем запись среза между воркерами, запускающими одно задание
+            await session.execute(
+                select(func.pg_advisory_xact_lock(func.hashtext(cls.model.__tablename__)))
+            )
+            await session.execute(
+                delete(cls.model).where(cls.model.snapshot_date == snapshot_date)
+            )
+            result = await session.execute(
+                insert(cls.model).from_select(
+                    [
+                        "snapshot_date",
+                        "device_type_id",
+                        "location_root_id",
+                        "status",
+                        "total",
+                        "in_maintenance",
+                        "with_open_failures",
+                    ],
+                    counts,
+                )
+            )
+            await session.commit()
+            return result.rowcount
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Optional
+
+import orjson
+from fastapi import Request
+
+from src.database import Workload, use_workload
+from src.pubsub.broadcaster import Broadcaster
+from src.pubsub.listener import PgListener
+from src.stats.dao import StatsDAO
+
+logger = logging.getLogger(__name__)
+
+# Канал, в который пишут триггеры миграции d5f3b8a0c972
+DASHBOARD_CHANNEL = "dashboard_events"
+HEARTBEAT_SECONDS = 15.0
+
+dashboard_broadcaster = Broadcaster("dashboard")
+
+
+def sse_frame(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+class _DeviceStatusDebouncer:
+    """
+    Пересчёт счётчиков статусов устройств не чаще раза в delay секунд.
+
+    Триггер на devices шлёт только факт изменения; пачка обновлений
+    превращается в один GROUP BY на воркер. Изменения, пришедшие во время
+    запроса, запускают ещё один цикл.
+    """
+
+    def __init__(self, delay: float = 1.0):
+        self.delay = delay
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+    def trigger(self) -> None:
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._dirty:
+            self._dirty = False
+            await asyncio.sleep(self.delay)
+            if not dashboard_broadcaster.has_subscribers:
+                continue
+            try:
+                with use_workload(Workload.analytics):
+                    counts = await StatsDAO.get_device_status_counts()
+            except Exception:
+                logger.exception("Failed to refresh device status counts")
+                continue
+            dashboard_broadcaster.publish(sse_frame("device_status_counts", counts))
+
+
+_device_status = _DeviceStatusDebouncer()
+
+
+def handle_dashboard_notification(payload: str) -> None:
+    if not dashboard_broadcaster.has_subscribers:
+        return
+    message = orjson.loads(payload)
+    event = message.pop("type")
+    if event == "device_status":
+        _device_status.trigger()
+    else:
+        dashboard_broadcaster.publish(sse_frame(event, message))
+
+
+def handle_listener_connect() -> None:
+    # Уведомления за время разрыва потеряны — клиентам нужно перечитать данные
+    dashboard_broadcaster.publish(sse_frame("resync", {}))
+
+
+def register_dashboard_events(listener: PgListener) -> None:
+    listener.subscribe(DASHBOARD_CHANNEL, handle_dashboard_notification)
+    listener.on_connect(handle_listener_connect)
+
+
+async def dashboard_event_stream(request: Request) -> AsyncIterator[bytes]:
+    """Поток SSE для одного клиента: события дашборда и keepalive-комментарии."""
+    async with dashboard_broadcaster.subscribe() as queue:
+        yield b"retry: 5000\n\n"
+        while not await request.is_disconnected():
+            try:
+                yield await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
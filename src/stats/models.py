@@ -0,0 +1,19 @@
+from sqlalchemy import Column, BigInteger, Date, ForeignKey, Integer, String
+from src.database import Base
+
+
+class DeviceStatusSnapshot(Base):
+    """
+    Ежедневный срез парка: количество устройств
+    по (тип устройства, корневая локация, статус) на дату.
+    """
+    __tablename__ = "device_status_snapshots"
+
+    id = Column(BigInteger, primary_key=True)
+    snapshot_date = Column(Date, nullable=False, index=True)
+    device_type_id = Column(BigInteger, ForeignKey("device_types.id"), nullable=False)
+    location_root_id = Column(BigInteger, ForeignKey("locations.id"))
+    status = Column(String(20), nullable=False)
+    total = Column(Integer, nullable=False)
+    in_maintenance = Column(Integer, nullable=False)
+    with_open_failures = Column(Integer, nullable=False)
@@ -1,13 +1,16 @@
-from datetime import datetime, timedelta, timezone
-from fastapi import APIRouter, Depends, Query
+from datetime import date, datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 import random
 from typing import Dict, List, Any, Optional
 from sqlalchemy import func, select, and_, extract, case, text
 from sqlalchemy.orm import joinedload
 import requests
 
+from src.admission import analytics_limiter
 from src.auth.dependencies import get_current_user
-from src.database import async_session_maker
+from src.data_versions.dependencies import conditional_etag
+from src.database import Workload, async_session_maker, bind_workload
 from src.devices.models import Device
 from src.device_types.models import DeviceType
 from src.maintenance_tasks.models import MaintenanceTask
@@ -15,14 +18,18 @@ from src.failure_records.models import FailureRecord
 from src.replacement_suggestions.models import ReplacementSuggestion
 from src.write_off_reports.models import WriteOffReport
 from src.stats.dao import StatsDAO
+from src.stats.live import dashboard_event_stream
+from src.stats.timeseries import Granularity
 from src.write_off_reports.dao import WriteOffReportDAO
 from src.devices.dao import DeviceDAO
 from src.failure_records.dao import FailureRecordDAO
 from src.config import settings
+from src.exceptions import BadRequestException
 
 router = APIRouter(
     prefix="/stats",
     tags=["Статистика"],
+    dependencies=[Depends(bind_workload(Workload.analytics))],
 )
 
 
@@ -77,19 +84,56 @@ async def get_datacenter_activity():
 
 @router.get(
     "/device-lifecycle",
-    response_model=List[Dict[str, Any]],
+    response_model=Dict[str, Any],
     summary="Жизненный цикл устройств по типам",
 )
 async def get_device_lifecycle(
-    months: int = Query(12, description="Количество месяцев для анализа"),
+    granularity: Granularity = Query(Granularity.month, description="Размер интервала"),
+    date_from: Optional[date] = Query(None, description="Начало периода"),
+    date_to: Optional[date] = Query(None, description="Конец периода"),
+    months: int = Query(
+        12, ge=1, description="Количество месяцев для анализа, если период не задан"
+    ),
     current_user=Depends(get_current_user),
-) -> List[Dict[str, Any]]:
+    admission: None = Depends(analytics_limiter),
+) -> Dict[str, Any]:
     """
     Возвращает данные для диаграммы жизненного цикла устройств:
     - Количество устройств в разных состояниях по типам
     - Динамика изменения состояний во времени
+
+    Ряды плотные: значения по каждой группе выровнены по общему массиву timestamps.
+    """
+    return await StatsDAO.get_device_lifecycle(
+        granularity=granularity, date_from=date_from, date_to=date_to, months=months
+    )
+
+
+@router.get(
+    "/device-status-history",
+    response_model=List[Dict[str, Any]],
+    summary="История состояния парка по ежедневным срезам",
+)
+async def get_device_status_history(
+    date_from: date = Query(..., description="Начало периода"),
+    date_to: date = Query(..., description="Конец периода"),
+    device_type_id: Optional[int] = Query(None, description="Фильтр по типу устройства"),
+    location_root_id: Optional[int] = Query(
+        None, description="Фильтр по корневой локации"
+    ),
+    current_user=Depends(get_current_user),
+    admission: None = Depends(analytics_limiter),
+) -> List[Dict[str, Any]]:
+    """
+    Возвращает ежедневные срезы количества устройств
+    по типу, корневой локации и статусу за указанный период.
     """
-    return await StatsDAO.get_device_lifecycle(months=months)
+    return await StatsDAO.get_device_status_history(
+        date_from=date_from,
+        date_to=date_to,
+        device_type_id=device_type_id,
+        location_root_id=location_root_id,
+    )
 
 
 @router.get(
@@ -99,6 +143,8 @@ async def get_device_lifecycle(
 )
 async def get_reliability_map(
     current_user=Depends(get_current_user),
+    etag: str = Depends(conditional_etag("devices", "device_types", "failure_records")),
+    admission: None = Depends(analytics_limiter),
 ) -> List[Dict[str, Any]]:
     """
     Возвращает данные для тепловой карты надежности оборудования:
@@ -110,20 +156,31 @@ async def get_reliability_map(
 
 @router.get(
     "/maintenance-efficiency",
-    response_model=List[Dict[str, Any]],
+    response_model=Dict[str, Any],
     summary="Эффективность обслуживания",
 )
 async def get_maintenance_efficiency(
-    months: int = Query(12, description="Количество месяцев для анализа"),
+    granularity: Granularity = Query(Granularity.month, description="Размер интервала"),
+    date_from: Optional[date] = Query(None, description="Начало периода"),
+    date_to: Optional[date] = Query(None, description="Конец периода"),
+    months: int = Query(
+        12, ge=1, description="Количество месяцев для анализа, если период не задан"
+    ),
     current_user=Depends(get_current_user),
-) -> List[Dict[str, Any]]:
+    etag: str = Depends(conditional_etag("maintenance_tasks")),
+    admission: None = Depends(analytics_limiter),
+) -> Dict[str, Any]:
     """
     Возвращает данные для диаграммы эффективности обслуживания:
     - Плановые и внеплановые обслуживания
     - Время простоя
     - Своевременность выполнения
+
+    Ряды плотные: значения по каждому типу работ выровнены по общему массиву timestamps.
     """
-    return await StatsDAO.get_maintenance_efficiency(months=months)
+    return await StatsDAO.get_maintenance_efficiency(
+        granularity=granularity, date_from=date_from, date_to=date_to, months=months
+    )
 
 
 @router.get(
@@ -133,6 +190,10 @@ async def get_maintenance_efficiency(
 )
 async def get_failure_analysis(
     current_user=Depends(get_current_user),
+    etag: str = Depends(
+        conditional_etag("devices", "device_types", "part_types", "failure_records")
+    ),
+    admission: None = Depends(analytics_limiter),
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Возвращает данные для диаграммы анализа отказов:
@@ -148,11 +209,69 @@ async def get_failure_analysis(
     response_description="JSON с количеством устройств, неполадок и списаний",
 )
 async def stats_summary():
-    total_devices = await DeviceDAO.count_all()
-    total_failures = await FailureRecordDAO.count_all()
-    total_writeoffs = await WriteOffReportDAO.count_all()
-    return {
-        "total_devices": total_devices,
-        "total_failures": total_failures,
-        "total_writeoffs": total_writeoffs,
-    }
+    return await StatsDAO.get_summary()
+
+
+DASHBOARD_PARTS = ("lifecycle", "reliability", "maintenance", "failures", "summary")
+
+
+@router.get(
+    "/dashboard",
+    response_model=Dict[str, Any],
+    summary="Все разделы дашборда одним запросом",
+)
+async def get_dashboard(
+    parts: Optional[str] = Query(
+        None,
+        description="Разделы через запятую: " + ", ".join(DASHBOARD_PARTS)
+        + ". По умолчанию — все",
+    ),
+    granularity: Granularity = Query(Granularity.month, description="Размер интервала"),
+    date_from: Optional[date] = Query(None, description="Начало периода"),
+    date_to: Optional[date] = Query(None, description="Конец периода"),
+    months: int = Query(
+        12, ge=1, description="Количество месяцев для анализа, если период не задан"
+    ),
+    current_user=Depends(get_current_user),
+    admission: None = Depends(analytics_limiter),
+) -> Dict[str, Any]:
+    """
+    Возвращает выбранные разделы дашборда, посчитанные параллельно
+    по одному согласованному снимку данных.
+    """
+    if parts:
+        selected = list(dict.fromkeys(p.strip() for p in parts.split(",") if p.strip()))
+    else:
+        selected = list(DASHBOARD_PARTS)
+    unknown = [p for p in selected if p not in DASHBOARD_PARTS]
+    if unknown or not selected:
+        raise BadRequestException(
+            detail=f"Unknown dashboard parts: {', '.join(unknown)}"
+            if unknown
+            else "No dashboard parts requested"
+        )
+    return await StatsDAO.get_dashboard(
+        selected,
+        granularity=granularity,
+        date_from=date_from,
+        date_to=date_to,
+        months=months,
+    )
+
+
+@router.get(
+    "/events",
+    summary="Поток изменений для дашборда (Server-Sent Events)",
+    response_class=StreamingResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def dashboard_events(request: Request):
+    """
+    События: device_status_counts, failure_created, write_off_approved
+    и resync (после переподключения слушателя — данные нужно перечитать).
+    """
+    return StreamingResponse(
+        dashboard_event_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,213 @@
+"""Построитель плотных временных рядов для статистики."""
+from datetime import date
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Date,
+    TIMESTAMP,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    select,
+    text,
+    true,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.exceptions import BadRequestException
+
+MAX_BUCKETS = 1000
+
+
+class Granularity(str, Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+    quarter = "quarter"
+
+
+_STEPS = {
+    Granularity.day: "1 day",
+    Granularity.week: "1 week",
+    Granularity.month: "1 month",
+    Granularity.quarter: "3 months",
+}
+
+_APPROX_DAYS = {
+    Granularity.day: 1,
+    Granularity.week: 7,
+    Granularity.month: 28,
+    Granularity.quarter: 90,
+}
+
+
+def months_ago(day: date, months: int) -> date:
+    """Первое число месяца, отстоящего от day на months календарных месяцев."""
+    years, month_index = divmod(day.month - 1 - months, 12)
+    return date(day.year + years, month_index + 1, 1)
+
+
+def resolve_range(
+    granularity: Granularity,
+    date_from: Optional[date],
+    date_to: Optional[date],
+    months: int,
+) -> Tuple[date, date]:
+    """
+    Определяет период ряда: явные границы либо последние months месяцев.
+    Отклоняет перевёрнутые периоды и слишком большое число интервалов.
+    """
+    date_to = date_to or date.today()
+    date_from = date_from or months_ago(date_to, months)
+    if date_from > date_to:
+        raise BadRequestException(detail="date_from must not be later than date_to")
+    if (date_to - date_from).days // _APPROX_DAYS[granularity] > MAX_BUCKETS:
+        raise BadRequestException(
+            detail=f"Too many {granularity.value} buckets, narrow the date range"
+        )
+    return date_from, date_to
+
+
+def truncate(granularity: Granularity, column: ColumnElement) -> ColumnElement:
+    # Гранулярность берётся только из Granularity, поэтому её можно
+    # подставить литералом: так выражение совпадает в SELECT и GROUP BY
+    return func.date_trunc(
+        literal_column(f"'{granularity.value}'"), cast(cast(column, Date), TIMESTAMP)
+    )
+
+
+async def dense_series(
+    session: AsyncSession,
+    *,
+    granularity: Granularity,
+    date_from: date,
+    date_to: date,
+    timestamp: ColumnElement,
+    group_by: Dict[str, ColumnElement],
+    values: Dict[str, ColumnElement],
+    select_from: Any,
+    where: Sequence[ColumnElement] = (),
+    fill: Optional[Dict[str, Any]] = None,
+    fill_observed_only: bool = False,
+) -> Dict[str, Any]:
+    """
+    Агрегирует values по интервалам granularity внутри [date_from, date_to]
+    и группам group_by. Пропущенные интервалы дополняются в SQL через
+    generate_series: значением из fill либо null.
+
+    fill_observed_only — fill только для интервалов, где есть данные хотя бы
+    одной группы; интервалы вовсе без данных остаются null («нет данных»,
+    а не «ноль»). Нужно для рядов по срезам, которые пишутся не всегда.
+
+    Возвращает колоночный формат:
+    {"granularity", "timestamps": [...], "series": [{<group>: ..., <value>: [...]}]}
+    """
+    fill = fill or {}
+    bucket = truncate(granularity, timestamp)
+
+    aggregated = (
+        select(
+            bucket.label("bucket"),
+            *(column.label(name) for name, column in group_by.items()),
+            *(column.label(name) for name, column in values.items()),
+        )
+        .select_from(select_from)
+        .where(cast(timestamp, Date).between(date_from, date_to), *where)
+        .group_by(bucket, *group_by.values())
+        .cte("aggregated")
+    )
+    groups = (
+        select(
+            *(aggregated.c[name] for name in group_by),
+            literal(1).label("present"),
+        )
+        .distinct()
+        .subquery("groups")
+    )
+    buckets = (
+        select(
+            func.generate_series(
+                truncate(granularity, literal(date_from, Date)),
+                truncate(granularity, literal(date_to, Date)),
+                text(f"interval '{_STEPS[granularity]}'"),
+            ).label("bucket")
+        )
+        .subquery("buckets")
+    )
+
+    observed = (
+        select(aggregated.c.bucket.label("bucket")).distinct().subquery("observed")
+    )
+
+    def filled(name: str) -> ColumnElement:
+        if name not in fill:
+            return aggregated.c[name]
+        if fill_observed_only:
+            return func.coalesce(
+                aggregated.c[name],
+                case((observed.c.bucket.is_not(None), fill[name])),
+            )
+        return func.coalesce(aggregated.c[name], fill[name])
+
+    joined = buckets.outerjoin(groups, true()).outerjoin(
+        aggregated,
+        and_(
+            aggregated.c.bucket == buckets.c.bucket,
+            *(
+                aggregated.c[name].is_not_distinct_from(groups.c[name])
+                for name in group_by
+            ),
+        ),
+    )
+    if fill_observed_only:
+        joined = joined.outerjoin(observed, observed.c.bucket == buckets.c.bucket)
+    query = (
+        select(
+            cast(buckets.c.bucket, Date).label("bucket"),
+            groups.c.present,
+            *(groups.c[name] for name in group_by),
+            *(filled(name).label(name) for name in values),
+        )
+        .select_from(joined)
+        .order_by(*(groups.c[name] for name in group_by), buckets.c.bucket)
+    )
+
+    result = await session.execute(query)
+    rows = result.mappings().all()
+
+    def group_key(row) -> Tuple[Any, ...]:
+        return tuple(row[name] for name in group_by)
+
+    # Каждая группа содержит все интервалы, поэтому метки времени берём из первой
+    timestamps: List[date] = []
+    if rows:
+        first_key = group_key(rows[0])
+        timestamps = [row["bucket"] for row in rows if group_key(row) == first_key]
+
+    series: List[Dict[str, Any]] = []
+    current_key = None
+    for row in rows:
+        if row["present"] is None:
+            # Данных за период нет: строки содержат только интервалы
+            break
+        if not series or group_key(row) != current_key:
+            current_key = group_key(row)
+            series.append(
+                {
+                    **dict(zip(group_by, current_key)),
+                    **{name: [] for name in values},
+                }
+            )
+        for name in values:
+            series[-1][name].append(row[name])
+
+    return {
+        "granularity": granularity.value,
+        "timestamps": timestamps,
+        "series": series,
+    }
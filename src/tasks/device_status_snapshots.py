@@ -0,0 +1,9 @@
+from datetime import date
+
+from src.database import Workload, use_workload
+from src.stats.dao import DeviceStatusSnapshotDAO
+
+
+async def write_device_status_snapshot():
+    with use_workload(Workload.background):
+        await DeviceStatusSnapshotDAO.create_for_date(date.today())
@@ -0,0 +1,22 @@
+import logging
+from datetime import timedelta
+
+from src.config import settings
+from src.database import Workload, use_workload
+from src.reports.dao import ReportJobDAO
+from src.reports.worker import report_path
+
+logger = logging.getLogger(__name__)
+
+
+async def evict_report_files():
+    with use_workload(Workload.background):
+        jobs = await ReportJobDAO.find_evictable(
+            max_age=timedelta(hours=settings.report_max_age_hours),
+            max_total_bytes=settings.report_max_total_mb * 1024 * 1024,
+        )
+        for job in jobs:
+            report_path(job).unlink(missing_ok=True)
+        await ReportJobDAO.mark_expired([job.id for job in jobs])
+        if jobs:
+            logger.info("Evicted %d report files", len(jobs))
@@ -0,0 +1,40 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from src.tasks.warranty_suggestions import generate_expired_warranty_suggestions
+from src.tasks.device_status_snapshots import write_device_status_snapshot
+from src.tasks.report_eviction import evict_report_files
+
+SCHEDULER_TIMEZONE = ZoneInfo("Europe/Moscow")
+
+
+def start_scheduler() -> AsyncIOScheduler:
+    scheduler = AsyncIOScheduler(timezone=SCHEDULER_TIMEZONE)
+    scheduler.add_job(
+        generate_expired_warranty_suggestions,
+        trigger=CronTrigger(hour=0, minute=10, timezone=SCHEDULER_TIMEZONE),
+        id="expired_warranty_job",
+        replace_existing=True
+    )
+    # Срез за сегодня пишется и при старте, чтобы история не начиналась с пустоты.
+    # Время старта — с часовым поясом планировщика: наивное он читает как
+    # московское, и на хосте в UTC запуск оказывается в прошлом (misfire)
+    scheduler.add_job(
+        write_device_status_snapshot,
+        trigger=CronTrigger(hour=23, minute=50, timezone=SCHEDULER_TIMEZONE),
+        id="device_status_snapshot_job",
+        next_run_time=datetime.now(SCHEDULER_TIMEZONE),
+        replace_existing=True
+    )
+    scheduler.add_job(
+        evict_report_files,
+        trigger=IntervalTrigger(minutes=30),
+        id="report_eviction_job",
+        replace_existing=True
+    )
+    scheduler.start()
+    return scheduler
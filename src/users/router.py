@@ -3,9 +3,11 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
+from src.admission import limit_large_pages
 from src.auth.dependencies import get_current_user
 from src.auth.schemas import SUserRead
 from src.users.dao import UserDAO
+from src.schemas.many import IDS_DESCRIPTION, SManyRead, orm_many_response, parse_ids
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -16,11 +18,16 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[SUserRead], summary="Список всех пользователей")
+@router.get(
+    "/",
+    response_model=List[SUserRead],
+    summary="Список всех пользователей",
+)
 async def list_users(
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     current_user=Depends(get_current_user),
+    admission: None = Depends(limit_large_pages),
 ):
     """
     Получить список всех пользователей системы.
@@ -42,6 +49,29 @@ async def list_users(
         raise HTTPException(500, f"Unexpected error: {str(e)}")
 
 
+@router.get(
+    "/many",
+    response_model=SManyRead[SUserRead],
+    summary="Несколько пользователей по ID",
+)
+async def get_users_many(
+    ids: str = Query(..., description=IDS_DESCRIPTION),
+    current_user=Depends(get_current_user),
+):
+    """
+    Получить данные нескольких пользователей одним запросом.
+    Обычный пользователь может запросить только себя.
+    """
+    requested = parse_ids(ids)
+    if current_user.role not in ["admin", "main_admin"] and requested != [current_user.id]:
+        raise HTTPException(
+            status_code=403,
+            detail="You can only view your own profile or you need admin privileges",
+        )
+    users = await UserDAO.find_many(requested)
+    return orm_many_response(SUserRead, users, requested)
+
+
 @router.get(
     "/{user_id}", response_model=SUserRead, summary="Получить пользователя по ID"
 )
@@ -3,7 +3,7 @@ from datetime import date
 from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
 from src.dao.base import BaseDAO
-from src.database import async_session_maker
+from src.database import read_session_maker
 from src.write_off_reports.models import WriteOffReport
 
 
@@ -19,7 +19,7 @@ class WriteOffReportDAO(BaseDAO):
         disposed_by: int | None = None,
         approved_by: int | None = None
     ) -> List[WriteOffReport]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             query = select(cls.model).options(
                 selectinload(cls.model.device),
                 selectinload(cls.model.disposed_by_user),
@@ -42,7 +42,7 @@ class WriteOffReportDAO(BaseDAO):
 
     @classmethod
     async def find_by_id(cls, id_: Any) -> Optional[WriteOffReport]:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             result = await session.execute(
                 select(cls.model)
                 .where(cls.model.id == id_)
@@ -56,6 +56,6 @@ class WriteOffReportDAO(BaseDAO):
 
     @classmethod
     async def count_all(cls) -> int:
-        async with async_session_maker() as session:
+        async with read_session_maker() as session:
             result = await session.execute(select(func.count(cls.model.id)))
             return result.scalar()
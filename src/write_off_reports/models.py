@@ -11,7 +11,7 @@ class WriteOffReport(Base):
     __tablename__ = 'write_off_reports'
 
     id = Column(BigInteger, primary_key=True)
-    device_id = Column(BigInteger, ForeignKey('devices.id'), nullable=False)
+    device_id = Column(BigInteger, ForeignKey('devices.id'), nullable=False, index=True)
     report_date = Column(Date, nullable=False)
     reason = Column(Text, nullable=False)
     disposed_by = Column(BigInteger, ForeignKey('users.id'))
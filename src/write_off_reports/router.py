@@ -15,6 +15,7 @@ from src.write_off_reports.schemas import (
 )
 from src.devices.dao import DeviceDAO
 from src.users.dao import UserDAO
+from src.schemas.responses import orm_list_response
 
 router = APIRouter(
     prefix="/write-off-reports",
@@ -45,7 +46,7 @@ async def list_reports(
         disposed_by=disposed_by,
         approved_by=approved_by,
     )
-    return [SWriteOffReportRead.model_validate(i) for i in items]
+    return orm_list_response(SWriteOffReportRead, items)
 
 
 @router.get(